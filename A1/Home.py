@@ -7,15 +7,11 @@ for investment screening, supply chain risk assessment, and CBAM compliance stra
 """
 
 import streamlit as st
+import pandas as pd
 from pathlib import Path
 from utils.splash import show_splash_overlay, clear_splash
 from utils import (
-    load_gdp_data,
-    load_co2_data,
-    load_netzero_data,
-    merge_gdp_co2,
-    create_gdp_categories,
-    create_commitment_strength,
+    load_analysis_bundle,
     get_custom_css,
     render_sidebar_resources,
 )
@@ -24,44 +20,17 @@ from utils.styling import (
     render_sticky_footer,
 )
 
+# Share the bundle frames copy-on-write (see app.py)
+pd.set_option("mode.copy_on_write", True)
+
 # ===== PATHS AND CSS =====
 assets_dir = Path(__file__).parent / "assets"
 logo_path = assets_dir / "CarbonSeer_png.png"
 lockup_path = assets_dir / "Carbonseer.png"
 
-# Global UI toggles (persist in session)
-if "fast_mode" not in st.session_state:
-    st.session_state.fast_mode = True  # default to fast interactions
-
-# Sidebar toggle
-with st.sidebar:
-    st.markdown("### ⚙️ Preferences")
-    st.toggle(
-        "⚡ Fast Mode",
-        value=st.session_state.fast_mode,
-        key="fast_toggle_home",
-        help="Use sampling and defer heavy visuals for instant feedback.",
-        on_change=lambda: setattr(
-            st.session_state, "fast_mode", st.session_state.fast_toggle_home
-        ),
-    )
-
 st.markdown(get_custom_css("light"), unsafe_allow_html=True)
 
 
-# ===== DATA LOADING FUNCTION =====
-@st.cache_data
-def load_all_data(source: str = "auto"):
-    """Load and prepare all datasets with caching for optimal performance."""
-    gdp_df = load_gdp_data(source)
-    co2_df = load_co2_data(source)
-    netzero_df = load_netzero_data(source)
-    merged_df = merge_gdp_co2(gdp_df, co2_df)
-    merged_df = create_gdp_categories(merged_df)
-    netzero_df = create_commitment_strength(netzero_df)
-    return gdp_df, co2_df, netzero_df, merged_df
-
-
 # ===== SPLASH SCREEN & DATA LOADING LOGIC =====
 if "data_loaded" not in st.session_state:
     st.session_state.data_loaded = False
@@ -86,7 +55,18 @@ source_map = {
 data_source = source_map[data_source_label]
 st.session_state.data_source = data_source  # Persist for other pages
 
-gdp_df, co2_df, netzero_df, merged_df = load_all_data(data_source)
+# One shared bundle per process (see utils.bundle) - no per-page pipeline runs
+bundle = load_analysis_bundle(data_source)
+netzero_df = bundle.commitment
+merged_df = bundle.categorized
+
+# Sources load in parallel, so the splash lasts as long as the slowest one
+timing_labels = {"gdp": "GDP", "co2": "CO₂", "netzero": "Net-zero"}
+timing_text = " · ".join(
+    f"{timing_labels.get(step, step.title())} {seconds:.2f}s"
+    for step, seconds in bundle.load_timings.items()
+)
+st.sidebar.caption(f"⏱️ Data load: {timing_text}")
 
 # Once data is loaded, mark as complete and trigger splash removal
 if not st.session_state.data_loaded:
@@ -299,12 +279,12 @@ with col3:
     <div style='margin: 1.5rem 0; font-size: 3rem; text-align: center;'>✨</div>
     <p style='color: #4A4A4A; line-height: 1.7; font-size: 0.95rem;'>
         Real-time data explorer with <strong>custom filtering</strong>, dynamic visualization builder, and CSV export 
-        for client presentations. Fast Mode enables <strong>instant analysis</strong> for time-sensitive decisions—no more 
+        for client presentations. Exact full-data statistics deliver <strong>instant analysis</strong> for time-sensitive decisions—no more 
         waiting for quarterly reports. See patterns, export insights, brief stakeholders—<strong>all in minutes</strong>.
     </p>
     <div style='margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(0,0,0,0.05);'>
         <span style='font-weight: 600; color: #8B7D9B; font-size: 0.85rem;'>
-            🚀 Fast Mode • Export-Ready • Client-Friendly
+            🚀 Instant • Export-Ready • Client-Friendly
         </span>
     </div>
 </div>
@@ -470,8 +450,9 @@ st.html(f"""
 """)
 
 # Get latest data
-latest_year = merged_df["Year"].max()
-latest_data = merged_df[merged_df["Year"] == latest_year]
+panel = bundle.panels["categorized"]
+latest_year = int(panel.years[-1])
+latest_data = panel.year(latest_year)
 
 # Use actual column names from CSV files
 gdp_col = "GDP per capita (constant 2015 US$)"
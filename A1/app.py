@@ -3,8 +3,15 @@ CarbonSeer - Carbon Risk Analytics Platform
 Entry point for the Streamlit multi-page application
 """
 
+import pandas as pd
 import streamlit as st
 
+# Copy-on-write: column selections and slices of the shared bundle frames are
+# lazy views that only copy when written to, so pages can filter the shared
+# datasets without duplicating them per session (the default from pandas 3.0).
+# Home.py and the pages set it too, for when they are run on their own.
+pd.set_option("mode.copy_on_write", True)
+
 st.set_page_config(
     page_title="CarbonSeer | Carbon Risk Analytics",
     page_icon="🌍",
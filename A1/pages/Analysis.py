@@ -7,23 +7,22 @@ Fast, rigorous, export-ready.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
 
 from utils import (
-    load_gdp_data,
-    load_co2_data,
-    load_netzero_data,
-    merge_gdp_co2,
-    create_gdp_categories,
-    create_commitment_strength,
+    load_analysis_bundle,
     get_custom_css,
     get_plotly_theme,
     render_sidebar_resources,
 )
+from utils.data_loader import GDP_HIGH_THRESHOLD, GDP_LOW_THRESHOLD
 from utils.analysis import (
     compute_correlations,
+    compute_yearly_correlations,
+    ols_confidence_band,
     perform_chi_square_test,
 )
 from utils.styling import (
@@ -31,26 +30,31 @@ from utils.styling import (
     sanitize_df_for_display,
     render_page_header,
 )
+from utils.exports import EXPORT_MIME_TYPES, deferred_export
+from utils.resampling import (
+    BOOTSTRAP_RESAMPLES,
+    PERMUTATION_RESAMPLES,
+    bootstrap_ci,
+    permutation_chi_square,
+)
+from utils.sensitivity import (
+    SENSITIVITY_GRID_SIZE,
+    anova_threshold_sweep,
+    chi_square_threshold_sweep,
+    threshold_grid,
+)
+from utils.figures import cached_figure
+from utils.fingerprint import derive_token, frame_token, register_frame
+
+# Share the bundle frames copy-on-write (see app.py)
+pd.set_option("mode.copy_on_write", True)
 
 st.set_page_config(page_title="CarbonSeer - Analysis", page_icon="📊", layout="wide")
 
 # Preferences
-if "fast_mode" not in st.session_state:
-    st.session_state.fast_mode = True
 if "data_source" not in st.session_state:
     st.session_state.data_source = "auto"
 
-with st.sidebar:
-    st.markdown("### ⚙️ Preferences")
-    st.toggle(
-        "⚡ Fast Mode",
-        value=st.session_state.fast_mode,
-        key="fast_toggle_analysis",
-        on_change=lambda: setattr(
-            st.session_state, "fast_mode", st.session_state.fast_toggle_analysis
-        ),
-    )
-
 st.markdown(get_custom_css("light"), unsafe_allow_html=True)
 render_global_branding()
 
@@ -78,19 +82,12 @@ tab_overview, tab_h1, tab_h2, tab_insights, tab_quick = st.tabs(
 )
 
 
-@st.cache_data
-def load_data_fast(source: str = "auto"):
-    gdp = load_gdp_data(source)
-    co2 = load_co2_data(source)
-    nz = load_netzero_data(source)
-    merged = merge_gdp_co2(gdp, co2)
-    merged = create_gdp_categories(merged)
-    nz = create_commitment_strength(nz)
-    return gdp, co2, nz, merged
-
-
 with st.spinner("Loading data…"):
-    gdp_df, co2_df, nz_df, merged_df = load_data_fast(st.session_state.data_source)
+    bundle = load_analysis_bundle(st.session_state.data_source)
+    nz_df = bundle.commitment
+    merged_df = bundle.categorized
+    panel = bundle.panels["categorized"]
+    latest_year = int(panel.years[-1])
 
 with tab_overview:
     st.html("""
@@ -98,7 +95,7 @@ with tab_overview:
     <div class='info-box'>
         <strong>🎯 Purpose:</strong> Professional carbon risk analytics for investment screening and CBAM compliance strategy.<br><br>
         <strong>📊 Data Sources:</strong> World Bank (GDP), Global Carbon Budget (CO₂), Net Zero Tracker (Commitments)<br><br>
-        <strong>⚡ Fast Mode:</strong> Enabled for instant feedback. Toggle in sidebar for high-fidelity analysis.<br><br>
+        <strong>⚡ Exact Statistics:</strong> Correlations and tests use every observation—no sampling, still instant.<br><br>
         <strong>📁 Data Source:</strong> Configured on Home page. Switch between local files and GitHub for deployment flexibility.
     </div>
     """)
@@ -159,7 +156,19 @@ with tab_overview:
     </div>
     """)
 
-with tab_h1:
+def format_ci(ci, spec: str = ".3f") -> str:
+    """Render a bootstrap interval as '95% CI [lower, upper]' (empty if None)."""
+    if ci is None:
+        return ""
+    return (
+        f"{ci['confidence']:.0%} CI [{ci['ci_lower']:{spec}}, {ci['ci_upper']:{spec}}]"
+    )
+
+
+# The H1 year slider and everything it drives rerun as a fragment: moving the
+# slider does not re-inject the page CSS, branding, sidebar or other tabs
+@st.fragment
+def correlation_analysis():
     st.html(
         "<div class='section-header'>📊 Hypothesis 1: GDP & CO₂ Emissions Correlation</div>"
     )
@@ -173,13 +182,13 @@ with tab_h1:
 
     year = st.slider(
         "Select Year for Analysis",
-        int(merged_df["Year"].min()),
-        int(merged_df["Year"].max()),
-        int(merged_df["Year"].max()),
+        int(panel.years[0]),
+        latest_year,
+        latest_year,
         help="Choose a year to analyze the GDP-CO₂ relationship",
     )
 
-    df = merged_df[merged_df["Year"] == year].dropna()
+    df = panel.year(year).dropna()
 
     if len(df) < 10:
         st.warning("⚠️ Insufficient data for selected year. Please choose another year.")
@@ -194,11 +203,36 @@ with tab_h1:
             and "code" not in c.lower()
         ][0]
 
-        sample_limit = 2000 if st.session_state.fast_mode else 5000
-        res = compute_correlations(df, gdp_col, co2_col, sample_limit=sample_limit)
+        # All years are computed in one batched pass; the slider is a lookup
+        yearly = compute_yearly_correlations(merged_df, gdp_col, co2_col)
+        res = None
+        if year in yearly.index and yearly.loc[year, "n"] >= 3:
+            res = yearly.loc[year].to_dict()
+            res["n"] = int(res["n"])
 
         if res:
             st.markdown("### 📈 Statistical Results")
+
+            # Percentile bootstrap intervals are opt-in: four statistics at
+            # BOOTSTRAP_RESAMPLES each would otherwise run on the first visit.
+            # Once computed they are cached per (year slice, statistic, B).
+            cis = dict.fromkeys(("pearson_r", "spearman_rho", "r_squared"))
+            eta_ci = None
+            if st.checkbox(
+                "Show bootstrap confidence intervals",
+                key="h1_bootstrap_ci",
+                help=f"Percentile intervals from {BOOTSTRAP_RESAMPLES:,} resamples",
+            ):
+                year_slice = panel.year(year)
+                with st.spinner("Bootstrapping confidence intervals…"):
+                    cis = {
+                        stat: bootstrap_ci(year_slice, stat, (gdp_col, co2_col))
+                        for stat in cis
+                    }
+                    eta_ci = bootstrap_ci(
+                        year_slice, "eta_squared", (co2_col, "GDP_Category")
+                    )
+
             c1, c2, c3, c4 = st.columns(4)
 
             with c1:
@@ -223,6 +257,7 @@ with tab_h1:
                     <div class='metric-label'>PEARSON CORRELATION (r)</div>
                     <div class='metric-value'>{res["pearson_r"]:.3f}</div>
                     <div class='metric-delta' style='color: #666;'>
+                        {format_ci(cis["pearson_r"])}<br>
                         p = {res["pearson_p"]:.4f}<br>{significance}
                     </div>
                 </div>
@@ -239,6 +274,7 @@ with tab_h1:
                     <div class='metric-label'>SPEARMAN CORRELATION (ρ)</div>
                     <div class='metric-value'>{res["spearman_rho"]:.3f}</div>
                     <div class='metric-delta' style='color: #666;'>
+                        {format_ci(cis["spearman_rho"])}<br>
                         p = {res["spearman_p"]:.4f}<br>{significance_s}
                     </div>
                 </div>
@@ -250,11 +286,20 @@ with tab_h1:
                     <div class='metric-label'>R² (VARIANCE EXPLAINED)</div>
                     <div class='metric-value'>{res["r_squared"]:.1%}</div>
                     <div class='metric-delta' style='color: #666;'>
+                        {format_ci(cis["r_squared"], ".1%")}<br>
                         Effect size: {res["r_squared"]:.3f}
                     </div>
                 </div>
                 """)
 
+            if eta_ci is not None:
+                st.caption(
+                    f"η² of CO₂ per capita across GDP categories: "
+                    f"{eta_ci['estimate']:.3f} ({format_ci(eta_ci)}). "
+                    f"Intervals are percentile bootstraps from "
+                    f"{BOOTSTRAP_RESAMPLES:,} resamples."
+                )
+
             # Interpretation
             st.markdown("### 🔍 Statistical Interpretation")
             if res["pearson_p"] < 0.001:
@@ -292,28 +337,112 @@ with tab_h1:
             st.markdown("### 📊 Visualization")
 
             if st.checkbox("Show Interactive Scatter Plot with Trendline", value=True):
-                with st.spinner("Generating visualization..."):
+
+                def build_scatter():
                     fig = px.scatter(
                         df,
                         x=gdp_col,
                         y=co2_col,
                         hover_data=["Country"],
-                        trendline="ols",
                         title=f"GDP per Capita vs CO₂ Emissions per Capita ({year})",
                         labels={
                             gdp_col: "GDP per Capita (constant 2015 US$)",
                             co2_col: "CO₂ Emissions per Capita (tonnes)",
                         },
                     )
-                fig.update_layout(get_plotly_theme()["layout"])
-                fig.update_traces(
-                    marker=dict(
-                        size=8, opacity=0.6, line=dict(width=0.5, color="white")
+                    fig.update_layout(get_plotly_theme()["layout"])
+                    fig.update_traces(
+                        marker=dict(
+                            size=8, opacity=0.6, line=dict(width=0.5, color="white")
+                        )
+                    )
+
+                    # OLS trendline and 95% band from the batched per-year fit
+                    grid = np.linspace(df[gdp_col].min(), df[gdp_col].max(), 100)
+                    y_hat, lower, upper = ols_confidence_band(res, grid)
+                    fig.add_trace(
+                        go.Scatter(
+                            x=np.concatenate([grid, grid[::-1]]),
+                            y=np.concatenate([upper, lower[::-1]]),
+                            fill="toself",
+                            fillcolor="rgba(139, 125, 155, 0.15)",
+                            line=dict(width=0),
+                            hoverinfo="skip",
+                            name="95% confidence band",
+                        )
+                    )
+                    fig.add_trace(
+                        go.Scatter(
+                            x=grid,
+                            y=y_hat,
+                            mode="lines",
+                            line=dict(color="#8B7D9B", width=2),
+                            name=(
+                                f"OLS fit: y = {res['intercept']:.3g} "
+                                f"+ {res['slope']:.3g}x (R² = {res['r_squared']:.3f})"
+                            ),
+                            hoverinfo="skip",
+                        )
                     )
+                    return fig
+
+                with st.spinner("Generating visualization..."):
+                    fig = cached_figure(
+                        ("h1_scatter", year, gdp_col, co2_col),
+                        panel.token,
+                        build_scatter,
+                    )
+                st.plotly_chart(fig, width="stretch", key=f"scatter_{year}")
+
+            with st.expander("📈 Correlation Strength Over Time"):
+
+                def build_trend():
+                    trend = yearly[yearly["n"] >= 10].reset_index()
+                    fig_trend = go.Figure()
+                    fig_trend.add_trace(
+                        go.Scatter(
+                            x=trend["Year"],
+                            y=trend["pearson_r"],
+                            mode="lines",
+                            name="Pearson r",
+                        )
+                    )
+                    fig_trend.add_trace(
+                        go.Scatter(
+                            x=trend["Year"],
+                            y=trend["spearman_rho"],
+                            mode="lines",
+                            name="Spearman ρ",
+                        )
+                    )
+                    fig_trend.add_vline(x=year, line_dash="dot", line_color="#8B7D9B")
+                    fig_trend.update_layout(get_plotly_theme()["layout"])
+                    fig_trend.update_layout(
+                        title="GDP–CO₂ Correlation by Year",
+                        xaxis_title="Year",
+                        yaxis_title="Correlation coefficient",
+                        yaxis_range=[-1, 1],
+                    )
+                    return fig_trend
+
+                fig_trend = cached_figure(
+                    ("correlation_trend", year, gdp_col, co2_col),
+                    panel.token,
+                    build_trend,
                 )
-                st.plotly_chart(
-                    fig, width="stretch", key=f"scatter_{year}"
-                )  # Business implications
+                st.plotly_chart(fig_trend, width="stretch", key="correlation_trend")
+
+                # Exact, streamed over every country-year pair of the panel
+                pooled = compute_correlations(merged_df, gdp_col, co2_col)
+                if pooled:
+                    st.caption(
+                        f"Pooled over all {pooled['n']:,} country-years: "
+                        f"r = {pooled['pearson_r']:.3f}, "
+                        f"ρ = {pooled['spearman_rho']:.3f}, "
+                        f"R² = {pooled['r_squared']:.3f}."
+                    )
+
+            # Business implications
             st.markdown("### 💼 Business Implications for Carbon Consulting")
             st.html("""
             <div class='chart-container'>
@@ -329,7 +458,115 @@ with tab_h1:
         else:
             st.info("⚠️ Not enough data for correlations analysis.")
 
-with tab_h2:
+
+with tab_h1:
+    correlation_analysis()
+
+# Heatmap metric -> (sweep, result key, is a p-value)
+SENSITIVITY_METRICS = {
+    "χ² p-value (commitments)": ("chi_square", "p_value", True),
+    "Cramér's V (commitments)": ("chi_square", "cramers_v", False),
+    "ANOVA p-value (CO₂)": ("anova", "p_value", True),
+    "η² (CO₂)": ("anova", "eta_squared", False),
+}
+
+
+# Metric and grid changes rerun only the heatmap, not the H2 tests above it
+@st.fragment
+def threshold_sensitivity(x: pd.DataFrame, gdp_col: str, outcome_col: str):
+    st.markdown("### 🎚️ GDP Threshold Sensitivity")
+    st.caption(
+        "Each cell re-buckets countries at a different (Low/Medium, Medium/High) "
+        "GDP per capita cut-off pair and reruns the test. ✕ marks the current "
+        f"${GDP_LOW_THRESHOLD:,} / ${GDP_HIGH_THRESHOLD:,} thresholds."
+    )
+
+    c1, c2 = st.columns([3, 1])
+    with c1:
+        metric = st.radio("Heatmap metric:", list(SENSITIVITY_METRICS), horizontal=True)
+    with c2:
+        size = st.select_slider(
+            "Thresholds per axis", [25, 50, 100], value=SENSITIVITY_GRID_SIZE
+        )
+    sweep_name, key, is_p_value = SENSITIVITY_METRICS[metric]
+
+    latest = panel.year(latest_year)
+    grid = tuple(threshold_grid(latest[gdp_col], size))
+    if sweep_name == "chi_square":
+        sweep = chi_square_threshold_sweep(x, gdp_col, outcome_col, grid)
+    else:
+        co2_col = [
+            c
+            for c in latest.columns
+            if ("co2" in c.lower() or "emission" in c.lower())
+            and "code" not in c.lower()
+        ][0]
+        sweep = anova_threshold_sweep(latest, gdp_col, co2_col, grid)
+
+    if sweep is None or np.isnan(sweep[key]).all():
+        st.info("⚠️ Not enough variation to sweep the GDP thresholds.")
+        return
+
+    def build_heatmap():
+        fig = go.Figure(
+            go.Heatmap(
+                x=sweep["thresholds"],
+                y=sweep["thresholds"],
+                z=sweep[key],
+                zmin=0,
+                zmax=0.1 if is_p_value else None,
+                colorscale="Viridis",
+                reversescale=is_p_value,
+                colorbar={"title": metric.split(" (")[0]},
+                hovertemplate=(
+                    "Low ≤ $%{y:,.0f}<br>High > $%{x:,.0f}<br>"
+                    + metric.split(" (")[0]
+                    + " = %{z:.4f}<extra></extra>"
+                ),
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=[GDP_HIGH_THRESHOLD],
+                y=[GDP_LOW_THRESHOLD],
+                mode="markers",
+                marker={"symbol": "x", "size": 12, "color": "#E57373"},
+                name="Current thresholds",
+                hoverinfo="skip",
+            )
+        )
+        fig.update_layout(get_plotly_theme()["layout"])
+        fig.update_layout(
+            title=f"{metric} across GDP threshold pairs",
+            xaxis={"title": "Medium/High threshold (US$)", "type": "log"},
+            yaxis={"title": "Low/Medium threshold (US$)", "type": "log"},
+            showlegend=False,
+        )
+        return fig
+
+    fig = cached_figure(
+        ("threshold_sensitivity", metric, size, outcome_col),
+        frame_token(x),
+        build_heatmap,
+    )
+    st.plotly_chart(fig, width="stretch", key="threshold_sensitivity")
+
+    values = sweep[key][~np.isnan(sweep[key])]
+    if is_p_value:
+        st.caption(
+            f"p < 0.05 for {np.mean(values < 0.05):.0%} of {len(values):,} valid "
+            f"threshold pairs (n = {sweep['n']:,})."
+        )
+    else:
+        st.caption(
+            f"Ranges from {values.min():.3f} to {values.max():.3f} across "
+            f"{len(values):,} valid threshold pairs (n = {sweep['n']:,})."
+        )
+
+
+# The H2 test settings rerun only this tab's content
+@st.fragment
+def commitment_analysis():
     st.html(
         "<div class='section-header'>🎯 Hypothesis 2: GDP & Net-Zero Commitments</div>"
     )
@@ -341,20 +578,59 @@ with tab_h2:
     with Cramér's V for effect size quantification.
     """)
 
-    latest = merged_df[merged_df["Year"] == merged_df["Year"].max()]
+    latest = panel.year(latest_year)
+    gdp_col = [
+        c for c in latest.columns if "gdp" in c.lower() and "capita" in c.lower()
+    ][0]
     x = pd.merge(
-        latest[["Country", "GDP_Category"]],
+        latest[["Country", gdp_col, "GDP_Category"]],
         nz_df[["Country", "Commitment_Strength"]],
         on="Country",
         how="inner",
     ).dropna()
+    x["Legal"] = x["Commitment_Strength"] >= 4
+    # Built once per run from registered inputs: key the caches by token
+    register_frame(x, derive_token(panel.token, "commitment", frame_token(nz_df)))
 
     if len(x) > 10:
         st.markdown("### 📊 Commitment Strength Distribution")
 
-        # Create contingency table for legal commitments (strength >= 4)
-        contingency = pd.crosstab(x["GDP_Category"], x["Commitment_Strength"] >= 4)
+        c1, c2 = st.columns(2)
+        with c1:
+            outcome = st.radio(
+                "Commitment outcome:",
+                ["Legal commitment (strength ≥ 4)", "Each strength level (0–5)"],
+                horizontal=True,
+            )
+        with c2:
+            p_method = st.radio(
+                "P-value method:",
+                [
+                    "Asymptotic χ²",
+                    f"Monte Carlo permutation ({PERMUTATION_RESAMPLES:,} shuffles)",
+                ],
+                horizontal=True,
+                help="Permutation p-values stay valid when expected cell counts are small, "
+                "as with individual strength levels.",
+            )
+        outcome_col = "Legal" if outcome.startswith("Legal") else "Commitment_Strength"
+
+        contingency = pd.crosstab(x["GDP_Category"], x[outcome_col])
         chi = perform_chi_square_test(contingency)
+        permutation = p_method.startswith("Monte Carlo")
+        if permutation:
+            with st.spinner("Running permutation test…"):
+                perm = permutation_chi_square(x, "GDP_Category", outcome_col)
+            if perm is not None:
+                chi["p_value"] = perm["p_value"]
+        v_ci = None
+        if st.checkbox(
+            "Show bootstrap confidence interval for Cramér's V",
+            key="h2_bootstrap_ci",
+            help=f"Percentile interval from {BOOTSTRAP_RESAMPLES:,} resamples",
+        ):
+            with st.spinner("Bootstrapping confidence intervals…"):
+                v_ci = bootstrap_ci(x, "cramers_v", ("GDP_Category", outcome_col))
 
         c1, c2, c3 = st.columns(3)
 
@@ -377,7 +653,7 @@ with tab_h2:
             )
             st.html(f"""
             <div class='metric-card'>
-                <div class='metric-label'>P-VALUE</div>
+                <div class='metric-label'>P-VALUE{" (PERMUTATION)" if permutation else ""}</div>
                 <div class='metric-value'>{chi["p_value"]:.4f}</div>
                 <div class='metric-delta' style='color: #666;'>
                     {significance}
@@ -398,11 +674,28 @@ with tab_h2:
                 <div class='metric-label'>CRAMÉR'S V (EFFECT SIZE)</div>
                 <div class='metric-value'>{chi["cramers_v"]:.3f}</div>
                 <div class='metric-delta' style='color: #666;'>
+                    {format_ci(v_ci)}<br>
                     {effect_desc} association
                 </div>
             </div>
             """)
 
+        counts = contingency.to_numpy()
+        min_expected = (
+            np.outer(counts.sum(axis=1), counts.sum(axis=0)) / counts.sum()
+        ).min()
+        if permutation and perm is not None:
+            st.caption(
+                f"⚡ Monte Carlo p-value from {perm['permutations']:,} label shuffles "
+                f"(± {perm['p_value_se']:.2g}); smallest expected cell count "
+                f"{min_expected:.1f}."
+            )
+        elif min_expected < 5:
+            st.caption(
+                f"⚠️ Smallest expected cell count is {min_expected:.1f} (< 5): the "
+                "asymptotic p-value may be unreliable. Switch to the permutation test."
+            )
+
         # Statistical interpretation
         st.markdown("### 🔍 Statistical Interpretation")
         if chi["p_value"] < 0.05:
@@ -432,34 +725,42 @@ with tab_h2:
         st.markdown("---")
         st.markdown("### 📊 Legal Commitment Rates by GDP Category")
 
-        # Calculate commitment rates
-        rates = (
-            x.groupby("GDP_Category", observed=True)["Commitment_Strength"]
-            .apply(lambda s: (s >= 4).mean() * 100)
-            .reset_index(name="Legal_Commitment_Rate")
-        )
+        def build_commitment_bar():
+            # Calculate commitment rates
+            rates = (
+                x.groupby("GDP_Category", observed=True)["Commitment_Strength"]
+                .apply(lambda s: (s >= 4).mean() * 100)
+                .reset_index(name="Legal_Commitment_Rate")
+            )
 
-        # Sort by GDP category order
-        category_order = ["Low", "Medium", "High"]
-        rates["GDP_Category"] = pd.Categorical(
-            rates["GDP_Category"], categories=category_order, ordered=True
-        )
-        rates = rates.sort_values("GDP_Category")
-
-        fig = px.bar(
-            rates,
-            x="GDP_Category",
-            y="Legal_Commitment_Rate",
-            title="Legal Net-Zero Commitment Rates (%) by GDP Category",
-            labels={
-                "GDP_Category": "GDP Category",
-                "Legal_Commitment_Rate": "Legal Commitment Rate (%)",
-            },
-            color="Legal_Commitment_Rate",
-            color_continuous_scale="Viridis",
+            # Sort by GDP category order
+            category_order = ["Low", "Medium", "High"]
+            rates["GDP_Category"] = pd.Categorical(
+                rates["GDP_Category"], categories=category_order, ordered=True
+            )
+            rates = rates.sort_values("GDP_Category")
+
+            fig = px.bar(
+                rates,
+                x="GDP_Category",
+                y="Legal_Commitment_Rate",
+                title="Legal Net-Zero Commitment Rates (%) by GDP Category",
+                labels={
+                    "GDP_Category": "GDP Category",
+                    "Legal_Commitment_Rate": "Legal Commitment Rate (%)",
+                },
+                color="Legal_Commitment_Rate",
+                color_continuous_scale="Viridis",
+            )
+            fig.update_layout(get_plotly_theme()["layout"])
+            fig.update_layout(showlegend=False)
+            return fig
+
+        fig = cached_figure(
+            ("commitment_bar", latest_year),
+            derive_token(panel.token, "commitment", frame_token(nz_df)),
+            build_commitment_bar,
         )
-        fig.update_layout(get_plotly_theme()["layout"])
-        fig.update_layout(showlegend=False)
         st.plotly_chart(fig, width="stretch", key="commitment_bar")
 
         # Show the data table
@@ -475,6 +776,9 @@ with tab_h2:
                 sanitize_df_for_display(summary), width="stretch", hide_index=True
             )
 
+        st.markdown("---")
+        threshold_sensitivity(x, gdp_col, outcome_col)
+
         st.markdown("---")
         st.markdown("### 💼 Business Implications for CBAM Strategy")
         st.html("""
@@ -494,6 +798,10 @@ with tab_h2:
             "⚠️ Not enough overlapping data between GDP and net-zero datasets for analysis."
         )
 
+
+with tab_h2:
+    commitment_analysis()
+
 with tab_insights:
     st.html("<div class='section-header'>💡 Business Intelligence Summary</div>")
 
@@ -580,8 +888,7 @@ with tab_insights:
     st.markdown("### 🌍 Country-Level CarbonSeer Intelligence")
 
     # Create a sample country risk table
-    latest_year = merged_df["Year"].max()
-    latest_data = merged_df[merged_df["Year"] == latest_year][
+    latest_data = panel.year(latest_year)[
         ["Country", "GDP_Category"]
     ].drop_duplicates()
 
@@ -672,14 +979,14 @@ with tab_quick:
     col1, col2 = st.columns(2)
 
     with col1:
-        csv = merged_df.to_csv(index=False)
         st.download_button(
             label="⬇️ Download Full Dataset (CSV)",
-            data=csv,
+            data=deferred_export(merged_df, "csv"),
             file_name=f"carbonseer_merged_data_{latest_year}.csv",
-            mime="text/csv",
+            mime=EXPORT_MIME_TYPES["csv"],
             width="stretch",
             key="download_csv_business_intel",
+            on_click="ignore",
         )
 
     with col2:
@@ -10,12 +10,7 @@ from pathlib import Path
 import pandas as pd
 
 from utils import (
-    load_gdp_data,
-    load_co2_data,
-    load_netzero_data,
-    merge_gdp_co2,
-    create_gdp_categories,
-    create_commitment_strength,
+    load_analysis_bundle,
     get_custom_css,
     get_plotly_theme,
     render_sidebar_resources,
@@ -27,6 +22,25 @@ from utils.styling import (
     render_page_header,
     sanitize_df_for_display,
 )
+from utils.exports import (
+    EXPORT_MIME_TYPES,
+    columnar_available,
+    deferred_export,
+    excel_available,
+)
+from utils.figures import cached_figure
+from utils.fingerprint import derive_token, frame_token
+from utils.charts import (
+    bar_figure,
+    box_figure,
+    histogram_figure,
+    line_figure,
+    scatter_figure,
+)
+
+# Share the bundle frames copy-on-write (see app.py); the explorer filters
+# and slices them on every rerun without copying
+pd.set_option("mode.copy_on_write", True)
 
 # Page configuration
 st.set_page_config(
@@ -35,20 +49,7 @@ st.set_page_config(
     layout="wide",
 )
 
-# Apply preferences and styling
-if "fast_mode" not in st.session_state:
-    st.session_state.fast_mode = True
-with st.sidebar:
-    st.markdown("### ⚙️ Preferences")
-    st.toggle(
-        "⚡ Fast Mode",
-        value=st.session_state.fast_mode,
-        key="fast_toggle_explorer",
-        on_change=lambda: setattr(
-            st.session_state, "fast_mode", st.session_state.fast_toggle_explorer
-        ),
-    )
-
+# Apply styling
 st.markdown(get_custom_css("light"), unsafe_allow_html=True)
 
 # Use global branding helpers
@@ -71,435 +72,505 @@ st.markdown("---")
 
 
 # Load data
-@st.cache_data
-def load_explorer_data(source: str = "auto"):
-    """Load all datasets for the explorer."""
-    gdp_df = load_gdp_data(source)
-    co2_df = load_co2_data(source)
-    netzero_df = load_netzero_data(source)
-    merged_df = merge_gdp_co2(gdp_df, co2_df)
-    merged_df = create_gdp_categories(merged_df)
-    netzero_df = create_commitment_strength(netzero_df)
-    return gdp_df, co2_df, netzero_df, merged_df
-
-
 with st.spinner("Loading datasets for exploration..."):
     # Reuse data source choice from Home if available
     data_source = st.session_state.get("data_source", "auto")
-    gdp_df, co2_df, netzero_df, merged_df = load_explorer_data(data_source)
+    bundle = load_analysis_bundle(data_source)
+    gdp_df = bundle.gdp
+    co2_df = bundle.co2
+    netzero_df = bundle.commitment
+    merged_df = bundle.categorized
 
 # ===== DATASET SELECTION =====
-st.html("""
-<div class='metric-card'>
-    <div class='metric-label'>SELECT DATASET TO EXPLORE</div>
-</div>
-""")
-
-dataset_choice = st.radio(
-    "Choose a dataset:",
-    [
-        "📊 GDP & CO₂ (Merged)",
-        "💰 GDP per Capita",
-        "🌍 CO₂ Emissions",
-        "🎯 Net-Zero Commitments",
-    ],
-    horizontal=True,
-)
-
-# Select the appropriate dataset
-if dataset_choice == "📊 GDP & CO₂ (Merged)":
-    df = merged_df.copy()
-    dataset_name = "GDP & CO₂ (Merged)"
-elif dataset_choice == "💰 GDP per Capita":
-    df = gdp_df.copy()
-    dataset_name = "GDP per Capita"
-elif dataset_choice == "🌍 CO₂ Emissions":
-    df = co2_df.copy()
-    dataset_name = "CO₂ Emissions"
-else:
-    df = netzero_df.copy()
-    dataset_name = "Net-Zero Commitments"
-
-st.markdown("---")
-
-# ===== DATA OVERVIEW =====
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.html(f"""
-<div class='metric-card'>
-    <div class='metric-label'>TOTAL ROWS</div>
-    <div class='metric-value'>{len(df):,}</div>
-</div>
-""")
-
-with col2:
-    st.html(f"""
-<div class='metric-card'>
-    <div class='metric-label'>COLUMNS</div>
-    <div class='metric-value'>{len(df.columns)}</div>
-</div>
-""")
-
-with col3:
-    if "Country" in df.columns:
-        unique_countries = df["Country"].nunique()
-    else:
-        unique_countries = "N/A"
-    st.html(f"""
-<div class='metric-card'>
-    <div class='metric-label'>COUNTRIES</div>
-    <div class='metric-value'>{unique_countries}</div>
-</div>
-""")
+# The page chrome above runs once per full rerun. Each section below is a
+# fragment: a widget change reruns only the fragment that owns it (and the
+# fragments nested inside it), so picking columns or configuring a chart
+# does not re-inject CSS, branding, the logo or the sidebar, and a filter
+# change refreshes only the sections that depend on the filtered data.
+@st.fragment
+def explore_dataset():
+    st.html("""
+    <div class='metric-card'>
+        <div class='metric-label'>SELECT DATASET TO EXPLORE</div>
+    </div>
+    """)
+
+    dataset_choice = st.radio(
+        "Choose a dataset:",
+        [
+            "📊 GDP & CO₂ (Merged)",
+            "💰 GDP per Capita",
+            "🌍 CO₂ Emissions",
+            "🎯 Net-Zero Commitments",
+        ],
+        horizontal=True,
+    )
 
-with col4:
-    if "Year" in df.columns:
-        year_range = f"{df['Year'].min()}-{df['Year'].max()}"
+    # Select the appropriate dataset (each has a prebuilt Country/Year panel index)
+    if dataset_choice == "📊 GDP & CO₂ (Merged)":
+        panel = bundle.panels["categorized"]
+        dataset_name = "GDP & CO₂ (Merged)"
+    elif dataset_choice == "💰 GDP per Capita":
+        panel = bundle.panels["gdp"]
+        dataset_name = "GDP per Capita"
+    elif dataset_choice == "🌍 CO₂ Emissions":
+        panel = bundle.panels["co2"]
+        dataset_name = "CO₂ Emissions"
     else:
-        year_range = "N/A"
-    st.html(f"""
-<div class='metric-card'>
-    <div class='metric-label'>TIME RANGE</div>
-    <div class='metric-value' style='font-size: 1.8rem;'>{year_range}</div>
-</div>
-""")
+        panel = bundle.panels["commitment"]
+        dataset_name = "Net-Zero Commitments"
+    df = panel.frame
+
+    st.markdown("---")
+
+    # ===== DATA OVERVIEW =====
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.html(f"""
+    <div class='metric-card'>
+        <div class='metric-label'>TOTAL ROWS</div>
+        <div class='metric-value'>{len(df):,}</div>
+    </div>
+    """)
+
+    with col2:
+        st.html(f"""
+    <div class='metric-card'>
+        <div class='metric-label'>COLUMNS</div>
+        <div class='metric-value'>{len(df.columns)}</div>
+    </div>
+    """)
+
+    with col3:
+        if "Country" in df.columns:
+            unique_countries = df["Country"].nunique()
+        else:
+            unique_countries = "N/A"
+        st.html(f"""
+    <div class='metric-card'>
+        <div class='metric-label'>COUNTRIES</div>
+        <div class='metric-value'>{unique_countries}</div>
+    </div>
+    """)
+
+    with col4:
+        if "Year" in df.columns:
+            year_range = f"{df['Year'].min()}-{df['Year'].max()}"
+        else:
+            year_range = "N/A"
+        st.html(f"""
+    <div class='metric-card'>
+        <div class='metric-label'>TIME RANGE</div>
+        <div class='metric-value' style='font-size: 1.8rem;'>{year_range}</div>
+    </div>
+    """)
+
+    st.markdown("---")
+    filter_panel(panel, dataset_name)
 
-st.markdown("---")
 
 # ===== FILTERING SECTION =====
-st.html("""
-<div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
-🎛️ Filter & Search
-</div>
-""")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    # Country filter
-    if "Country" in df.columns:
+@st.fragment
+def filter_panel(panel, dataset_name):
+    st.html("""
+    <div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
+    🎛️ Filter & Search
+    </div>
+    """)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Country filter
         st.markdown("#### 🌍 Select Countries")
-        all_countries = sorted(df["Country"].unique())
         selected_countries = st.multiselect(
-            "Countries (leave empty for all):", options=all_countries, default=[]
+            "Countries (leave empty for all):",
+            options=panel.countries.tolist(),
+            default=[],
         )
-        if selected_countries:
-            df = df[df["Country"].isin(selected_countries)]
 
-with col2:
-    # Year filter
-    if "Year" in df.columns:
+    with col2:
+        # Year filter
         st.markdown("#### 📅 Select Time Period")
-        min_year = int(df["Year"].min())
-        max_year = int(df["Year"].max())
+        min_year = int(panel.years[0])
+        max_year = int(panel.years[-1])
         year_range_sel = st.slider(
             "Year range:",
             min_value=min_year,
             max_value=max_year,
             value=(min_year, max_year),
         )
-        df = df[(df["Year"] >= year_range_sel[0]) & (df["Year"] <= year_range_sel[1])]
-
-# GDP Category filter if available
-if "GDP_Category" in df.columns:
-    st.markdown("#### 💰 GDP Category")
-    gdp_categories = st.multiselect(
-        "Select GDP categories:",
-        options=["Low", "Medium", "High"],
-        default=["Low", "Medium", "High"],
+
+    # GDP Category filter if available
+    gdp_categories = None
+    if "GDP_Category" in panel.frame.columns:
+        st.markdown("#### 💰 GDP Category")
+        gdp_categories = st.multiselect(
+            "Select GDP categories:",
+            options=["Low", "Medium", "High"],
+            default=["Low", "Medium", "High"],
+        )
+
+    # Filtered frames come from a process-wide LRU keyed by the normalised
+    # filters: the table, exports, statistics and insights below all share
+    # this one read-only frame, and so does any session with the same filters
+    df = panel.select(
+        countries=selected_countries or None,
+        years=year_range_sel,
+        isin=None if gdp_categories is None else {"GDP_Category": gdp_categories},
     )
-    df = df[df["GDP_Category"].isin(gdp_categories)]
 
-st.markdown("---")
+    # The frame's token is derived from the normalised filters, so it keys the
+    # export and figure caches without hashing rows
+    filter_token = frame_token(df)
+
+    st.markdown("---")
+    data_table(df, filter_token, dataset_name)
+    st.markdown("---")
+    visualization_builder(df)
+    st.markdown("---")
+    summary_statistics(df, filter_token)
+    st.markdown("---")
+
+    # ===== ADVANCED INSIGHTS =====
+    st.html("""
+    <div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
+    💡 Quick Insights from Filtered Data
+    </div>
+    """)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if "Country" in df.columns:
+            top_countries = df["Country"].value_counts().head(5)
+            st.markdown("#### 🌍 Top 5 Countries (by records)")
+            st.bar_chart(top_countries)
+
+        if "GDP_Category" in df.columns:
+            st.markdown("#### 💰 GDP Category Distribution")
+
+            def build_gdp_pie():
+                gdp_dist = df["GDP_Category"].value_counts()
+                fig = px.pie(
+                    values=gdp_dist.values,
+                    names=gdp_dist.index,
+                    title="GDP Category Breakdown",
+                )
+                fig.update_layout(get_plotly_theme()["layout"])
+                return fig
+
+            fig = cached_figure(("gdp_pie",), filter_token, build_gdp_pie)
+            st.plotly_chart(fig, width="stretch", key="gdp_pie")
+
+    with col2:
+        if "Year" in df.columns:
+            year_dist = df["Year"].value_counts().sort_index()
+            st.markdown("#### 📅 Records by Year")
+            st.line_chart(year_dist)
+
+        # Show data quality metrics
+        st.markdown("#### 🔍 Data Quality")
+        missing_pct = (df.isnull().sum() / len(df) * 100).round(2)
+        quality_df = pd.DataFrame(
+            {"Column": missing_pct.index, "Missing (%)": missing_pct.values}
+        )
+        quality_df = quality_df[quality_df["Missing (%)"] > 0].sort_values(
+            "Missing (%)", ascending=False
+        )
 
-# ===== DATA TABLE =====
-st.html("""
-<div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
-📋 Filtered Data Table
-</div>
-""")
+        if len(quality_df) > 0:
+            st.dataframe(
+                sanitize_df_for_display(quality_df), width="stretch", hide_index=True
+            )
+        else:
+            st.success("✅ No missing data in filtered dataset!")
 
-st.markdown(f"**Showing {len(df):,} rows after filtering**")
 
-# Column selection
-st.markdown("#### 📊 Select Columns to Display")
-all_columns = list(df.columns)
-default_columns = all_columns[:10] if len(all_columns) > 10 else all_columns
-selected_columns = st.multiselect(
-    "Choose columns:", options=all_columns, default=default_columns
-)
+# ===== DATA TABLE =====
+@st.fragment
+def data_table(df, filter_token, dataset_name):
+    st.html("""
+    <div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
+    📋 Filtered Data Table
+    </div>
+    """)
+
+    st.markdown(f"**Showing {len(df):,} rows after filtering**")
+
+    # Column selection
+    st.markdown("#### 📊 Select Columns to Display")
+    all_columns = list(df.columns)
+    default_columns = all_columns[:10] if len(all_columns) > 10 else all_columns
+    selected_columns = st.multiselect(
+        "Choose columns:", options=all_columns, default=default_columns
+    )
 
-if selected_columns:
-    display_df = df[selected_columns]
-else:
-    display_df = df
-
-# Display the table with sanitization
-st.dataframe(
-    sanitize_df_for_display(display_df.head(500)),
-    width="stretch",
-    height=450,
-    hide_index=True,
-)
+    # Copy-on-write: the column subset shares df's data until something writes
+    if selected_columns:
+        display_df = df[selected_columns]
+    else:
+        display_df = df
+
+    # Fingerprint of the exported columns: keys the export cache without
+    # hashing rows
+    export_token = derive_token(filter_token, tuple(selected_columns))
 
-# Download button with better styling
-st.markdown("### 📥 Export Filtered Data")
-col1, col2 = st.columns(2)
-
-with col1:
-    csv = display_df.to_csv(index=False).encode("utf-8")
-    st.download_button(
-        label="⬇️ Download as CSV",
-        data=csv,
-        file_name=f"carbonseer_{dataset_name.lower().replace(' ', '_')}_filtered.csv",
-        mime="text/csv",
+    # Display the table with sanitization
+    st.dataframe(
+        sanitize_df_for_display(display_df.head(500)),
         width="stretch",
+        height=450,
+        hide_index=True,
     )
 
-with col2:
-    # Add Excel export option
-    try:
-        from io import BytesIO
-
-        excel_buffer = BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-            display_df.to_excel(writer, index=False, sheet_name="CarbonSeer Data")
-        excel_data = excel_buffer.getvalue()
+    # Download buttons: files are only generated when a button is clicked
+    st.markdown("### 📥 Export Filtered Data")
+    col1, col2 = st.columns(2)
 
+    with col1:
+        compress_csv = st.checkbox("🗜️ Gzip-compress CSV", value=False)
+        csv_format = "csv.gz" if compress_csv else "csv"
         st.download_button(
-            label="⬇️ Download as Excel",
-            data=excel_data,
-            file_name=f"carbonseer_{dataset_name.lower().replace(' ', '_')}_filtered.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            label="⬇️ Download as CSV",
+            data=deferred_export(display_df, csv_format, token=export_token),
+            file_name=f"carbonseer_{dataset_name.lower().replace(' ', '_')}_filtered.{csv_format}",
+            mime=EXPORT_MIME_TYPES[csv_format],
             width="stretch",
+            on_click="ignore",
         )
-    except ImportError:
-        st.info("📋 Install openpyxl for Excel export: `uv add openpyxl`")
 
-st.markdown("---")
+    with col2:
+        # Add Excel export option
+        if excel_available():
+            st.download_button(
+                label="⬇️ Download as Excel",
+                data=deferred_export(display_df, "xlsx", token=export_token),
+                file_name=f"carbonseer_{dataset_name.lower().replace(' ', '_')}_filtered.xlsx",
+                mime=EXPORT_MIME_TYPES["xlsx"],
+                width="stretch",
+                on_click="ignore",
+            )
+        else:
+            st.info("📋 Install openpyxl for Excel export: `uv add openpyxl`")
+
+    # Columnar formats keep dtypes (categoricals, integer years) for notebooks
+    if columnar_available():
+        export_stem = f"carbonseer_{dataset_name.lower().replace(' ', '_')}_filtered"
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                label="⬇️ Download as Parquet",
+                data=deferred_export(display_df, "parquet", token=export_token),
+                file_name=f"{export_stem}.parquet",
+                mime=EXPORT_MIME_TYPES["parquet"],
+                width="stretch",
+                on_click="ignore",
+                help="Compressed columnar file; load with pd.read_parquet",
+            )
+        with col2:
+            st.download_button(
+                label="⬇️ Download as Arrow / Feather",
+                data=deferred_export(display_df, "arrow", token=export_token),
+                file_name=f"{export_stem}.arrow",
+                mime=EXPORT_MIME_TYPES["arrow"],
+                width="stretch",
+                on_click="ignore",
+                help="Arrow IPC (Feather v2) file; load with pd.read_feather",
+            )
 
-# ===== CUSTOM VISUALIZATION =====
-st.html("""
-<div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
-📈 Custom Visualization Builder
-</div>
-""")
 
-st.markdown("Build your own interactive charts from the filtered data.")
+# ===== CUSTOM VISUALIZATION =====
+@st.fragment
+def visualization_builder(df):
+    st.html("""
+    <div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
+    📈 Custom Visualization Builder
+    </div>
+    """)
+
+    st.markdown("Build your own interactive charts from the filtered data.")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        chart_type = st.selectbox(
+            "Chart Type:",
+            ["Scatter Plot", "Line Chart", "Bar Chart", "Box Plot", "Histogram"],
+        )
 
-col1, col2, col3 = st.columns(3)
+    numeric_cols = df.select_dtypes(include="number").columns.tolist()
+    categorical_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
 
-with col1:
-    chart_type = st.selectbox(
-        "Chart Type:",
-        ["Scatter Plot", "Line Chart", "Bar Chart", "Box Plot", "Histogram"],
-    )
+    with col2:
+        if chart_type in ["Scatter Plot", "Line Chart", "Bar Chart"]:
+            x_col = st.selectbox("X-axis:", options=df.columns.tolist())
+        elif chart_type == "Box Plot":
+            x_col = st.selectbox(
+                "Category (X-axis):",
+                options=categorical_cols if categorical_cols else df.columns.tolist(),
+            )
+        else:
+            x_col = st.selectbox(
+                "Column:", options=numeric_cols if numeric_cols else df.columns.tolist()
+            )
 
-numeric_cols = df.select_dtypes(include=["int64", "float64"]).columns.tolist()
-categorical_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
+    with col3:
+        if chart_type in ["Scatter Plot", "Line Chart", "Bar Chart", "Box Plot"]:
+            y_col = st.selectbox(
+                "Y-axis:", options=numeric_cols if numeric_cols else df.columns.tolist()
+            )
+        else:
+            y_col = None
+
+    # Color by category
+    color_col = None
+    if categorical_cols and chart_type != "Histogram":
+        use_color = st.checkbox("Color by category?")
+        if use_color:
+            color_col = st.selectbox("Color by:", options=categorical_cols)
+
+    # Generate the chart
+    if st.button("📊 Generate Visualization", width="content"):
+        try:
+            with st.spinner("Creating visualization..."):
+                theme = get_plotly_theme()
+                # Scatter/line data is downsampled; other charts are pre-aggregated
+                reduction = None
+
+                if chart_type == "Scatter Plot":
+                    fig, reduction = scatter_figure(
+                        df,
+                        x=x_col,
+                        y=y_col,
+                        color=color_col,
+                        hover_data=["Country"] if "Country" in df.columns else None,
+                        title=f"{y_col} vs {x_col}",
+                        height=550,
+                    )
+                    fig.update_layout(theme["layout"])
+
+                elif chart_type == "Line Chart":
+                    # One line per country, thinned with LTTB when the panel is large
+                    line_group = (
+                        "Country"
+                        if "Country" in df.columns and "Country" not in (x_col, color_col)
+                        else None
+                    )
+                    fig, reduction = line_figure(
+                        df,
+                        x=x_col,
+                        y=y_col,
+                        color=color_col,
+                        line_group=line_group,
+                        title=f"{y_col} over {x_col}",
+                        height=550,
+                    )
+                    fig.update_layout(theme["layout"])
 
-with col2:
-    if chart_type in ["Scatter Plot", "Line Chart", "Bar Chart"]:
-        x_col = st.selectbox("X-axis:", options=df.columns.tolist())
-    elif chart_type == "Box Plot":
-        x_col = st.selectbox(
-            "Category (X-axis):",
-            options=categorical_cols if categorical_cols else df.columns.tolist(),
-        )
-    else:
-        x_col = st.selectbox(
-            "Column:", options=numeric_cols if numeric_cols else df.columns.tolist()
-        )
+                elif chart_type == "Bar Chart":
+                    # Group means (or counts) computed server-side
+                    fig, reduction = bar_figure(
+                        df,
+                        x=x_col,
+                        y=y_col,
+                        title=(
+                            f"Average {y_col} by {x_col}" if y_col else f"Count by {x_col}"
+                        ),
+                        height=550,
+                    )
+                    fig.update_layout(theme["layout"])
 
-with col3:
-    if chart_type in ["Scatter Plot", "Line Chart", "Bar Chart", "Box Plot"]:
-        y_col = st.selectbox(
-            "Y-axis:", options=numeric_cols if numeric_cols else df.columns.tolist()
-        )
-    else:
-        y_col = None
-
-# Color by category
-color_col = None
-if categorical_cols and chart_type != "Histogram":
-    use_color = st.checkbox("Color by category?")
-    if use_color:
-        color_col = st.selectbox("Color by:", options=categorical_cols)
-
-# Generate the chart
-if st.button("📊 Generate Visualization", width="content"):
-    try:
-        with st.spinner("Creating visualization..."):
-            theme = get_plotly_theme()
-
-            if chart_type == "Scatter Plot":
-                fig = px.scatter(
-                    df,
-                    x=x_col,
-                    y=y_col,
-                    color=color_col,
-                    hover_data=["Country"] if "Country" in df.columns else None,
-                    title=f"{y_col} vs {x_col}",
-                    height=550,
-                )
-                fig.update_layout(theme["layout"])
-
-            elif chart_type == "Line Chart":
-                fig = px.line(
-                    df,
-                    x=x_col,
-                    y=y_col,
-                    color=color_col,
-                    title=f"{y_col} over {x_col}",
-                    height=550,
-                )
-                fig.update_layout(theme["layout"])
-
-            elif chart_type == "Bar Chart":
-                # Aggregate data for cleaner bar charts
-                if y_col:
-                    agg_df = df.groupby(x_col)[y_col].mean().reset_index()
-                    fig = px.bar(
-                        agg_df,
+                elif chart_type == "Box Plot":
+                    fig, reduction = box_figure(
+                        df,
                         x=x_col,
                         y=y_col,
-                        title=f"Average {y_col} by {x_col}",
+                        color=color_col,
+                        title=f"{y_col} distribution by {x_col}",
                         height=550,
                     )
-                else:
-                    fig = px.bar(
-                        df[x_col].value_counts().reset_index(),
+                    fig.update_layout(theme["layout"])
+
+                else:  # Histogram
+                    fig, reduction = histogram_figure(
+                        df,
                         x=x_col,
-                        y="count",
-                        title=f"Count by {x_col}",
+                        color=color_col,
+                        nbins=30,
+                        title=f"Distribution of {x_col}",
                         height=550,
                     )
-                fig.update_layout(theme["layout"])
-
-            elif chart_type == "Box Plot":
-                fig = px.box(
-                    df,
-                    x=x_col,
-                    y=y_col,
-                    color=color_col,
-                    title=f"{y_col} distribution by {x_col}",
-                    height=550,
-                )
-                fig.update_layout(theme["layout"])
-
-            else:  # Histogram
-                fig = px.histogram(
-                    df,
-                    x=x_col,
-                    color=color_col,
-                    title=f"Distribution of {x_col}",
-                    nbins=30,
-                    height=550,
-                )
-                fig.update_layout(theme["layout"])
-
-            st.plotly_chart(fig, width="stretch", key="custom_viz")
-
-            st.html("""
-            <div class='success-box'>
-                <strong>✅ Visualization Generated Successfully</strong><br>
-                <p style='margin: 0.5rem 0 0 0;'>
-                    You can interact with the chart (zoom, pan, hover). 
-                    Click the camera icon in the top-right to download as PNG.
-                </p>
-            </div>
-            """)
-
-    except Exception as e:
-        st.error(f"❌ Error generating chart: {str(e)}")
+                    fig.update_layout(theme["layout"])
+
+                st.plotly_chart(fig, width="stretch", key="custom_viz")
+                if reduction is not None:
+                    st.caption(f"⚡ {reduction.describe()}")
+
+                st.html("""
+                <div class='success-box'>
+                    <strong>✅ Visualization Generated Successfully</strong><br>
+                    <p style='margin: 0.5rem 0 0 0;'>
+                        You can interact with the chart (zoom, pan, hover). 
+                        Click the camera icon in the top-right to download as PNG.
+                    </p>
+                </div>
+                """)
+
+        except Exception as e:
+            st.error(f"❌ Error generating chart: {str(e)}")
+            st.info(
+                "💡 Try selecting different columns or adjusting your filters. Ensure the selected columns have compatible data types."
+            )
+    else:
         st.info(
-            "💡 Try selecting different columns or adjusting your filters. Ensure the selected columns have compatible data types."
+            "👆 Configure your chart settings above and click **Generate Visualization** to create your custom chart."
         )
-else:
-    st.info(
-        "👆 Configure your chart settings above and click **Generate Visualization** to create your custom chart."
-    )
 
-st.markdown("---")
 
 # ===== SUMMARY STATISTICS =====
-st.html("""
-<div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
-📊 Summary Statistics
-</div>
-""")
-
-if numeric_cols:
-    st.markdown("#### 📊 Descriptive Statistics for Numeric Columns")
-    stats_df = df[numeric_cols].describe()
-    st.dataframe(sanitize_df_for_display(stats_df), width="stretch")
-
-    # Add correlation matrix for numeric columns
-    if len(numeric_cols) > 1:
-        st.markdown("#### 🔗 Correlation Matrix")
-        with st.expander("View Correlation Heatmap"):
-            corr_matrix = df[numeric_cols].corr()
-            fig = px.imshow(
-                corr_matrix,
-                text_auto=True,
-                aspect="auto",
-                color_continuous_scale="RdBu_r",
-                title="Correlation Matrix of Numeric Variables",
-            )
-            fig.update_layout(get_plotly_theme()["layout"])
-            st.plotly_chart(fig, width="stretch", key="corr_matrix")
-else:
-    st.info("No numeric columns available for statistical summary.")
-
-st.markdown("---")
-
-# ===== ADVANCED INSIGHTS =====
-st.html("""
-<div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
-💡 Quick Insights from Filtered Data
-</div>
-""")
-
-col1, col2 = st.columns(2)
+@st.fragment
+def summary_statistics(df, filter_token):
+    st.html("""
+    <div class='section-header' style='animation: slideInLeft 0.6s ease-out;'>
+    📊 Summary Statistics
+    </div>
+    """)
+
+    numeric_cols = df.select_dtypes(include="number").columns.tolist()
+
+    if numeric_cols:
+        st.markdown("#### 📊 Descriptive Statistics for Numeric Columns")
+        stats_df = df[numeric_cols].describe()
+        st.dataframe(sanitize_df_for_display(stats_df), width="stretch")
+
+        # Add correlation matrix for numeric columns
+        if len(numeric_cols) > 1:
+            st.markdown("#### 🔗 Correlation Matrix")
+            with st.expander("View Correlation Heatmap"):
+
+                def build_corr_matrix():
+                    corr_matrix = df[numeric_cols].corr()
+                    fig = px.imshow(
+                        corr_matrix,
+                        text_auto=True,
+                        aspect="auto",
+                        color_continuous_scale="RdBu_r",
+                        title="Correlation Matrix of Numeric Variables",
+                    )
+                    fig.update_layout(get_plotly_theme()["layout"])
+                    return fig
 
-with col1:
-    if "Country" in df.columns:
-        top_countries = df["Country"].value_counts().head(5)
-        st.markdown("#### 🌍 Top 5 Countries (by records)")
-        st.bar_chart(top_countries)
+                fig = cached_figure(
+                    ("corr_matrix", tuple(numeric_cols)), filter_token, build_corr_matrix
+                )
+                st.plotly_chart(fig, width="stretch", key="corr_matrix")
+    else:
+        st.info("No numeric columns available for statistical summary.")
 
-    if "GDP_Category" in df.columns:
-        gdp_dist = df["GDP_Category"].value_counts()
-        st.markdown("#### 💰 GDP Category Distribution")
-        fig = px.pie(
-            values=gdp_dist.values, names=gdp_dist.index, title="GDP Category Breakdown"
-        )
-        fig.update_layout(get_plotly_theme()["layout"])
-        st.plotly_chart(fig, width="stretch", key="gdp_pie")
-
-with col2:
-    if "Year" in df.columns:
-        year_dist = df["Year"].value_counts().sort_index()
-        st.markdown("#### 📅 Records by Year")
-        st.line_chart(year_dist)
-
-    # Show data quality metrics
-    st.markdown("#### 🔍 Data Quality")
-    missing_pct = (df.isnull().sum() / len(df) * 100).round(2)
-    quality_df = pd.DataFrame(
-        {"Column": missing_pct.index, "Missing (%)": missing_pct.values}
-    )
-    quality_df = quality_df[quality_df["Missing (%)"] > 0].sort_values(
-        "Missing (%)", ascending=False
-    )
 
-    if len(quality_df) > 0:
-        st.dataframe(
-            sanitize_df_for_display(quality_df), width="stretch", hide_index=True
-        )
-    else:
-        st.success("✅ No missing data in filtered dataset!")
+explore_dataset()
 
 st.markdown("---")
 
@@ -516,6 +587,7 @@ st.html("""
     <ul style='margin-top: 0.5rem; line-height: 1.7;'>
         <li>Download <strong>CSV</strong> for Excel analysis and pivot tables</li>
         <li>Download <strong>Excel</strong> for formatted reports (if openpyxl installed)</li>
+        <li>Download <strong>Parquet</strong> or <strong>Arrow</strong> to load the filtered data into notebooks with dtypes intact</li>
         <li>Use <strong>Camera icon</strong> on charts to save as PNG for presentations</li>
         <li>Apply filters to create <strong>country-specific</strong> or <strong>sector-specific</strong> briefings</li>
     </ul>
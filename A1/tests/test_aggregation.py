@@ -0,0 +1,97 @@
+"""
+Tests for the server-side chart summaries in utils.aggregation, checked
+against NumPy and pandas on the raw rows.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.aggregation import (
+    WHISKER_IQR,
+    box_statistics,
+    group_means,
+    histogram_bins,
+)
+
+
+@pytest.fixture
+def chart_df():
+    rng = np.random.default_rng(10)
+    n = 2_000
+    df = pd.DataFrame(
+        {
+            "CO2": rng.lognormal(1, 1, n),
+            "GDP_Category": pd.Categorical(
+                rng.choice(["Low", "Medium", "High"], n),
+                categories=["Low", "Medium", "High"],
+            ),
+            "Legal": rng.choice(["Yes", "No"], n),
+        }
+    )
+    df.loc[::13, "CO2"] = np.nan
+    df.loc[::29, "Legal"] = None
+    # A tiny group: quartiles interpolate between its few values
+    df.loc[df.index[-3:], ["GDP_Category", "Legal"]] = ["Low", "Maybe"]
+    return df
+
+
+def _groups(df, column, by):
+    clean = df.dropna(subset=[column, *by])
+    return clean.groupby(by, observed=True)[column]
+
+
+def test_box_statistics_match_numpy(chart_df):
+    by = ["GDP_Category", "Legal"]
+    stats = box_statistics(chart_df, "CO2", by)
+
+    groups = dict(list(_groups(chart_df, "CO2", by)))
+    assert len(stats) == len(groups)
+    for row in stats.itertuples(index=False):
+        values = groups[(row.GDP_Category, row.Legal)].to_numpy()
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        reach = WHISKER_IQR * (q3 - q1)
+        inside = values[(values >= q1 - reach) & (values <= q3 + reach)]
+
+        assert row.n == len(values)
+        assert (row.q1, row.median, row.q3) == pytest.approx((q1, median, q3))
+        assert row.mean == pytest.approx(values.mean())
+        assert row.lowerfence == inside.min()
+        assert row.upperfence == inside.max()
+        np.testing.assert_array_equal(
+            row.outliers, np.sort(values[(values < q1 - reach) | (values > q3 + reach)])
+        )
+
+
+def test_box_statistics_without_groups(chart_df):
+    stats = box_statistics(chart_df, "CO2")
+    values = chart_df["CO2"].dropna().to_numpy()
+
+    assert len(stats) == 1
+    assert stats["median"].iloc[0] == pytest.approx(np.median(values))
+    assert box_statistics(chart_df.iloc[:0], "CO2", "Legal").empty
+
+
+@pytest.mark.parametrize("by", [None, "Legal"])
+def test_histogram_counts_sum_to_n(chart_df, by):
+    bins = histogram_bins(chart_df, "CO2", nbins=25, by=by)
+    clean = chart_df.dropna(subset=["CO2"] + ([by] if by else []))
+    values = clean["CO2"].to_numpy()
+
+    assert bins["count"].sum() == len(clean)
+    edges = np.append(bins["bin_left"].unique(), bins["bin_right"].iloc[-1])
+    np.testing.assert_allclose(edges, np.histogram_bin_edges(values, bins=25))
+    if by is None:
+        np.testing.assert_array_equal(bins["count"], np.histogram(values, bins=25)[0])
+    else:
+        for key, rows in bins.groupby(by):
+            expected = np.histogram(clean.loc[clean[by] == key, "CO2"], bins=edges)[0]
+            np.testing.assert_array_equal(rows["count"], expected)
+
+
+def test_group_means_match_pandas(chart_df):
+    means = group_means(chart_df, "CO2", "GDP_Category")
+    expected = _groups(chart_df, "CO2", ["GDP_Category"]).agg(["mean", "count"])
+
+    np.testing.assert_allclose(means["mean"], expected["mean"])
+    np.testing.assert_array_equal(means["count"], expected["count"])
@@ -0,0 +1,210 @@
+"""
+Tests for the moment-based ANOVA and pairwise tests in utils.analysis,
+checked against scipy and statsmodels on the same data.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+from scipy.stats import f_oneway, linregress, pearsonr, spearmanr, ttest_ind
+from statsmodels.stats.multitest import multipletests
+
+from utils.analysis import (
+    adjust_p_values,
+    compute_anova_and_pairwise,
+    compute_correlations,
+    compute_yearly_correlations,
+    group_moments,
+    ols_confidence_band,
+    perform_anova_test,
+)
+
+
+@pytest.fixture
+def groups_df():
+    rng = np.random.default_rng(7)
+    labels = ["Low", "Medium", "High"]
+    group = rng.choice(labels, 600, p=[0.5, 0.3, 0.2])
+    value = rng.lognormal(0.5, 0.8, 600) + pd.Series(group).map(
+        {"Low": 0.0, "Medium": 1.0, "High": 2.5}
+    ).to_numpy()
+    value[::37] = np.nan
+    return pd.DataFrame(
+        {"GDP_Category": pd.Categorical(group, categories=labels), "CO2": value}
+    )
+
+
+def _reference_groups(df):
+    return {
+        key: values.dropna().to_numpy(dtype=np.float64)
+        for key, values in df.groupby("GDP_Category", observed=True)["CO2"]
+    }
+
+
+def test_group_moments_match_pandas(groups_df):
+    moments = group_moments(groups_df, "CO2", "GDP_Category")
+    expected = groups_df.groupby("GDP_Category", observed=True)["CO2"].agg(
+        ["count", "mean", "var"]
+    )
+
+    np.testing.assert_array_equal(moments["n"], expected["count"])
+    np.testing.assert_allclose(moments["mean"], expected["mean"], rtol=1e-12)
+    np.testing.assert_allclose(moments["var"], expected["var"], rtol=1e-12)
+
+
+def test_anova_and_pairwise_match_scipy(groups_df):
+    f_stat, p_value, pairwise = compute_anova_and_pairwise(
+        groups_df, "CO2", "GDP_Category"
+    )
+    groups = _reference_groups(groups_df)
+    reference = f_oneway(*groups.values())
+
+    assert f_stat == pytest.approx(reference.statistic, rel=1e-10)
+    assert p_value == pytest.approx(reference.pvalue, rel=1e-8, abs=1e-300)
+
+    assert list(zip(pairwise["group1"], pairwise["group2"])) == [
+        ("Low", "Medium"),
+        ("Low", "High"),
+        ("Medium", "High"),
+    ]
+    for row in pairwise.itertuples():
+        a, b = groups[row.group1], groups[row.group2]
+        welch = ttest_ind(a, b, equal_var=False)
+        assert row.t_stat == pytest.approx(welch.statistic, rel=1e-10)
+        assert row.p_value == pytest.approx(welch.pvalue, rel=1e-8, abs=1e-300)
+        assert row.mean1 == pytest.approx(a.mean(), rel=1e-12)
+        assert (row.n1, row.n2) == (len(a), len(b))
+
+    for method in ("bonferroni", "holm", "fdr_bh"):
+        expected = multipletests(pairwise["p_value"], method=method)[1]
+        np.testing.assert_allclose(pairwise[f"p_{method}"], expected, rtol=1e-12)
+
+
+def test_float32_values_are_aggregated_in_float64(groups_df):
+    as_float32 = groups_df.astype({"CO2": "float32"})
+    f_stat, _, pairwise = compute_anova_and_pairwise(as_float32, "CO2", "GDP_Category")
+
+    reference = f_oneway(
+        *[
+            values.dropna().to_numpy(dtype=np.float64)
+            for _, values in as_float32.groupby("GDP_Category", observed=True)["CO2"]
+        ]
+    )
+    assert f_stat == pytest.approx(reference.statistic, rel=1e-12)
+    assert pairwise["mean1"].dtype == np.float64
+    assert pairwise["group1"].dtype == object
+
+
+def test_fewer_than_two_groups_returns_none(groups_df):
+    single = groups_df[groups_df["GDP_Category"] == "Low"]
+    f_stat, p_value, pairwise = compute_anova_and_pairwise(
+        single, "CO2", "GDP_Category"
+    )
+    assert f_stat is None and p_value is None and pairwise.empty
+
+
+def test_perform_anova_test_matches_scipy(groups_df):
+    groups = list(_reference_groups(groups_df).values())
+    result = perform_anova_test(groups, token="test-anova-groups")
+    reference = f_oneway(*groups)
+
+    assert result["f_statistic"] == pytest.approx(reference.statistic, rel=1e-12)
+    values = np.concatenate(groups)
+    ss_between = sum(len(g) * (g.mean() - values.mean()) ** 2 for g in groups)
+    ss_total = ((values - values.mean()) ** 2).sum()
+    assert result["eta_squared"] == pytest.approx(ss_between / ss_total)
+    # Without a token the arrays are fingerprinted; the result is the same
+    assert perform_anova_test(groups) == result
+
+
+def test_adjust_p_values_keeps_nan_positions():
+    p = np.array([0.01, np.nan, 0.04, 0.03])
+    adjusted = adjust_p_values(p, "holm")
+
+    assert np.isnan(adjusted[1])
+    expected = multipletests(p[[0, 2, 3]], method="holm")[1]
+    np.testing.assert_allclose(adjusted[[0, 2, 3]], expected)
+
+
+@pytest.mark.parametrize("chunk_rows", [7, 1_000_000])
+def test_streamed_correlations_match_scipy(chunk_rows):
+    rng = np.random.default_rng(13)
+    x = np.round(rng.lognormal(9, 1, 500), -2).astype(np.float32)  # ties, float32
+    y = 0.4 * np.log(x) + rng.normal(0, 1, 500)
+    x[::17] = np.nan
+    y[::23] = np.nan
+    df = pd.DataFrame({"GDP": x, "CO2": y})
+
+    result = compute_correlations(df, "GDP", "CO2", chunk_rows=chunk_rows)
+    clean = df.dropna().astype("float64")
+    pearson = pearsonr(clean["GDP"], clean["CO2"])
+    spearman = spearmanr(clean["GDP"], clean["CO2"])
+
+    assert result["n"] == len(clean)
+    assert result["pearson_r"] == pytest.approx(pearson.statistic, rel=1e-12)
+    assert result["pearson_p"] == pytest.approx(pearson.pvalue, rel=1e-8)
+    assert result["spearman_rho"] == pytest.approx(spearman.statistic, rel=1e-12)
+    assert result["spearman_p"] == pytest.approx(spearman.pvalue, rel=1e-8)
+    assert result["r_squared"] == pytest.approx(pearson.statistic**2, rel=1e-12)
+
+
+def test_streamed_correlations_need_three_pairs():
+    df = pd.DataFrame({"GDP": [1.0, 2.0, np.nan], "CO2": [1.0, 3.0, 2.0]})
+    assert compute_correlations(df, "GDP", "CO2") is None
+    with pytest.raises(KeyError):
+        compute_correlations(df, "GDP", "Missing")
+
+
+@pytest.fixture
+def yearly_df():
+    rng = np.random.default_rng(17)
+    frames = []
+    for year, n in [(2000, 40), (2001, 25), (2002, 2), (2003, 60)]:
+        gdp = np.round(rng.lognormal(9, 1, n), -3)  # ties for Spearman
+        co2 = 0.5 * np.log(gdp) + rng.normal(0, 0.5, n)
+        frames.append(pd.DataFrame({"Year": year, "GDP": gdp, "CO2": co2}))
+    df = pd.concat(frames, ignore_index=True)
+    df.loc[::11, "CO2"] = np.nan
+    return df.astype({"Year": "int16", "CO2": "float32"})
+
+
+def test_yearly_correlations_match_scipy(yearly_df):
+    yearly = compute_yearly_correlations(yearly_df, "GDP", "CO2")
+
+    assert list(yearly.index) == [2000, 2001, 2002, 2003]
+    for year, rows in yearly_df.dropna().groupby("Year"):
+        x = rows["GDP"].to_numpy(dtype=np.float64)
+        y = rows["CO2"].to_numpy(dtype=np.float64)
+        result = yearly.loc[year]
+        assert result["n"] == len(rows)
+        if len(rows) < 3:
+            assert result.drop("n").isna().all()
+            continue
+
+        pearson, spearman, fit = pearsonr(x, y), spearmanr(x, y), linregress(x, y)
+        assert result["pearson_r"] == pytest.approx(pearson.statistic, rel=1e-10)
+        assert result["pearson_p"] == pytest.approx(pearson.pvalue, rel=1e-8)
+        assert result["spearman_rho"] == pytest.approx(spearman.statistic, rel=1e-10)
+        assert result["spearman_p"] == pytest.approx(spearman.pvalue, rel=1e-8)
+        assert result["r_squared"] == pytest.approx(fit.rvalue**2, rel=1e-10)
+        assert result["slope"] == pytest.approx(fit.slope, rel=1e-10)
+        assert result["intercept"] == pytest.approx(fit.intercept, rel=1e-10)
+
+
+def test_ols_confidence_band_matches_statsmodels(yearly_df):
+    yearly = compute_yearly_correlations(yearly_df, "GDP", "CO2")
+    rows = yearly_df.dropna()
+    rows = rows[rows["Year"] == 2003]
+    model = sm.OLS(
+        rows["CO2"].to_numpy(dtype=np.float64),
+        sm.add_constant(rows["GDP"].to_numpy(dtype=np.float64)),
+    ).fit()
+
+    grid = np.linspace(rows["GDP"].min(), rows["GDP"].max(), 7)
+    y_hat, lower, upper = ols_confidence_band(yearly.loc[2003], grid)
+    prediction = model.get_prediction(sm.add_constant(grid)).summary_frame(alpha=0.05)
+
+    np.testing.assert_allclose(y_hat, prediction["mean"], rtol=1e-9)
+    np.testing.assert_allclose(lower, prediction["mean_ci_lower"], rtol=1e-9)
+    np.testing.assert_allclose(upper, prediction["mean_ci_upper"], rtol=1e-9)
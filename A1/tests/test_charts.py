@@ -0,0 +1,116 @@
+"""
+Tests for the scatter and line chart reduction in utils.charts.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.charts import (
+    CELL_COUNT_COLUMN,
+    density_sample,
+    lttb_indices,
+    reduce_line_data,
+    reduce_scatter_data,
+)
+
+
+@pytest.fixture
+def spiky_line():
+    rng = np.random.default_rng(2)
+    x = np.arange(5_000, dtype=np.float64)
+    y = np.cumsum(rng.normal(0, 1, len(x)))
+    y[3_217] += 500.0  # a single-point spike
+    return x, y
+
+
+@pytest.mark.parametrize("n_out", [3, 50, 999])
+def test_lttb_keeps_endpoints_and_budget(spiky_line, n_out):
+    x, y = spiky_line
+    kept = lttb_indices(x, y, n_out)
+
+    assert len(kept) == n_out
+    assert kept[0] == 0 and kept[-1] == len(x) - 1
+    assert np.all(np.diff(kept) > 0)
+
+
+def test_lttb_keeps_a_spike(spiky_line):
+    x, y = spiky_line
+    assert 3_217 in lttb_indices(x, y, 100)
+
+
+def test_lttb_returns_everything_under_budget():
+    x = np.arange(10.0)
+    np.testing.assert_array_equal(lttb_indices(x, x, 10), np.arange(10))
+    np.testing.assert_array_equal(lttb_indices(x, x, 50), np.arange(10))
+
+
+def test_density_sample_keeps_outliers_and_counts_every_point():
+    rng = np.random.default_rng(4)
+    x = np.concatenate([rng.normal(0, 1, 50_000), [40.0, -35.0, 0.0]])
+    y = np.concatenate([rng.normal(0, 1, 50_000), [0.0, 25.0, -60.0]])
+    outliers = np.arange(50_000, 50_003)
+
+    positions, counts = density_sample(x, y, max_points=2_000)
+
+    assert len(positions) <= 2_000
+    assert np.isin(outliers, positions).all()
+    assert counts[np.isin(positions, outliers)].tolist() == [1, 1, 1]
+    assert counts.sum() == len(x)
+    assert np.all(np.diff(positions) > 0)
+
+
+def test_density_sample_bins_groups_separately():
+    x = np.zeros(1_000)
+    y = np.zeros(1_000)
+    groups = np.repeat([0, 1], 500)
+
+    positions, counts = density_sample(x, y, max_points=100, groups=groups)
+
+    assert sorted(groups[positions]) == [0, 1]
+    assert counts.tolist() == [500, 500]
+
+
+def test_reduce_scatter_data_respects_budget():
+    rng = np.random.default_rng(6)
+    df = pd.DataFrame(
+        {
+            "GDP": rng.lognormal(9, 1, 30_000),
+            "CO2": rng.lognormal(1, 1, 30_000),
+            "Region": rng.choice(["A", "B"], 30_000),
+        }
+    )
+    df.loc[::100, "CO2"] = np.nan
+
+    reduced, reduction = reduce_scatter_data(
+        df, "GDP", "CO2", "Region", max_points=1_000
+    )
+
+    assert reduction.original_points == df["CO2"].notna().sum()
+    assert reduction.shown_points == len(reduced)
+    # The coarsest grid has about max_points cells per colour group
+    assert len(reduced) <= 2 * 1_000
+    assert reduced[CELL_COUNT_COLUMN].sum() == reduction.original_points
+
+    small, unreduced = reduce_scatter_data(df.head(500), "GDP", "CO2")
+    assert not unreduced.reduced and CELL_COUNT_COLUMN not in small
+
+
+def test_reduce_line_data_keeps_each_series_endpoints():
+    rng = np.random.default_rng(8)
+    frames = [
+        pd.DataFrame(
+            {"Country": country, "Year": np.arange(3_000), "CO2": rng.random(3_000)}
+        )
+        for country in ["France", "India", "Chile"]
+    ]
+    df = pd.concat(frames).sample(frac=1, random_state=0)
+
+    reduced, reduction = reduce_line_data(
+        df, "Year", "CO2", ["Country"], max_points=600
+    )
+
+    assert reduction.shown_points == len(reduced) <= 600
+    for _, rows in reduced.groupby("Country"):
+        assert rows["Year"].is_monotonic_increasing
+        assert rows["Year"].iloc[[0, -1]].tolist() == [0, 2_999]
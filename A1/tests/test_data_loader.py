@@ -0,0 +1,85 @@
+"""
+Tests for the columnar (Parquet) cache of parsed source CSVs in
+utils.data_loader.
+"""
+
+import pandas as pd
+import pytest
+
+from utils import data_loader
+from utils.data_loader import _read_columnar_cache
+
+
+SCHEMA = {
+    "usecols": ["Entity", "Year", "Value"],
+    "dtype": {"Entity": "category", "Year": "int16", "Value": "float32"},
+}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(data_loader, "CACHE_DIR", directory)
+    return directory
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "source.csv"
+    path.write_text(
+        "Entity,Code,Year,Value\nFrance,FRA,2019,4.81\nFrance,FRA,2020,4.26\n"
+        "India,IND,2020,1.77\n"
+    )
+    return path
+
+
+@pytest.fixture
+def csv_reads(monkeypatch):
+    """Count the CSV parses behind the cache."""
+    calls = []
+    read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(args[0])
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(data_loader.pd, "read_csv", counting_read_csv)
+    return calls
+
+
+def test_cache_hit_skips_csv_parse(cache_dir, csv_path, csv_reads):
+    first = _read_columnar_cache(csv_path, **SCHEMA)
+    second = _read_columnar_cache(csv_path, **SCHEMA)
+
+    assert len(csv_reads) == 1
+    assert len(list(cache_dir.glob("source-*.parquet"))) == 1
+    pd.testing.assert_frame_equal(second, first)
+    assert list(second.columns) == ["Country", "Year", "Value"]
+    assert isinstance(second["Country"].dtype, pd.CategoricalDtype)
+    assert second["Year"].dtype == "int16"
+    assert second["Value"].dtype == "float32"
+
+
+def test_changed_csv_rebuilds_and_drops_old_entry(cache_dir, csv_path, csv_reads):
+    _read_columnar_cache(csv_path, **SCHEMA)
+    (old_entry,) = cache_dir.glob("source-*.parquet")
+
+    csv_path.write_text("Entity,Code,Year,Value\nChile,CHL,2020,4.3\n")
+    df = _read_columnar_cache(csv_path, **SCHEMA)
+
+    assert len(csv_reads) == 2
+    assert df["Country"].tolist() == ["Chile"]
+    (new_entry,) = cache_dir.glob("source-*.parquet")
+    assert new_entry != old_entry
+
+
+def test_schema_version_bump_rebuilds(cache_dir, csv_path, csv_reads, monkeypatch):
+    _read_columnar_cache(csv_path, **SCHEMA)
+    (old_entry,) = cache_dir.glob("source-*.parquet")
+
+    monkeypatch.setattr(data_loader, "CACHE_SCHEMA_VERSION", 99)
+    _read_columnar_cache(csv_path, **SCHEMA)
+
+    assert len(csv_reads) == 2
+    (new_entry,) = cache_dir.glob("source-*.parquet")
+    assert new_entry != old_entry
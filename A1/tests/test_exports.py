@@ -0,0 +1,54 @@
+"""
+Tests for the chunked export writers in utils.exports.
+"""
+
+import gzip
+import io
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import exports
+from utils.exports import export_bytes
+
+
+@pytest.fixture
+def export_df():
+    return pd.DataFrame(
+        {
+            "Country": pd.Categorical(["France", "India", "Chile"]),
+            "Year": np.array([2019, 2020, 2021], dtype="int16"),
+            "CO2": np.array([4.8112345, np.nan, 0.052017558], dtype="float32"),
+            "GDP": np.array([308.31827, 41200.5, 1.0e-7], dtype="float32"),
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Several chunks per export, so chunk boundaries are exercised
+    chunks = partial(exports._iter_chunks, chunk_rows=2)
+    monkeypatch.setattr(exports, "_iter_chunks", chunks)
+
+
+def test_csv_matches_to_csv(export_df):
+    expected = export_df.to_csv(index=False).encode()
+
+    assert export_bytes(export_df, "csv", token="csv") == expected
+    assert gzip.decompress(export_bytes(export_df, "csv.gz", token="gz")) == expected
+
+
+def test_xlsx_keeps_float32_values_as_displayed(export_df):
+    from openpyxl import load_workbook
+
+    payload = export_bytes(export_df, "xlsx", token="xlsx")
+    rows = list(load_workbook(io.BytesIO(payload)).active.values)
+
+    assert rows[0] == ("Country", "Year", "CO2", "GDP")
+    assert rows[1:] == [
+        ("France", 2019, 4.8112345, 308.31827),
+        ("India", 2020, None, 41200.5),
+        ("Chile", 2021, 0.05201756, 1e-07),
+    ]
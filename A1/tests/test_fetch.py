@@ -0,0 +1,132 @@
+"""
+Tests for utils.fetch against a local HTTP server.
+
+The server serves one body per path with an ETag, answers If-None-Match
+with 304, and can be told to fail the next few requests with 503.
+"""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from utils.fetch import fetch_cached, get_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        state = self.server.state
+        state["requests"].append(dict(self.headers))
+        if state["failures"] > 0:
+            state["failures"] -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = state["bodies"][self.path]
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.state = {
+        "bodies": {"/data.csv": b"Country,Year\nFrance,2020\n"},
+        "failures": 0,
+        "requests": [],
+    }
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path="/data.csv"):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def test_first_fetch_stores_body_by_content_hash(server, tmp_path):
+    path = fetch_cached(_url(server), cache_dir=tmp_path)
+
+    body = server.state["bodies"]["/data.csv"]
+    assert path.read_bytes() == body
+    assert path == tmp_path / "blobs" / hashlib.sha256(body).hexdigest()
+
+
+def test_revalidation_reuses_cached_body_on_304(server, tmp_path):
+    first = fetch_cached(_url(server), cache_dir=tmp_path)
+    second = fetch_cached(_url(server), cache_dir=tmp_path)
+
+    assert second == first
+    assert "If-None-Match" not in server.state["requests"][0]
+    assert server.state["requests"][1]["If-None-Match"]
+
+
+def test_changed_body_replaces_and_collects_old_blob(server, tmp_path):
+    old = fetch_cached(_url(server), cache_dir=tmp_path)
+    server.state["bodies"]["/data.csv"] = b"Country,Year\nIndia,2021\n"
+
+    new = fetch_cached(_url(server), cache_dir=tmp_path)
+
+    assert new != old
+    assert new.read_bytes() == b"Country,Year\nIndia,2021\n"
+    assert not old.exists()
+
+
+def test_blob_shared_by_another_url_is_kept(server, tmp_path):
+    body = server.state["bodies"]["/data.csv"]
+    server.state["bodies"]["/copy.csv"] = body
+    shared = fetch_cached(_url(server), cache_dir=tmp_path)
+    fetch_cached(_url(server, "/copy.csv"), cache_dir=tmp_path)
+
+    server.state["bodies"]["/data.csv"] = b"changed\n"
+    fetch_cached(_url(server), cache_dir=tmp_path)
+
+    assert shared.read_bytes() == body
+
+
+def test_retries_transient_server_errors(server, tmp_path):
+    server.state["failures"] = 1
+
+    path = fetch_cached(_url(server), cache_dir=tmp_path, session=get_session())
+
+    assert path.read_bytes() == server.state["bodies"]["/data.csv"]
+    assert len(server.state["requests"]) == 2
+
+
+def test_offline_falls_back_to_cached_body(server, tmp_path):
+    url = _url(server)
+    cached = fetch_cached(url, cache_dir=tmp_path)
+    server.shutdown()
+    server.server_close()
+
+    # A plain session: no retries, so the refused connection fails at once
+    assert fetch_cached(url, cache_dir=tmp_path, session=requests.Session()) == cached
+
+
+def test_offline_without_cache_raises(server, tmp_path):
+    url = _url(server)
+    server.shutdown()
+    server.server_close()
+
+    with pytest.raises(requests.RequestException):
+        fetch_cached(url, cache_dir=tmp_path, session=requests.Session())
@@ -0,0 +1,60 @@
+"""
+Tests for the process-wide figure cache in utils.figures.
+"""
+
+import plotly.graph_objects as go
+import pytest
+
+from utils import figures
+from utils.figures import cached_figure
+from utils.lru import BudgetLRU
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(
+        figures, "_figure_cache", BudgetLRU(figures.FIGURE_CACHE_BUDGET_BYTES)
+    )
+
+
+@pytest.fixture
+def builder():
+    calls = []
+
+    def build():
+        calls.append(None)
+        fig = go.Figure(go.Scatter(x=[1, 2, 3], y=[4.5, 5.0, 6.25], name="CO2"))
+        fig.update_layout(title="CO2 per capita", template="plotly_white")
+        return fig
+
+    build.calls = calls
+    return build
+
+
+def test_hit_skips_build_and_returns_equal_figure(builder):
+    first = cached_figure(("co2_line", 2020), "token-a", builder)
+    second = cached_figure(("co2_line", 2020), "token-a", builder)
+
+    assert len(builder.calls) == 1
+    assert second is not first
+    assert second.to_plotly_json() == first.to_plotly_json()
+
+
+@pytest.mark.parametrize(
+    "spec, token",
+    [(("co2_line", 2021), "token-a"), (("co2_line", 2020), "token-b")],
+)
+def test_other_spec_or_token_rebuilds(builder, spec, token):
+    cached_figure(("co2_line", 2020), "token-a", builder)
+    cached_figure(spec, token, builder)
+
+    assert len(builder.calls) == 2
+
+
+def test_theme_version_bump_rebuilds(builder, monkeypatch):
+    cached_figure(("co2_line", 2020), "token-a", builder)
+    monkeypatch.setattr(figures, "PLOTLY_THEME_VERSION", "next")
+    cached_figure(("co2_line", 2020), "token-a", builder)
+
+    assert len(builder.calls) == 2
+    assert figures.figure_cache_stats()["entries"] == 2
@@ -0,0 +1,100 @@
+"""
+Tests for utils.panel.Panel, checked against the boolean-mask filtering
+the pages used before.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.panel import Panel
+
+
+@pytest.fixture
+def panel_df():
+    rng = np.random.default_rng(21)
+    countries = [f"Country {i:02d}" for i in range(12)]
+    rows = [
+        (country, year)
+        for country in countries
+        for year in range(1990, 2021)
+        if rng.random() < 0.8
+    ]
+    df = pd.DataFrame(rows, columns=["Country", "Year"])
+    df["CO2"] = rng.normal(5, 2, len(df))
+    df["GDP_Category"] = pd.Categorical(
+        rng.choice(["Low", "Medium", "High"], len(df)),
+        categories=["Low", "Medium", "High"],
+    )
+    df["Target_Year"] = rng.choice([2030, 2050, 2060], len(df))
+    # Unsorted input with an unused country category
+    df = df.sample(frac=1, random_state=1).reset_index(drop=True)
+    df["Country"] = pd.Categorical(df["Country"], categories=[*countries, "Nowhere"])
+    return df
+
+
+def _expected(df, countries=None, years=None, isin=None):
+    mask = pd.Series(True, index=df.index)
+    if countries is not None:
+        mask &= df["Country"].isin(countries)
+    if years is not None:
+        mask &= df["Year"].between(*years)
+    for column, values in (isin or {}).items():
+        mask &= df[column].isin(values)
+    return df[mask].sort_values(["Country", "Year"]).reset_index(drop=True)
+
+
+def _assert_same_rows(result, expected):
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected)
+
+
+def test_select_matches_boolean_masks(panel_df):
+    panel = Panel(panel_df)
+    country_options = [None, ["Country 03"], ["Country 07", "Country 01", "Unknown"]]
+    year_options = [None, (2005, 2005), (1980, 2000), (2010, 2030)]
+    isin_options = [
+        None,
+        {"GDP_Category": ["High", "Low"]},
+        {"Target_Year": [2050]},
+        {"GDP_Category": ["Medium"], "Target_Year": [2030, 2060]},
+    ]
+
+    for countries, years, isin in itertools.product(
+        country_options, year_options, isin_options
+    ):
+        result = panel.select(countries=countries, years=years, isin=isin)
+        _assert_same_rows(result, _expected(panel_df, countries, years, isin))
+
+
+def test_year_slices_match_boolean_masks(panel_df):
+    panel = Panel(panel_df)
+
+    _assert_same_rows(panel.year(2001), _expected(panel_df, years=(2001, 2001)))
+    _assert_same_rows(
+        panel.year_range(1995, 1999), _expected(panel_df, years=(1995, 1999))
+    )
+    assert panel.year(1900).empty
+    assert list(panel.countries) == sorted(panel_df["Country"].unique())
+    np.testing.assert_array_equal(panel.years, np.unique(panel_df["Year"]))
+
+
+def test_equivalent_selections_share_one_frame(panel_df):
+    panel = Panel(panel_df)
+
+    first = panel.select(
+        countries=["Country 02", "Country 05"], isin={"Target_Year": [2060, 2030]}
+    )
+    second = panel.select(
+        countries=["Country 05", "Country 02", "Country 05"],
+        years=(1900, 2100),
+        isin={"Target_Year": [2030, 2060]},
+    )
+    assert second is first
+
+    # Filters that keep every row return the panel frame itself
+    everything = panel.select(
+        years=(1900, 2100), isin={"GDP_Category": ["Low", "Medium", "High"]}
+    )
+    assert everything is panel.frame
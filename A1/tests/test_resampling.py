@@ -0,0 +1,171 @@
+"""
+Tests for the bootstrap and permutation tests in utils.resampling, checked
+against scipy statistics on the same resamples and shuffles.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import bootstrap, chi2_contingency, pearsonr, spearmanr
+
+from utils.resampling import (
+    _STATISTICS,
+    _prepare,
+    bootstrap_ci,
+    bootstrap_distribution,
+    permutation_chi_square,
+)
+
+
+@pytest.fixture
+def effect_df():
+    rng = np.random.default_rng(3)
+    n = 150
+    gdp = rng.lognormal(9, 1, n)
+    co2 = 0.5 * np.log(gdp) + rng.normal(0, 0.6, n)
+    labels = ["Low", "Medium", "High"]
+    category = pd.cut(gdp, [0, 5_000, 15_000, np.inf], labels=labels)
+    strength = np.where(
+        rng.random(n) < np.where(gdp > 15_000, 0.6, 0.3), "Law", "Pledge"
+    )
+    df = pd.DataFrame(
+        {
+            "GDP": gdp,
+            "CO2": np.round(co2, 1),  # ties for the rank statistic
+            "GDP_Category": category,
+            "Strength": strength,
+        }
+    )
+    df.loc[::29, "CO2"] = np.nan
+    return df
+
+
+def _eta_squared(values, codes):
+    groups = [values[codes == k] for k in np.unique(codes)]
+    grand = values.mean()
+    between = sum(len(g) * (g.mean() - grand) ** 2 for g in groups)
+    return between / ((values - grand) ** 2).sum()
+
+
+def _table(rows, cols):
+    """Contingency table of two integer code arrays (observed levels only)."""
+    _, rows = np.unique(rows, return_inverse=True)
+    _, cols = np.unique(cols, return_inverse=True)
+    n_rows, n_cols = rows.max() + 1, cols.max() + 1
+    counts = np.bincount(rows * n_cols + cols, minlength=n_rows * n_cols)
+    return counts.reshape(n_rows, n_cols)
+
+
+def _cramers_v(rows, cols):
+    table = _table(rows, cols)
+    statistic = chi2_contingency(table, correction=False)[0]
+    return np.sqrt(statistic / (len(rows) * (min(table.shape) - 1)))
+
+
+REFERENCES = {
+    "pearson_r": (("GDP", "CO2"), lambda x, y: pearsonr(x, y).statistic),
+    "spearman_rho": (("GDP", "CO2"), lambda x, y: spearmanr(x, y).statistic),
+    "r_squared": (("GDP", "CO2"), lambda x, y: pearsonr(x, y).statistic ** 2),
+    "eta_squared": (("CO2", "GDP_Category"), _eta_squared),
+    "cramers_v": (("GDP_Category", "Strength"), _cramers_v),
+}
+
+
+@pytest.mark.parametrize("statistic", sorted(REFERENCES))
+def test_resampled_statistics_match_scipy(effect_df, statistic):
+    columns, reference = REFERENCES[statistic]
+    arrays, params = _prepare(effect_df, statistic, columns)
+    rng = np.random.default_rng(5)
+    idx = rng.integers(0, len(arrays[0]), size=(20, len(arrays[0])))
+
+    values = _STATISTICS[statistic](arrays, idx, **params)
+
+    expected = [reference(*(a[row] for a in arrays)) for row in idx]
+    np.testing.assert_allclose(values, expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("statistic", sorted(REFERENCES))
+def test_bootstrap_ci_estimate_and_interval(effect_df, statistic):
+    columns, reference = REFERENCES[statistic]
+    ci = bootstrap_ci(effect_df, statistic, columns, resamples=4_000, seed=9)
+    arrays, _ = _prepare(effect_df, statistic, columns)
+
+    assert ci["n"] == len(arrays[0])
+    assert ci["estimate"] == pytest.approx(reference(*arrays), rel=1e-10)
+    assert ci["ci_lower"] < ci["ci_upper"]
+
+    scipy_ci = bootstrap(
+        arrays,
+        reference,
+        paired=True,
+        vectorized=False,
+        n_resamples=4_000,
+        method="percentile",
+        random_state=np.random.default_rng(9),
+    )
+    # Different draws: the bounds agree to within Monte Carlo error
+    low, high = scipy_ci.confidence_interval
+    tolerance = 0.25 * scipy_ci.standard_error
+    assert ci["std_error"] == pytest.approx(scipy_ci.standard_error, rel=0.1)
+    assert ci["ci_lower"] == pytest.approx(low, abs=tolerance)
+    assert ci["ci_upper"] == pytest.approx(high, abs=tolerance)
+
+
+def test_bootstrap_is_deterministic_per_seed(effect_df):
+    arrays, params = _prepare(effect_df, "pearson_r", ("GDP", "CO2"))
+
+    first = bootstrap_distribution("pearson_r", arrays, params, 500, seed=1)
+    np.testing.assert_array_equal(
+        first, bootstrap_distribution("pearson_r", arrays, params, 500, seed=1)
+    )
+    assert not np.array_equal(
+        first, bootstrap_distribution("pearson_r", arrays, params, 500, seed=2)
+    )
+
+
+def test_bootstrap_ci_validates_input(effect_df):
+    with pytest.raises(ValueError):
+        bootstrap_ci(effect_df, "kendall_tau", ("GDP", "CO2"))
+    with pytest.raises(KeyError):
+        bootstrap_ci(effect_df, "pearson_r", ("GDP", "Missing"))
+    assert bootstrap_ci(effect_df.head(2), "pearson_r", ("GDP", "CO2")) is None
+
+
+def test_permutation_chi_square_matches_scipy(effect_df):
+    result = permutation_chi_square(
+        effect_df, "GDP_Category", "Strength", permutations=5_000, seed=4
+    )
+    data = effect_df[["GDP_Category", "Strength"]].dropna()
+    table = pd.crosstab(data["GDP_Category"], data["Strength"])
+    statistic, _, _, expected = chi2_contingency(table, correction=False)
+
+    assert result["n"] == len(data)
+    assert result["chi2_statistic"] == pytest.approx(statistic, rel=1e-12)
+    assert result["min_expected"] == pytest.approx(expected.min())
+    v = np.sqrt(statistic / (len(data) * (min(table.shape) - 1)))
+    assert result["cramers_v"] == pytest.approx(v, rel=1e-12)
+
+    # Reference null distribution from explicit shuffles of the column labels
+    rng = np.random.default_rng(0)
+    rows = pd.factorize(data["GDP_Category"])[0]
+    cols = pd.factorize(data["Strength"])[0]
+    null = np.array(
+        [
+            chi2_contingency(_table(rows, rng.permutation(cols)), correction=False)[0]
+            for _ in range(2_000)
+        ]
+    )
+    reference_p = (1 + np.sum(null >= statistic - 1e-9)) / (1 + len(null))
+    reference_se = np.sqrt(reference_p * (1 - reference_p) / len(null))
+    spread = np.hypot(result["p_value_se"], reference_se)
+    assert abs(result["p_value"] - reference_p) < 4 * spread
+
+
+def test_permutation_p_value_is_bounded_and_deterministic():
+    # Perfect association: no shuffle reaches the observed statistic
+    df = pd.DataFrame({"a": ["x", "y"] * 50, "b": ["u", "v"] * 50})
+    result = permutation_chi_square(df, "a", "b", permutations=999, seed=1)
+
+    assert result["p_value"] == pytest.approx(1 / 1_000)
+    assert result == permutation_chi_square(df, "a", "b", permutations=999, seed=1)
+    assert permutation_chi_square(df.assign(b="u"), "a", "b") is None
@@ -0,0 +1,105 @@
+"""
+Tests for the GDP threshold sweeps in utils.sensitivity, checked cell by
+cell against pd.cut buckets and scipy's chi-square and one-way ANOVA.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import chi2_contingency, f_oneway
+
+from utils.sensitivity import (
+    anova_threshold_sweep,
+    chi_square_threshold_sweep,
+    threshold_grid,
+)
+
+
+@pytest.fixture
+def sweep_df():
+    rng = np.random.default_rng(11)
+    # Rounded, so some rows tie with the fixed $5,000 / $15,000 thresholds
+    gdp = np.round(rng.lognormal(9, 1.2, 400), -2)
+    legal = np.where(rng.random(400) < 0.2 + 0.5 * (gdp > 15_000), "Yes", "No")
+    co2 = 0.3 * np.log(gdp) + rng.normal(0, 1, 400)
+    df = pd.DataFrame({"GDP": gdp, "Legal": legal, "CO2": co2})
+    df.loc[::41, "Legal"] = None
+    return df
+
+
+def _buckets(gdp, low, high):
+    return pd.cut(gdp, [-np.inf, low, high, np.inf], labels=["Low", "Medium", "High"])
+
+
+def _cells(size, rng, count=25):
+    return [tuple(sorted(rng.choice(size, 2, replace=False))) for _ in range(count)]
+
+
+def test_threshold_grid_spans_quantiles():
+    values = np.array([np.nan, -1.0, 0.0, *range(1, 101)])
+    grid = threshold_grid(values, size=10, quantiles=(0.1, 0.9))
+
+    assert len(grid) == 10 and np.all(np.diff(grid) > 0)
+    assert grid[[0, -1]] == pytest.approx(np.quantile(np.arange(1, 101), [0.1, 0.9]))
+    assert len(threshold_grid([np.nan, 0.0])) == 0
+
+
+def test_chi_square_sweep_matches_scipy(sweep_df):
+    thresholds = np.concatenate([threshold_grid(sweep_df["GDP"], 20), [5_000, 15_000]])
+    thresholds = np.unique(thresholds)
+    sweep = chi_square_threshold_sweep(sweep_df, "GDP", "Legal", tuple(thresholds))
+    data = sweep_df.dropna()
+
+    assert sweep["n"] == len(data)
+    cells = _cells(len(thresholds), np.random.default_rng(0))
+    cells.append(tuple(np.searchsorted(thresholds, [5_000, 15_000])))
+    for i, j in cells:
+        buckets = _buckets(data["GDP"], thresholds[i], thresholds[j])
+        table = pd.crosstab(buckets, data["Legal"])
+        table = table[table.sum(axis=1) > 0]
+        if len(table) < 2:
+            assert np.isnan(sweep["chi2_statistic"][i, j])
+            continue
+        statistic, p_value, _, expected = chi2_contingency(table, correction=False)
+
+        assert sweep["chi2_statistic"][i, j] == pytest.approx(statistic, rel=1e-10)
+        assert sweep["p_value"][i, j] == pytest.approx(p_value, rel=1e-8, abs=1e-300)
+        assert sweep["min_expected"][i, j] == pytest.approx(expected.min())
+        v = np.sqrt(statistic / (len(data) * (min(table.shape) - 1)))
+        assert sweep["cramers_v"][i, j] == pytest.approx(v, rel=1e-10)
+
+
+def test_anova_sweep_matches_scipy(sweep_df):
+    thresholds = np.unique(threshold_grid(sweep_df["GDP"], 20))
+    sweep = anova_threshold_sweep(sweep_df, "GDP", "CO2", tuple(thresholds))
+
+    for i, j in _cells(len(thresholds), np.random.default_rng(1)):
+        groups = [
+            values.to_numpy()
+            for _, values in sweep_df.groupby(
+                _buckets(sweep_df["GDP"], thresholds[i], thresholds[j]), observed=True
+            )["CO2"]
+        ]
+        reference = f_oneway(*groups)
+
+        f_stat, p_value = sweep["f_statistic"][i, j], sweep["p_value"][i, j]
+        assert f_stat == pytest.approx(reference.statistic, rel=1e-9)
+        assert p_value == pytest.approx(reference.pvalue, rel=1e-7, abs=1e-300)
+        assert sweep["min_group_size"][i, j] == min(len(g) for g in groups)
+
+
+def test_pairs_with_low_not_below_high_are_nan(sweep_df):
+    thresholds = tuple(threshold_grid(sweep_df["GDP"], 8))
+    chi = chi_square_threshold_sweep(sweep_df, "GDP", "Legal", thresholds)
+    anova = anova_threshold_sweep(sweep_df, "GDP", "CO2", thresholds)
+
+    lower = np.tril(np.ones((8, 8), dtype=bool))
+    assert np.isnan(chi["p_value"][lower]).all()
+    assert np.isnan(anova["f_statistic"][lower]).all()
+    assert np.isfinite(chi["p_value"][~lower]).all()
+
+
+def test_single_level_outcome_returns_none(sweep_df):
+    constant = sweep_df.assign(Legal="Yes")
+    thresholds = (1_000.0, 10_000.0)
+    assert chi_square_threshold_sweep(constant, "GDP", "Legal", thresholds) is None
@@ -0,0 +1,82 @@
+"""
+Tests for sanitize_df_for_display in utils.styling: the conversions the
+original per-column implementation made for object columns.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.styling import sanitize_df_for_display
+
+
+@pytest.fixture
+def mixed_df():
+    return pd.DataFrame(
+        {
+            "numbers": pd.Series([1, 2.5, None, np.inf], dtype=object),
+            "numeric_text": pd.Series(["1", "2.5", None, "n/a"], dtype=object),
+            "dates": pd.Series(
+                ["2020-01-01", "2021-06-15", None, "2022-12-31"], dtype=object
+            ),
+            "timestamps": pd.Series(
+                list(pd.to_datetime(["2020-01-01", None, "2021-01-01", "2022-01-01"])),
+                dtype=object,
+            ),
+            "nested": pd.Series(
+                [[1, 2], {"target": "2050"}, None, ["ü"]], dtype=object
+            ),
+            "mixed": pd.Series(["France", 3, None, ("a", 1)], dtype=object),
+            "names": pd.Series(["France", "India", None, "Chile"], dtype=object),
+            "floats": np.array([1.5, np.nan, 3.0, 4.0], dtype="float32"),
+            "category": pd.Categorical(["Low", "High", "Low", None]),
+        }
+    )
+
+
+def test_object_columns_are_converted_like_before(mixed_df):
+    result = sanitize_df_for_display(mixed_df)
+
+    # Numbers (and numeric text) become numeric, with inf and junk as NaN
+    np.testing.assert_array_equal(result["numbers"], [1.0, 2.5, np.nan, np.nan])
+    np.testing.assert_array_equal(result["numeric_text"], [1.0, 2.5, np.nan, np.nan])
+
+    # Date strings and timestamps become datetime64, missing values NaT
+    expected_dates = pd.to_datetime(["2020-01-01", "2021-06-15", None, "2022-12-31"])
+    assert pd.api.types.is_datetime64_any_dtype(result["dates"])
+    assert result["dates"].tolist() == expected_dates.tolist()
+    assert pd.api.types.is_datetime64_any_dtype(result["timestamps"])
+    expected_stamps = pd.to_datetime(["2020-01-01", None, "2021-01-01", "2022-01-01"])
+    assert result["timestamps"].tolist() == expected_stamps.tolist()
+
+    # Lists / dicts are JSON, other values str(), missing values None
+    assert result["nested"].tolist() == [
+        "[1, 2]",
+        json.dumps({"target": "2050"}),
+        None,
+        '["ü"]',
+    ]
+    assert result["mixed"].tolist() == ["France", "3", None, "('a', 1)"]
+
+
+def test_arrow_safe_columns_are_untouched(mixed_df):
+    result = sanitize_df_for_display(mixed_df)
+
+    # Pure strings are already Arrow-safe: same values, None kept
+    assert result["names"].tolist() == ["France", "India", None, "Chile"]
+    for column in ("floats", "category"):
+        pd.testing.assert_series_equal(result[column], mixed_df[column])
+
+
+def test_input_is_not_modified(mixed_df):
+    before = mixed_df.copy(deep=True)
+    sanitize_df_for_display(mixed_df)
+
+    pd.testing.assert_frame_equal(mixed_df, before)
+
+
+def test_frame_without_conversions_is_returned_as_is(mixed_df):
+    safe = mixed_df[["names", "floats", "category"]]
+    assert sanitize_df_for_display(safe) is safe
@@ -10,6 +10,11 @@ from .data_loader import (
     format_large_number,
 )
 
+from .bundle import (
+    AnalysisBundle,
+    load_analysis_bundle,
+)
+
 from .styling import (
     get_custom_css,
     get_plotly_theme,
@@ -30,6 +35,8 @@ __all__ = [
     "create_commitment_strength",
     "get_latest_year_data",
     "format_large_number",
+    "AnalysisBundle",
+    "load_analysis_bundle",
     "get_custom_css",
     "get_plotly_theme",
     "create_metric_card_html",
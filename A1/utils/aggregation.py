@@ -0,0 +1,192 @@
+"""
+Server-side aggregation for CarbonSeer distribution and summary charts.
+
+px.histogram, px.box and px.bar ship every raw row to the browser and let
+Plotly bin or compute quartiles client-side, so the figure payload grows with
+the filtered data. The functions here compute the summaries in vectorised
+NumPy instead (one sort / bincount pass over all groups at once), so charts
+built from them grow with the number of groups and bins, not rows:
+
+- histogram_bins: equal-width bin counts, optionally per group
+- box_statistics: quartiles, Tukey whiskers (1.5 x IQR), means and outliers
+- group_means: mean and count per group
+
+utils.charts turns these summaries into compact go.Bar / go.Box traces.
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Whisker reach in IQRs, matching Plotly's and matplotlib's default boxes
+WHISKER_IQR = 1.5
+
+BOX_STAT_COLUMNS = (
+    "n", "q1", "median", "q3", "mean", "lowerfence", "upperfence", "outliers"
+)
+
+
+def _as_list(by: Union[str, Sequence[str], None]) -> List[str]:
+    if by is None:
+        return []
+    if isinstance(by, str):
+        return [by]
+    return list(dict.fromkeys(c for c in by if c is not None))
+
+
+def _group_codes(
+    df: pd.DataFrame, by: List[str]
+) -> Tuple[np.ndarray, pd.Index]:
+    """Return dense group codes per row and the group keys in code order."""
+    if not by:
+        return np.zeros(len(df), dtype=np.intp), pd.Index([None])
+    grouped = df.groupby(by, observed=True, sort=True)
+    return grouped.ngroup().to_numpy(), grouped.size().index
+
+
+def _keys_frame(keys: pd.Index, by: List[str]) -> pd.DataFrame:
+    if not by:
+        return pd.DataFrame(index=range(len(keys)))
+    return keys.to_frame(index=False, name=by if len(by) > 1 else by[0])
+
+
+def histogram_bins(
+    df: pd.DataFrame,
+    column: str,
+    nbins: int = 30,
+    by: Union[str, Sequence[str], None] = None,
+) -> pd.DataFrame:
+    """
+    Count values of a numeric column in equal-width bins.
+
+    All groups share the same bin edges (computed over every finite value),
+    so per-group counts can be stacked.
+
+    Args:
+        df: Source frame
+        column: Numeric column to bin
+        nbins: Number of bins
+        by: Optional grouping column(s), e.g. the colour column
+
+    Returns:
+        pd.DataFrame: One row per (group, bin) with the group columns plus
+        bin_left, bin_right and count
+    """
+    by = _as_list(by)
+    data = df.dropna(subset=[column] + by)
+    values = data[column].to_numpy(dtype=np.float64)
+    finite = np.isfinite(values)
+    data, values = data[finite], values[finite]
+    codes, keys = _group_codes(data, by)
+
+    if len(values):
+        edges = np.histogram_bin_edges(values, bins=nbins)
+    else:
+        edges = np.linspace(0.0, 1.0, nbins + 1)
+    # Right-closed last bin, as np.histogram does
+    bin_index = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, nbins - 1)
+    counts = np.bincount(
+        codes * nbins + bin_index, minlength=len(keys) * nbins
+    ).reshape(len(keys), nbins)
+
+    result = _keys_frame(keys, by).loc[np.repeat(np.arange(len(keys)), nbins)]
+    return result.reset_index(drop=True).assign(
+        bin_left=np.tile(edges[:-1], len(keys)),
+        bin_right=np.tile(edges[1:], len(keys)),
+        count=counts.ravel(),
+    )
+
+
+def box_statistics(
+    df: pd.DataFrame, column: str, by: Union[str, Sequence[str], None] = None
+) -> pd.DataFrame:
+    """
+    Compute box-plot statistics per group in one sorted pass.
+
+    Quartiles use linear interpolation (NumPy's and Plotly's default);
+    whiskers extend to the most extreme values within WHISKER_IQR x IQR of
+    the box, and values beyond them are returned as outliers.
+
+    Args:
+        df: Source frame
+        column: Numeric column to summarise
+        by: Optional grouping column(s), e.g. the x-axis and colour columns
+
+    Returns:
+        pd.DataFrame: One row per group with the group columns plus n, q1,
+        median, q3, mean, lowerfence, upperfence and outliers (array)
+    """
+    by = _as_list(by)
+    data = df.dropna(subset=[column] + by)
+    if data.empty:
+        return pd.DataFrame(columns=by + list(BOX_STAT_COLUMNS))
+    codes, keys = _group_codes(data, by)
+    values = data[column].to_numpy(dtype=np.float64)
+
+    order = np.lexsort((values, codes))
+    values, codes = values[order], codes[order]
+    sizes = np.bincount(codes, minlength=len(keys))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    def _quantile(p: float) -> np.ndarray:
+        position = starts + (sizes - 1) * p
+        lower = np.floor(position).astype(np.intp)
+        upper = np.ceil(position).astype(np.intp)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    q1, median, q3 = _quantile(0.25), _quantile(0.5), _quantile(0.75)
+    reach = WHISKER_IQR * (q3 - q1)
+    inside = (values >= (q1 - reach)[codes]) & (values <= (q3 + reach)[codes])
+
+    # Values are sorted within each group, so reduceat finds whisker ends
+    lowerfence = np.minimum.reduceat(np.where(inside, values, np.inf), starts)
+    upperfence = np.maximum.reduceat(np.where(inside, values, -np.inf), starts)
+    outlier_counts = np.bincount(codes[~inside], minlength=len(keys))
+    outliers = np.split(values[~inside], np.cumsum(outlier_counts)[:-1])
+
+    return _keys_frame(keys, by).assign(
+        n=sizes,
+        q1=q1,
+        median=median,
+        q3=q3,
+        mean=np.bincount(codes, weights=values, minlength=len(keys)) / sizes,
+        lowerfence=lowerfence,
+        upperfence=upperfence,
+        outliers=outliers,
+    )
+
+
+def group_means(
+    df: pd.DataFrame, column: str, by: Union[str, Sequence[str]]
+) -> pd.DataFrame:
+    """
+    Mean and count of a numeric column per group.
+
+    Args:
+        df: Source frame
+        column: Numeric column to average
+        by: Grouping column(s)
+
+    Returns:
+        pd.DataFrame: One row per group with the group columns plus mean and count
+    """
+    by = _as_list(by)
+    data = df.dropna(subset=[column] + by)
+    codes, keys = _group_codes(data, by)
+    values = data[column].to_numpy(dtype=np.float64)
+    counts = np.bincount(codes, minlength=len(keys))
+    sums = np.bincount(codes, weights=values, minlength=len(keys))
+    return _keys_frame(keys, by).assign(mean=sums / counts, count=counts)
+
+
+def value_counts(
+    df: pd.DataFrame, column: str, by: Optional[str] = None
+) -> pd.DataFrame:
+    """Row counts per value of a (categorical) column, optionally per group."""
+    by = _as_list(by)
+    columns = list(dict.fromkeys([column] + by))
+    codes, keys = _group_codes(df.dropna(subset=columns), columns)
+    counts = np.bincount(codes, minlength=len(keys))
+    return _keys_frame(keys, columns).assign(count=counts)
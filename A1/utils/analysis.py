@@ -2,12 +2,16 @@
 Statistical analysis utilities for the CarbonSeer Streamlit dashboard.
 
 This module provides comprehensive statistical functions for:
-- Correlation analysis (Pearson and Spearman)
-- ANOVA and pairwise comparisons
+- Exact correlation analysis (Pearson and Spearman), streamed over the full data
+  in bounded memory or per year in one batched pass
+- Per-year OLS fits and confidence bands for trendlines
+- ANOVA and pairwise comparisons from per-group moments, with multiple-comparison corrections
 - Chi-square tests of independence
 - Normality testing
 
 All computationally intensive functions use @st.cache_data for performance optimization.
+DataFrame arguments are keyed by their utils.fingerprint token, so frames from
+the analysis bundle (and Panel slices of them) are never rehashed per call.
 """
 
 import pandas as pd
@@ -15,123 +19,394 @@ import numpy as np
 import streamlit as st
 from typing import Dict, Tuple, Optional
 from scipy.stats import (
-    pearsonr,
-    spearmanr,
+    f as f_dist,
     f_oneway,
-    ttest_ind,
     chi2_contingency,
     shapiro,
+    t as t_dist,
 )
 
+from .fingerprint import FINGERPRINT_HASH_FUNCS, arrays_token
 
-def _mean_sem_ci(
-    arr: np.ndarray, alpha: float = 0.05
-) -> Tuple[float, float, float, float]:
+
+# z-score for the normal-approximation 95% confidence interval of group means
+MEAN_CI_Z = 1.96
+
+P_ADJUST_METHODS = ("bonferroni", "holm", "fdr_bh")
+
+
+def group_moments(
+    df: pd.DataFrame, value_col: str, group_col: str, z: float = MEAN_CI_Z
+) -> pd.DataFrame:
     """
-    Calculate mean, standard error, and 95% confidence interval for an array.
+    Sufficient statistics per group in a single groupby pass.
 
     Args:
-        arr: Input array of numeric values
-        alpha: Significance level (default: 0.05 for 95% CI)
+        df: Input dataframe with grouping and value columns
+        value_col: Column name containing numeric values
+        group_col: Column name containing group membership
+        z: z-score for the mean confidence interval (default: 1.96, ~95%)
 
     Returns:
-        Tuple of (mean, standard_error, ci_lower, ci_upper)
+        pd.DataFrame: One row per non-empty group (in group order) with
+        columns n, mean, var (ddof=1), sem, ci_lower and ci_upper
 
     Note:
-        Uses z-score of 1.96 for 95% confidence interval (approximation).
-        Removes NaN values before calculation.
+        Missing values are ignored. Values are aggregated in float64 whatever
+        their stored dtype, so float32 metric columns give the same moments
+        as scipy. Single-observation groups have NaN variance and a SEM of 0.
+    """
+    values = df[value_col].astype("float64")
+    moments = (
+        values.groupby(df[group_col], observed=True, sort=True)
+        .agg(["count", "mean", "var"])
+        .rename(columns={"count": "n"})
+    )
+    moments = moments[moments["n"] > 0].astype({"n": np.int64})
+    sem = np.sqrt(moments["var"] / moments["n"]).where(moments["n"] > 1, 0.0)
+    return moments.assign(
+        sem=sem,
+        ci_lower=moments["mean"] - z * sem,
+        ci_upper=moments["mean"] + z * sem,
+    )
+
+
+def adjust_p_values(p_values, method: str = "holm") -> np.ndarray:
+    """
+    Adjust p-values for multiple comparisons.
+
+    Args:
+        p_values: Array-like of raw p-values (NaNs are kept and not counted)
+        method: "bonferroni", "holm" (step-down, family-wise error rate) or
+            "fdr_bh" (Benjamini-Hochberg false discovery rate)
+
+    Returns:
+        np.ndarray: Adjusted p-values, capped at 1, in the input order
+
+    Raises:
+        ValueError: If method is not one of P_ADJUST_METHODS
     """
-    arr = np.array(arr)
-    arr = arr[~np.isnan(arr)]
-    n = len(arr)
+    if method not in P_ADJUST_METHODS:
+        raise ValueError(f"Unknown p-value adjustment: {method!r}")
+
+    p = np.asarray(p_values, dtype=np.float64)
+    adjusted = np.full_like(p, np.nan)
+    finite = np.flatnonzero(np.isfinite(p))
+    m = len(finite)
+    if m == 0:
+        return adjusted
+
+    values = p[finite]
+    if method == "bonferroni":
+        adjusted[finite] = np.minimum(values * m, 1.0)
+        return adjusted
+
+    order = np.argsort(values, kind="stable")
+    ranked = values[order]
+    if method == "holm":
+        # (m - i) * p_(i), made monotone non-decreasing from the smallest p
+        steps = np.maximum.accumulate((m - np.arange(m)) * ranked)
+    else:
+        # m / i * p_(i), made monotone non-increasing from the largest p
+        steps = np.minimum.accumulate((m / np.arange(1, m + 1) * ranked)[::-1])[::-1]
+    result = np.empty(m)
+    result[order] = np.minimum(steps, 1.0)
+    adjusted[finite] = result
+    return adjusted
 
-    if n == 0:
-        return (np.nan, np.nan, np.nan, np.nan)
 
-    mean = arr.mean()
-    sem = arr.std(ddof=1) / np.sqrt(n) if n > 1 else 0.0
-    z = 1.96  # Approximately 95% confidence interval
-    lower = mean - z * sem
-    upper = mean + z * sem
+def _correlation_p_value(r, dof):
+    """Two-sided p-value of a correlation coefficient (t test, dof = n - 2)."""
+    r = np.asarray(r, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+    p = 2 * t_dist.sf(np.abs(t_stat), dof)
+    return np.where(np.abs(r) == 1.0, 0.0, p)
 
-    return mean, sem, lower, upper
 
+# Rows per chunk when streaming pairs through the correlation engine
+CORRELATION_CHUNK_ROWS = 1_000_000
 
-@st.cache_data
+
+def _complete_chunks(x, y, chunk_rows: int):
+    """Yield float64 (x, y) chunks of complete pairs, one chunk at a time."""
+    for start in range(0, len(x), chunk_rows):
+        cx = np.asarray(x[start : start + chunk_rows], dtype=np.float64)
+        cy = np.asarray(y[start : start + chunk_rows], dtype=np.float64)
+        valid = ~(np.isnan(cx) | np.isnan(cy))
+        yield cx[valid], cy[valid]
+
+
+class _CoMoments:
+    """
+    Running co-moments of paired values.
+
+    Each chunk's centred sums are merged into the totals with the pairwise
+    update of Chan, Golub & LeVeque, which is numerically stable in a single
+    pass.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.xx = self.yy = self.xy = 0.0
+
+    def update(self, cx: np.ndarray, cy: np.ndarray) -> None:
+        chunk_n = len(cx)
+        if chunk_n == 0:
+            return
+        chunk_mean_x, chunk_mean_y = cx.mean(), cy.mean()
+        dx, dy = cx - chunk_mean_x, cy - chunk_mean_y
+        delta_x, delta_y = chunk_mean_x - self.mean_x, chunk_mean_y - self.mean_y
+        total = self.n + chunk_n
+        weight = self.n * chunk_n / total
+
+        self.xx += dx @ dx + delta_x * delta_x * weight
+        self.yy += dy @ dy + delta_y * delta_y * weight
+        self.xy += dx @ dy + delta_x * delta_y * weight
+        self.mean_x += delta_x * chunk_n / total
+        self.mean_y += delta_y * chunk_n / total
+        self.n = total
+
+    def r(self) -> float:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return float(np.clip(self.xy / np.sqrt(self.xx * self.yy), -1.0, 1.0))
+
+
+class _RankTable:
+    """
+    Distinct values and their counts, merged chunk by chunk.
+
+    average_ranks maps values to 1-based ranks with ties sharing their
+    average rank, as scipy.stats.rankdata does, from the merged table alone.
+    """
+
+    def __init__(self):
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def update(self, chunk: np.ndarray) -> None:
+        values, inverse = np.unique(
+            np.concatenate([self.values, chunk]), return_inverse=True
+        )
+        weights = np.concatenate([self.counts, np.ones(len(chunk), dtype=np.int64)])
+        self.values = values
+        self.counts = np.bincount(inverse, weights=weights).astype(np.int64)
+
+    def average_ranks(self, chunk: np.ndarray) -> np.ndarray:
+        below = np.cumsum(self.counts) - self.counts
+        ranks = below + (self.counts + 1) / 2.0
+        return ranks[np.searchsorted(self.values, chunk)]
+
+
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS)
 def compute_correlations(
-    df: pd.DataFrame, x_col: str, y_col: str, sample_limit: int = 5000
+    df: pd.DataFrame, x_col: str, y_col: str, chunk_rows: int = CORRELATION_CHUNK_ROWS
 ) -> Optional[Dict]:
     """
-    Compute Pearson and Spearman correlations between two variables.
+    Compute exact Pearson and Spearman correlations over every complete pair.
+
+    Nothing is sampled. The pairs are streamed in chunks of chunk_rows:
 
-    This function computes both parametric (Pearson) and non-parametric (Spearman)
-    correlations, providing robust correlation estimates. Large datasets are sampled
-    to maintain statistical stability and computational efficiency.
+    1. One pass accumulates the Pearson co-moments and, per column, a table
+       of distinct values and counts
+    2. A rank pass maps each chunk to average ranks from those tables and
+       accumulates the same co-moments on the ranks (Spearman's rho)
+
+    Only one float64 chunk per column is materialised at a time; besides
+    that, memory is bounded by the number of distinct values per column.
+    P-values use the t distribution with n - 2 degrees of freedom, matching
+    scipy's two-sided tests.
 
     Args:
         df: Input dataframe containing both variables
         x_col: Column name for first variable
         y_col: Column name for second variable
-        sample_limit: Maximum sample size for correlation computation (default: 5000)
+        chunk_rows: Rows per streamed chunk
 
     Returns:
         Dict with keys:
-        - pearson_r: Pearson correlation coefficient (-1 to 1)
-        - pearson_p: P-value for Pearson correlation
-        - spearman_rho: Spearman rank correlation coefficient
-        - spearman_p: P-value for Spearman correlation
-        - r_squared: R² value (coefficient of determination) for Pearson
-        - n: Sample size used in computation
-        Returns None if no valid data pairs exist
+        - pearson_r, pearson_p: Pearson correlation and p-value
+        - spearman_rho, spearman_p: Spearman correlation and p-value
+        - r_squared: Square of pearson_r
+        - n: Number of complete pairs used
+        Returns None if fewer than 3 complete pairs exist
 
     Raises:
         KeyError: If x_col or y_col not found in dataframe
 
-    Note:
-        Both columns must contain numeric data. Missing values (NaN) are
-        automatically removed. If sample_limit is exceeded, a random sample
-        is drawn with fixed seed (42) for reproducibility.
-
     Example:
-        >>> results = compute_correlations(df, 'GDP_per_capita', 'CO2_emissions')
-        >>> print(f"Pearson r = {results['pearson_r']:.3f}, p = {results['pearson_p']:.4f}")
+        >>> pooled = compute_correlations(merged_df, 'GDP_per_capita', 'CO2_emissions')
+        >>> print(f"r = {pooled['pearson_r']:.3f} over {pooled['n']:,} pairs")
     """
-    # Validate columns exist
-    if x_col not in df.columns or y_col not in df.columns:
-        missing = [c for c in [x_col, y_col] if c not in df.columns]
+    missing = [c for c in [x_col, y_col] if c not in df.columns]
+    if missing:
         raise KeyError(f"Column(s) not found in dataframe: {missing}")
 
-    # Extract and clean data
-    clean = df[[x_col, y_col]].dropna()
+    x = df[x_col].to_numpy()
+    y = df[y_col].to_numpy()
 
-    if len(clean) == 0:
+    pearson = _CoMoments()
+    x_ranks, y_ranks = _RankTable(), _RankTable()
+    for cx, cy in _complete_chunks(x, y, chunk_rows):
+        pearson.update(cx, cy)
+        x_ranks.update(cx)
+        y_ranks.update(cy)
+    if pearson.n < 3:
         return None
 
-    # Sample if necessary to maintain computational efficiency
-    if len(clean) > sample_limit:
-        sample = clean.sample(sample_limit, random_state=42)
-    else:
-        sample = clean
-
-    x = sample[x_col].values
-    y = sample[y_col].values
-
-    # Compute correlations
-    pearson_r, pearson_p = pearsonr(x, y)
-    spearman_rho, spearman_p = spearmanr(x, y)
-    r_squared = pearson_r**2
+    spearman = _CoMoments()
+    for cx, cy in _complete_chunks(x, y, chunk_rows):
+        spearman.update(x_ranks.average_ranks(cx), y_ranks.average_ranks(cy))
 
+    pearson_r, spearman_rho = pearson.r(), spearman.r()
     return {
-        "pearson_r": float(pearson_r),
-        "pearson_p": float(pearson_p),
-        "spearman_rho": float(spearman_rho),
-        "spearman_p": float(spearman_p),
-        "r_squared": float(r_squared),
-        "n": len(sample),
+        "pearson_r": pearson_r,
+        "pearson_p": float(_correlation_p_value(pearson_r, pearson.n - 2)),
+        "spearman_rho": spearman_rho,
+        "spearman_p": float(_correlation_p_value(spearman_rho, pearson.n - 2)),
+        "r_squared": pearson_r**2,
+        "n": int(pearson.n),
     }
 
 
-@st.cache_data
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS)
+def compute_yearly_correlations(
+    df: pd.DataFrame, x_col: str, y_col: str, group_col: str = "Year"
+) -> pd.DataFrame:
+    """
+    Compute Pearson and Spearman correlations and OLS fits for every group in one pass.
+
+    Instead of calling pearsonr/spearmanr once per year, the per-group
+    moments are computed with a single groupby: values are centred on their
+    group means, and r is the ratio of summed cross-products. Spearman's rho
+    is the same computation on within-group average ranks, which is exactly
+    what scipy.stats.spearmanr does. P-values use the t distribution with
+    n - 2 degrees of freedom, matching scipy's two-sided tests.
+
+    The same centred sums give the least-squares fit of y on x per group
+    (slope, intercept and residual standard error), so trendlines and their
+    confidence bands (see ols_confidence_band) need no per-render regression.
+
+    Args:
+        df: Input dataframe containing both variables and the grouping column
+        x_col: Column name for first variable
+        y_col: Column name for second variable
+        group_col: Column to group by (default: "Year")
+
+    Returns:
+        pd.DataFrame indexed by group with columns:
+        - n: Number of complete (x, y) pairs
+        - pearson_r, pearson_p: Pearson correlation and p-value
+        - spearman_rho, spearman_p: Spearman correlation and p-value
+        - r_squared: Square of pearson_r
+        - slope, intercept: OLS fit of y_col on x_col
+        - x_mean, x_ss: Mean and centred sum of squares of x_col
+        - residual_se: Residual standard error of the fit (n - 2 dof)
+        Groups with fewer than 3 pairs have NaN statistics.
+
+    Raises:
+        KeyError: If x_col, y_col or group_col not found in dataframe
+
+    Example:
+        >>> yearly = compute_yearly_correlations(df, 'GDP_per_capita', 'CO2_emissions')
+        >>> print(yearly.loc[2020, 'pearson_r'])
+    """
+    missing = [c for c in [x_col, y_col, group_col] if c not in df.columns]
+    if missing:
+        raise KeyError(f"Column(s) not found in dataframe: {missing}")
+
+    clean = df[[group_col, x_col, y_col]].dropna()
+    keys = clean[group_col].to_numpy()
+    x = clean[x_col].to_numpy(dtype=np.float64)
+    y = clean[y_col].to_numpy(dtype=np.float64)
+
+    frame = pd.DataFrame({"g": keys, "x": x, "y": y})
+    grouped = frame.groupby("g", sort=True, observed=True)
+    frame["rx"] = grouped["x"].rank(method="average")
+    frame["ry"] = grouped["y"].rank(method="average")
+
+    def _centred_sums(a: str, b: str) -> pd.DataFrame:
+        da = frame[a] - grouped[a].transform("mean")
+        db = frame[b] - grouped[b].transform("mean")
+        return (
+            pd.DataFrame({"ab": da * db, "aa": da * da, "bb": db * db, "g": frame["g"]})
+            .groupby("g", sort=True, observed=True)
+            .sum()
+        )
+
+    def _r(sums: pd.DataFrame) -> pd.Series:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            r = sums["ab"] / np.sqrt(sums["aa"] * sums["bb"])
+        return r.clip(-1.0, 1.0)
+
+    n = grouped.size()
+    xy_sums = _centred_sums("x", "y")
+    pearson_r = _r(xy_sums)
+    spearman_rho = _r(_centred_sums("rx", "ry"))
+
+    means = grouped[["x", "y"]].mean()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = xy_sums["ab"] / xy_sums["aa"]
+        residual_ss = (xy_sums["bb"] - slope * xy_sums["ab"]).clip(lower=0.0)
+        residual_se = np.sqrt(residual_ss / (n - 2))
+
+    def _two_sided_p(r: pd.Series) -> np.ndarray:
+        return _correlation_p_value(r.to_numpy(), (n - 2).to_numpy(dtype=np.float64))
+
+    result = pd.DataFrame(
+        {
+            "n": n.astype(int),
+            "pearson_r": pearson_r,
+            "pearson_p": _two_sided_p(pearson_r),
+            "spearman_rho": spearman_rho,
+            "spearman_p": _two_sided_p(spearman_rho),
+        }
+    )
+    result["r_squared"] = result["pearson_r"] ** 2
+    result["slope"] = slope
+    result["intercept"] = means["y"] - slope * means["x"]
+    result["x_mean"] = means["x"]
+    result["x_ss"] = xy_sums["aa"]
+    result["residual_se"] = residual_se
+    result.loc[result["n"] < 3, result.columns.drop("n")] = np.nan
+    result.index.name = group_col
+    return result
+
+
+def ols_confidence_band(
+    fit: Dict, x: np.ndarray, confidence: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate a fitted line and its confidence band for the mean response.
+
+    Args:
+        fit: One row of compute_yearly_correlations (as a dict or Series)
+            with n, slope, intercept, x_mean, x_ss and residual_se
+        x: Points at which to evaluate the fit
+        confidence: Confidence level of the band (default: 0.95)
+
+    Returns:
+        Tuple of (fitted values, lower bound, upper bound) at x
+
+    Example:
+        >>> fit = yearly.loc[2020]
+        >>> grid = np.linspace(x.min(), x.max(), 100)
+        >>> y_hat, lower, upper = ols_confidence_band(fit, grid)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = float(fit["n"])
+    y_hat = fit["intercept"] + fit["slope"] * x
+    t_crit = t_dist.ppf(0.5 + confidence / 2, n - 2)
+    half_width = (
+        t_crit
+        * fit["residual_se"]
+        * np.sqrt(1.0 / n + (x - fit["x_mean"]) ** 2 / fit["x_ss"])
+    )
+    return y_hat, y_hat - half_width, y_hat + half_width
+
+
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS)
 def compute_anova_and_pairwise(
     df: pd.DataFrame, value_col: str, group_col: str
 ) -> Tuple[Optional[float], Optional[float], pd.DataFrame]:
@@ -143,6 +418,11 @@ def compute_anova_and_pairwise(
     2. Pairwise Welch t-tests (does not assume equal variances)
     3. Cohen's d effect sizes for each pairwise comparison
     4. 95% confidence intervals for group means
+    5. Bonferroni, Holm and Benjamini-Hochberg adjusted p-values
+
+    Group moments (n, mean, variance) are computed once with group_moments;
+    the ANOVA and every pairwise statistic are array operations on them, so
+    the cost is one pass over the rows plus O(groups²) arithmetic.
 
     Args:
         df: Input dataframe with grouping and value columns
@@ -153,7 +433,9 @@ def compute_anova_and_pairwise(
         Tuple of (f_statistic, p_value, pairwise_results_df)
         - f_statistic: F-statistic from ANOVA
         - p_value: P-value from ANOVA
-        - pairwise_results_df: DataFrame with pairwise comparison results
+        - pairwise_results_df: DataFrame with one row per pair of groups:
+          t_stat, df (Welch-Satterthwaite), p_value, cohen_d, group means,
+          sizes and CIs, and p_bonferroni / p_holm / p_fdr_bh
 
     Raises:
         KeyError: If value_col or group_col not found in dataframe
@@ -175,78 +457,86 @@ def compute_anova_and_pairwise(
         missing = [c for c in [value_col, group_col] if c not in df.columns]
         raise KeyError(f"Column(s) not found in dataframe: {missing}")
 
-    # Extract groups and filter empty ones
-    groups = df.groupby(group_col)[value_col].apply(lambda s: s.dropna().values)
-    groups = {k: v for k, v in groups.items() if len(v) > 0}
-
-    if len(groups) < 2:
+    # Per-group n, mean and variance in one pass; everything else derives from them
+    moments = group_moments(df, value_col, group_col)
+    k = len(moments)
+    if k < 2:
         return None, None, pd.DataFrame()
 
-    # Perform one-way ANOVA
-    anova_stat, anova_p = f_oneway(*[groups[k] for k in groups])
-
-    # Pairwise Welch t-tests with effect sizes
-    rows = []
-    keys = list(groups.keys())
-    from itertools import combinations
-
-    for group_a, group_b in combinations(keys, 2):
-        data1 = groups[group_a]
-        data2 = groups[group_b]
-
-        # Welch's t-test (does not assume equal variances)
-        t_stat, p_val = ttest_ind(data1, data2, equal_var=False)
-
-        # Calculate Cohen's d using pooled standard deviation
-        n1 = len(data1)
-        n2 = len(data2)
-        m1 = np.mean(data1)
-        m2 = np.mean(data2)
-        s1 = np.std(data1, ddof=1)
-        s2 = np.std(data2, ddof=1)
-
-        try:
-            pooled_sd = np.sqrt(((n1 - 1) * s1**2 + (n2 - 1) * s2**2) / (n1 + n2 - 2))
-            cohen_d = (m1 - m2) / pooled_sd if pooled_sd > 0 else np.nan
-        except Exception:
-            cohen_d = np.nan
-
-        # Calculate confidence intervals
-        mean1, sem1, l1, u1 = _mean_sem_ci(data1)
-        mean2, sem2, l2, u2 = _mean_sem_ci(data2)
-
-        rows.append(
-            {
-                "group1": group_a,
-                "group2": group_b,
-                "t_stat": float(t_stat),
-                "p_value": float(p_val),
-                "cohen_d": float(cohen_d) if not np.isnan(cohen_d) else np.nan,
-                "mean1": float(mean1),
-                "mean2": float(mean2),
-                "n1": int(n1),
-                "n2": int(n2),
-                "ci1_lower": float(l1),
-                "ci1_upper": float(u1),
-                "ci2_lower": float(l2),
-                "ci2_upper": float(u2),
-            }
+    n = moments["n"].to_numpy(dtype=np.float64)
+    mean = moments["mean"].to_numpy()
+    var = moments["var"].to_numpy()
+    ss_within_groups = np.where(n > 1, (n - 1) * var, 0.0)
+
+    # One-way ANOVA from the moments (same F as scipy's f_oneway)
+    total = n.sum()
+    grand_mean = (n * mean).sum() / total
+    ss_between = (n * (mean - grand_mean) ** 2).sum()
+    ss_within = ss_within_groups.sum()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        anova_stat = (ss_between / (k - 1)) / (ss_within / (total - k))
+    anova_p = f_dist.sf(anova_stat, k - 1, total - k)
+
+    # All pairs at once, in combinations() order
+    i, j = np.triu_indices(k, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Welch t-test (does not assume equal variances)
+        var_mean_i = var[i] / n[i]
+        var_mean_j = var[j] / n[j]
+        se2 = var_mean_i + var_mean_j
+        t_stat = (mean[i] - mean[j]) / np.sqrt(se2)
+        welch_df = se2**2 / (
+            var_mean_i**2 / (n[i] - 1) + var_mean_j**2 / (n[j] - 1)
+        )
+        p_val = 2 * t_dist.sf(np.abs(t_stat), welch_df)
+
+        # Cohen's d using the pooled standard deviation
+        pooled_sd = np.sqrt(
+            (ss_within_groups[i] + ss_within_groups[j]) / (n[i] + n[j] - 2)
         )
+        cohen_d = np.where(pooled_sd > 0, (mean[i] - mean[j]) / pooled_sd, np.nan)
+
+    # Plain labels, as the per-pair loop this replaced produced
+    keys = moments.index.astype(object)
+    pairwise_df = pd.DataFrame(
+        {
+            "group1": keys[i],
+            "group2": keys[j],
+            "t_stat": t_stat,
+            "df": welch_df,
+            "p_value": p_val,
+            "cohen_d": cohen_d,
+            "mean1": mean[i],
+            "mean2": mean[j],
+            "n1": moments["n"].to_numpy()[i],
+            "n2": moments["n"].to_numpy()[j],
+            "ci1_lower": moments["ci_lower"].to_numpy()[i],
+            "ci1_upper": moments["ci_upper"].to_numpy()[i],
+            "ci2_lower": moments["ci_lower"].to_numpy()[j],
+            "ci2_upper": moments["ci_upper"].to_numpy()[j],
+        }
+    )
+    for method in P_ADJUST_METHODS:
+        pairwise_df[f"p_{method}"] = adjust_p_values(p_val, method)
 
-    pairwise_df = pd.DataFrame(rows)
     return float(anova_stat), float(anova_p), pairwise_df
 
 
-@st.cache_data
-def perform_anova_test(groups: list) -> Dict:
+def perform_anova_test(groups: list, token: Optional[str] = None) -> Dict:
     """
     Perform one-way ANOVA test on multiple groups.
 
     This function performs a standard one-way ANOVA and calculates
     eta-squared as a measure of effect size (proportion of variance explained).
 
+    Results are cached per token, so the group arrays themselves are never
+    hashed on a cache lookup when a token is passed.
+
     Args:
         groups: List of arrays, one for each group (each containing numeric values)
+        token: Fingerprint of the groups, e.g.
+            derive_token(panel.token, "anova", value_col, year) (default:
+            a hash of the arrays' contents)
 
     Returns:
         Dict with keys:
@@ -265,11 +555,19 @@ def perform_anova_test(groups: list) -> Dict:
         >>> results = perform_anova_test([group1, group2])
         >>> print(f"F={results['f_statistic']:.3f}, η²={results['eta_squared']:.3f}")
     """
-    if len(groups) < 2:
+    if token is None:
+        token = arrays_token(groups)
+    return _anova_test(token, groups)
+
+
+# Keyed by the token alone: Streamlit does not hash underscore-prefixed arguments
+@st.cache_data
+def _anova_test(token: str, _groups: list) -> Dict:
+    if len(_groups) < 2:
         return {"f_statistic": np.nan, "p_value": np.nan, "eta_squared": np.nan}
 
     # Filter out empty groups
-    valid_groups = [g for g in groups if len(g) > 0]
+    valid_groups = [g for g in _groups if len(g) > 0]
     if len(valid_groups) < 2:
         return {"f_statistic": np.nan, "p_value": np.nan, "eta_squared": np.nan}
 
@@ -290,7 +588,7 @@ def perform_anova_test(groups: list) -> Dict:
     }
 
 
-@st.cache_data
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS)
 def perform_chi_square_test(contingency_table: "pd.DataFrame | np.ndarray") -> Dict:
     """
     Perform chi-square test of independence on a contingency table.
@@ -0,0 +1,152 @@
+"""
+Prebuilt dataset artifacts for the CarbonSeer Streamlit dashboard.
+
+`python -m utils.build_artifacts` runs the whole data_loader pipeline ahead of
+deploy and writes every raw and derived table as an uncompressed Arrow IPC
+file under ``artifacts/v<ARTIFACT_VERSION>/``. At startup the bundle loader
+memory-maps those files instead of parsing CSVs and running pandas joins.
+
+A manifest records the content hash of each source CSV, so artifacts built
+from older data are ignored rather than served.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+from .data_loader import CACHE_SCHEMA_VERSION, SOURCE_FILES, _file_digest
+
+
+# Bump whenever the set of tables or their derivation changes
+ARTIFACT_VERSION = 1
+ARTIFACTS_ROOT = Path(__file__).parent.parent / "artifacts"
+ARTIFACTS_DIR = ARTIFACTS_ROOT / f"v{ARTIFACT_VERSION}"
+MANIFEST_NAME = "manifest.json"
+
+# Tables persisted for every AnalysisBundle frame; the indexed panels are
+# rebuilt from them when the bundle is assembled
+ARTIFACT_TABLES = ("gdp", "co2", "netzero", "merged", "categorized", "commitment")
+
+
+def source_digests() -> Dict[str, Optional[str]]:
+    """Return the content hash of each local source CSV (None if missing)."""
+    return {
+        name: _file_digest(path) if path.exists() else None
+        for name, path in SOURCE_FILES.items()
+    }
+
+
+def write_artifacts(
+    tables: Dict[str, pd.DataFrame], out_dir: Path = ARTIFACTS_DIR
+) -> Path:
+    """
+    Write tables as Arrow IPC files plus a manifest.
+
+    Files are written uncompressed so they can be memory-mapped. The manifest
+    is written last, so a partially written directory is never considered
+    valid by read_artifacts.
+
+    Args:
+        tables: Mapping of table name -> DataFrame (see ARTIFACT_TABLES)
+        out_dir: Target directory (default: versioned directory under artifacts/)
+
+    Returns:
+        Path: Path of the written manifest
+    """
+    import pyarrow as pa
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+    manifest_path.unlink(missing_ok=True)
+
+    files = {}
+    for name in ARTIFACT_TABLES:
+        table = pa.Table.from_pandas(tables[name], preserve_index=False)
+        path = out_dir / f"{name}.arrow"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        files[name] = {"file": path.name, "rows": table.num_rows}
+
+    manifest = {
+        "artifact_version": ARTIFACT_VERSION,
+        "cache_schema_version": CACHE_SCHEMA_VERSION,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sources": source_digests(),
+        "tables": files,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return manifest_path
+
+
+def read_manifest(out_dir: Path = ARTIFACTS_DIR) -> Optional[Dict]:
+    """Return the parsed manifest, or None if it is missing or unreadable."""
+    try:
+        return json.loads((out_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def artifacts_are_fresh(manifest: Optional[Dict]) -> bool:
+    """
+    Check that a manifest matches this code version and the local CSVs.
+
+    Source files that are absent locally (e.g. a deploy without CSVs) are not
+    treated as stale.
+    """
+    if not manifest:
+        return False
+    if manifest.get("artifact_version") != ARTIFACT_VERSION:
+        return False
+    if manifest.get("cache_schema_version") != CACHE_SCHEMA_VERSION:
+        return False
+    recorded = manifest.get("sources", {})
+    for name, digest in source_digests().items():
+        if digest is not None and recorded.get(name) != digest:
+            return False
+    return True
+
+
+def read_artifacts(
+    out_dir: Path = ARTIFACTS_DIR, check_sources: bool = True
+) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Memory-map prebuilt artifacts and return them as DataFrames.
+
+    Numeric columns without nulls are exposed zero-copy over the mapped
+    files, so they are read-only; copy a frame before mutating it.
+
+    Args:
+        out_dir: Artifact directory (default: versioned directory under artifacts/)
+        check_sources: Reject artifacts whose manifest does not match the local CSVs
+
+    Returns:
+        Dict of table name -> DataFrame, or None if artifacts are missing,
+        stale, or pyarrow is unavailable
+    """
+    manifest = read_manifest(out_dir)
+    if manifest is None:
+        return None
+    if check_sources and not artifacts_are_fresh(manifest):
+        return None
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    tables = {}
+    try:
+        for name in ARTIFACT_TABLES:
+            source = pa.memory_map(str(out_dir / manifest["tables"][name]["file"]))
+            table = pa.ipc.open_file(source).read_all()
+            tables[name] = table.to_pandas(split_blocks=True)
+    except (OSError, KeyError, pa.ArrowException):
+        return None
+    return tables
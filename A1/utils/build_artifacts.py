@@ -0,0 +1,94 @@
+"""
+Build-time CLI that materialises every CarbonSeer table ahead of deploy.
+
+Usage (from the A1 directory):
+
+    python -m utils.build_artifacts            # rebuild artifacts
+    python -m utils.build_artifacts --if-stale # only rebuild when sources changed
+    python -m utils.build_artifacts --check    # exit 1 if artifacts are stale
+    python -m utils.build_artifacts --memory-report
+
+Runs the full data_loader pipeline (load, merge, categorise, score) and
+writes versioned Arrow artifacts that the bundle loader memory-maps at
+startup.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from .artifacts import (
+    ARTIFACTS_DIR,
+    artifacts_are_fresh,
+    read_manifest,
+    write_artifacts,
+)
+from .bundle import run_pipeline
+from .data_loader import dataset_memory_report
+
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m utils.build_artifacts``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.build_artifacts",
+        description="Materialise CarbonSeer datasets as memory-mappable artifacts.",
+    )
+    parser.add_argument(
+        "--source",
+        default="local",
+        choices=["auto", "local", "github"],
+        help="Where to read the source CSVs from (default: local)",
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=ARTIFACTS_DIR,
+        help=f"Artifact directory (default: {ARTIFACTS_DIR})",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--if-stale",
+        action="store_true",
+        help="Skip the build when existing artifacts match the source CSVs",
+    )
+    mode.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report whether artifacts are fresh (exit code 1 if stale)",
+    )
+    mode.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Compare dataset memory with and without the typed read schemas",
+    )
+    args = parser.parse_args(argv)
+
+    if args.memory_report:
+        report = dataset_memory_report()
+        print(report.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+        return 0
+
+    fresh = artifacts_are_fresh(read_manifest(args.out_dir))
+    if args.check:
+        print(f"Artifacts in {args.out_dir} are {'fresh' if fresh else 'stale'}")
+        return 0 if fresh else 1
+    if args.if_stale and fresh:
+        print(f"Artifacts in {args.out_dir} are fresh; nothing to do")
+        return 0
+
+    start = time.perf_counter()
+    tables, timings = run_pipeline(args.source)
+    manifest_path = write_artifacts(tables, args.out_dir)
+    elapsed = time.perf_counter() - start
+
+    for name, df in tables.items():
+        print(f"  {name:<12} {len(df):>7,} rows")
+    for step, seconds in timings.items():
+        print(f"  {step:<12} {seconds:>7.3f}s")
+    print(f"Wrote {manifest_path} in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Shared analysis bundle for the CarbonSeer Streamlit pages.
+
+Home, Analysis and Data Explorer all need the same raw datasets and the same
+derived tables. Instead of each page running the merge/categorise pipeline
+behind its own @st.cache_data entry (which pickles the result and hands every
+caller a fresh deep copy), the bundle is built once per process and stored
+with @st.cache_resource, so all pages and sessions share the same objects.
+The gdp, co2, commitment and categorized tables are also indexed once as
+utils.panel.Panel objects, which the pages slice by Country and Year.
+
+When ``python -m utils.build_artifacts`` has been run, the bundle is
+memory-mapped from prebuilt Arrow files instead of being recomputed.
+
+The frames in a bundle are shared: callers must treat them as read-only and
+copy before mutating.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from .data_loader import (
+    load_gdp_data,
+    load_co2_data,
+    load_netzero_data,
+    merge_gdp_co2,
+    create_gdp_categories,
+    create_commitment_strength,
+)
+from .artifacts import read_artifacts
+from .fingerprint import register_frame
+from .panel import Panel
+
+
+# Datasets the pages slice by Country and Year
+PANEL_TABLES = ("gdp", "co2", "commitment", "categorized")
+
+
+def _uncached(func):
+    """Return the undecorated function behind an @st.cache_data wrapper."""
+    return getattr(func, "__wrapped__", func)
+
+
+@dataclass(frozen=True)
+class AnalysisBundle:
+    """
+    Immutable container for every dataset the dashboard pages use.
+
+    Attributes:
+        gdp: Raw GDP per capita dataset
+        co2: Raw CO2 emissions per capita dataset
+        netzero: Raw net-zero targets dataset
+        merged: GDP and CO2 inner-joined on Country and Year
+        categorized: Merged dataset with the GDP_Category column
+        commitment: Net-zero dataset with Commitment_Strength scores
+        panels: Read-only mapping of dataset name ("gdp", "co2",
+            "commitment", "categorized") -> indexed Panel for slicing by
+            Country and Year
+        load_timings: Wall-clock seconds per load step (per source, derive,
+            or "artifacts" when memory-mapped)
+    """
+
+    gdp: pd.DataFrame
+    co2: pd.DataFrame
+    netzero: pd.DataFrame
+    merged: pd.DataFrame
+    categorized: pd.DataFrame
+    commitment: pd.DataFrame
+    panels: Mapping[str, Panel]
+    load_timings: Mapping[str, float]
+
+
+def load_sources_parallel(
+    source: str = "auto",
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, float]]:
+    """
+    Fetch and parse the three source datasets concurrently.
+
+    Each loader runs in its own thread: network fetches, file reads and the
+    pandas/pyarrow parsers all release the GIL, so startup latency is that
+    of the slowest source rather than the sum of all three.
+
+    Args:
+        source: "auto" (local then GitHub), "local", or "github"
+
+    Returns:
+        Tuple of (frames, timings): frames keyed "gdp", "co2", "netzero" and
+        the wall-clock seconds each load took
+
+    Raises:
+        Whatever the first failing loader raised (e.g. FileNotFoundError)
+    """
+    loaders = {
+        "gdp": _uncached(load_gdp_data),
+        "co2": _uncached(load_co2_data),
+        "netzero": _uncached(load_netzero_data),
+    }
+
+    def _timed(loader):
+        start = time.perf_counter()
+        frame = loader(source)
+        return frame, time.perf_counter() - start
+
+    with ThreadPoolExecutor(
+        max_workers=len(loaders), thread_name_prefix="carbonseer-load"
+    ) as pool:
+        futures = {name: pool.submit(_timed, loader) for name, loader in loaders.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    frames = {name: frame for name, (frame, _) in results.items()}
+    timings = {name: elapsed for name, (_, elapsed) in results.items()}
+    return frames, timings
+
+
+def run_pipeline(
+    source: str = "auto",
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, float]]:
+    """
+    Load the raw datasets and derive every table the pages use.
+
+    Sources are loaded concurrently (see load_sources_parallel). The pipeline
+    steps are called without their @st.cache_data wrappers so the
+    intermediate frames are not pickled into a second cache.
+
+    Args:
+        source: "auto" (local then GitHub), "local", or "github"
+
+    Returns:
+        Tuple of (tables, timings): tables keyed like the AnalysisBundle
+        fields, and per-step wall-clock seconds
+    """
+    frames, timings = load_sources_parallel(source)
+
+    start = time.perf_counter()
+    merged = _uncached(merge_gdp_co2)(frames["gdp"], frames["co2"])
+    categorized = _uncached(create_gdp_categories)(merged)
+    commitment = _uncached(create_commitment_strength)(frames["netzero"])
+    timings["derive"] = time.perf_counter() - start
+
+    tables = {
+        **frames,
+        "merged": merged,
+        "categorized": categorized,
+        "commitment": commitment,
+    }
+    return tables, timings
+
+
+def _assemble_bundle(
+    tables: Dict[str, pd.DataFrame], timings: Dict[str, float]
+) -> AnalysisBundle:
+    """
+    Build an AnalysisBundle (including indexed panels) from pipeline tables.
+
+    Every table is fingerprinted once here, so cached analysis functions
+    never have to hash the bundle's frames again.
+    """
+    tables = dict(tables)
+    panels = {}
+    for name in PANEL_TABLES:
+        panels[name] = Panel(tables[name])
+        # Share the panel's (Country, Year)-sorted frame instead of keeping both
+        tables[name] = panels[name].frame
+    for name, df in tables.items():
+        if name not in panels:
+            register_frame(df)
+    return AnalysisBundle(
+        panels=MappingProxyType(panels),
+        load_timings=MappingProxyType(dict(timings)),
+        **tables,
+    )
+
+
+def build_analysis_bundle(source: str = "auto") -> AnalysisBundle:
+    """
+    Assemble an AnalysisBundle, preferring prebuilt artifacts.
+
+    For local sources, fresh artifacts written by ``python -m
+    utils.build_artifacts`` are memory-mapped so no CSV parsing or pandas
+    joins happen at startup. Otherwise the full pipeline runs, loading the
+    three sources in parallel.
+
+    Args:
+        source: "auto" (local then GitHub), "local", or "github"
+
+    Returns:
+        AnalysisBundle: All raw and derived datasets
+    """
+    if source in ("auto", "local"):
+        start = time.perf_counter()
+        tables = read_artifacts()
+        if tables is not None:
+            return _assemble_bundle(
+                tables, {"artifacts": time.perf_counter() - start}
+            )
+
+    return _assemble_bundle(*run_pipeline(source))
+
+
+@st.cache_resource(show_spinner=False)
+def load_analysis_bundle(source: str = "auto") -> AnalysisBundle:
+    """
+    Return the process-wide AnalysisBundle for a data source.
+
+    Stored with @st.cache_resource, so every page receives the same object
+    without the per-access copy that @st.cache_data performs.
+
+    Args:
+        source: "auto" (local then GitHub), "local", or "github"
+
+    Returns:
+        AnalysisBundle: Shared, read-only datasets
+
+    Example:
+        >>> bundle = load_analysis_bundle("auto")
+        >>> panel = bundle.panels["categorized"]
+        >>> latest = panel.year(panel.years[-1])
+    """
+    return build_analysis_bundle(source)
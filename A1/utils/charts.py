@@ -0,0 +1,574 @@
+"""
+Chart-data reduction for large Plotly scatter and line charts.
+
+Sending every filtered row to px.scatter / px.line makes the figure JSON (and
+the browser's SVG rendering) grow with the data. This module bounds both:
+
+- above WEBGL_THRESHOLD points, traces switch to WebGL (scattergl)
+- scatters above MAX_SCATTER_POINTS are density-binned: points are bucketed
+  on a grid per colour group and one real point is kept per occupied cell,
+  with the number of points it stands for shown on hover
+- lines above MAX_LINE_POINTS are reduced per series (per country by
+  default) with Largest-Triangle-Three-Buckets (LTTB), which keeps peaks,
+  troughs and turning points
+
+Histogram, box and bar charts are built from summaries computed server-side
+by utils.aggregation, so their payload grows with bins and groups, not rows.
+Box charts whose groups are too small to summarise plot the raw points.
+
+Every builder returns the figure together with a ChartReduction describing
+how many points were drawn, so pages can show the reduction ratio.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from .aggregation import box_statistics, group_means, histogram_bins, value_counts
+
+
+# Point counts above which traces use WebGL / data is reduced
+WEBGL_THRESHOLD = 5_000
+MAX_SCATTER_POINTS = 10_000
+MAX_LINE_POINTS = 10_000
+
+# Finest density grid (cells per axis) tried for skewed scatters
+MAX_DENSITY_BINS = 2048
+
+# Each line keeps at least this many points after LTTB
+MIN_POINTS_PER_SERIES = 24
+
+# Hover label for the number of raw points behind a density-binned marker
+CELL_COUNT_COLUMN = "Points in cell"
+
+# Values sent per summarised box (q1, median, q3, mean and both fences), and
+# the median group size below which box charts plot the raw points instead
+BOX_SUMMARY_VALUES = 6
+MIN_BOX_GROUP_SIZE = 6
+
+
+@dataclass(frozen=True)
+class ChartReduction:
+    """How much a chart's data was reduced before plotting."""
+
+    original_points: int
+    shown_points: int
+    method: str
+    webgl: bool
+
+    @property
+    def ratio(self) -> float:
+        """Fraction of the original points that are drawn (1.0 = all)."""
+        if self.original_points == 0:
+            return 1.0
+        return self.shown_points / self.original_points
+
+    @property
+    def reduced(self) -> bool:
+        return self.shown_points < self.original_points
+
+    def describe(self) -> str:
+        """One-line summary for a caption under the chart."""
+        text = f"Showing {self.shown_points:,} of {self.original_points:,} points"
+        if self.reduced:
+            text += f" ({self.ratio:.1%}, {self.method})"
+        if self.webgl:
+            text += " · WebGL"
+        return text
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select n_out points of a line with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the next bucket's centroid.
+
+    Args:
+        x: Sorted x values (numeric, no NaNs)
+        y: y values aligned with x (no NaNs)
+        n_out: Number of points to keep
+
+    Returns:
+        np.ndarray: Sorted positions of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # n_out - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    anchor = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_start = stop
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+        area = np.abs(
+            (x[anchor] - avg_x) * (y[start:stop] - y[anchor])
+            - (x[anchor] - x[start:stop]) * (avg_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(area))
+        kept[i + 1] = anchor
+    return kept
+
+
+def _grid_cells(values: np.ndarray, bins: int) -> np.ndarray:
+    lo, hi = values.min(), values.max()
+    if not hi > lo:
+        return np.zeros(len(values), dtype=np.int64)
+    cells = ((values - lo) / (hi - lo) * bins).astype(np.int64)
+    return np.minimum(cells, bins - 1)
+
+
+def density_sample(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int = MAX_SCATTER_POINTS,
+    groups: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Keep one representative point per occupied grid cell.
+
+    The grid is refined until about max_points cells are occupied, so sparse
+    regions keep every point while dense clusters collapse to one marker.
+
+    Args:
+        x: Numeric x values (no NaNs)
+        y: Numeric y values (no NaNs)
+        max_points: Approximate number of cells per group
+        groups: Optional integer group codes (e.g. colour), binned separately
+
+    Returns:
+        Tuple of (sorted positions of kept points, raw points per kept point)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    def _occupied(bins):
+        cells = _grid_cells(x, bins) * bins + _grid_cells(y, bins)
+        if groups is not None:
+            cells += np.asarray(groups, dtype=np.int64) * bins * bins
+        return np.unique(cells, return_index=True, return_counts=True)[1:]
+
+    # Skewed data leaves most cells empty, so refine the grid while the
+    # occupied cells still fit comfortably in the point budget
+    bins = max(int(np.sqrt(max_points)), 1)
+    first, counts = _occupied(bins)
+    while bins < MAX_DENSITY_BINS:
+        finer_first, finer_counts = _occupied(bins * 2)
+        if len(finer_first) > max_points:
+            break
+        bins, first, counts = bins * 2, finer_first, finer_counts
+
+    order = np.argsort(first)
+    return first[order], counts[order]
+
+
+def _plottable(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Drop rows where any plotted column is missing (Plotly skips them)."""
+    return df.dropna(subset=[c for c in dict.fromkeys(columns) if c is not None])
+
+
+def reduce_scatter_data(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    color: Optional[str] = None,
+    max_points: int = MAX_SCATTER_POINTS,
+) -> Tuple[pd.DataFrame, ChartReduction]:
+    """
+    Density-bin scatter data when it exceeds max_points.
+
+    Binning only applies when both axes are numeric; the returned frame then
+    carries a CELL_COUNT_COLUMN with the raw points behind each marker.
+    """
+    data = _plottable(df, [x, y, color])
+    original = len(data)
+    numeric = pd.api.types.is_numeric_dtype(data[x]) and pd.api.types.is_numeric_dtype(
+        data[y]
+    )
+    if original <= max_points or not numeric:
+        reduction = ChartReduction(
+            original, original, "none", original > WEBGL_THRESHOLD
+        )
+        return data, reduction
+
+    groups = pd.factorize(data[color])[0] if color else None
+    positions, counts = density_sample(
+        data[x].to_numpy(), data[y].to_numpy(), max_points, groups
+    )
+    reduced = data.iloc[positions].assign(**{CELL_COUNT_COLUMN: counts})
+    reduction = ChartReduction(
+        original, len(reduced), "density binning", len(reduced) > WEBGL_THRESHOLD
+    )
+    return reduced, reduction
+
+
+def reduce_line_data(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    series: Optional[List[str]] = None,
+    max_points: int = MAX_LINE_POINTS,
+) -> Tuple[pd.DataFrame, ChartReduction]:
+    """
+    Sort line data by (series, x) and LTTB-reduce it to max_points.
+
+    Rows of each series come back contiguous and in x order. The point budget
+    is shared evenly across series, with at least MIN_POINTS_PER_SERIES per
+    series. Non-numeric axes are sorted but not reduced.
+    """
+    series = list(dict.fromkeys(c for c in (series or []) if c is not None))
+    data = _plottable(df, [x, y] + series)
+    original = len(data)
+    numeric = pd.api.types.is_numeric_dtype(data[x]) and pd.api.types.is_numeric_dtype(
+        data[y]
+    )
+    if series:
+        keys = data.groupby(series, observed=True, sort=True).ngroup().to_numpy()
+    else:
+        keys = np.zeros(original, dtype=np.intp)
+
+    # Sort once by (series, x); each series is then a contiguous block
+    x_sort = data[x].to_numpy() if numeric else pd.factorize(data[x], sort=True)[0]
+    order = np.lexsort((x_sort, keys))
+    if original <= max_points or not numeric:
+        reduction = ChartReduction(
+            original, original, "none", original > WEBGL_THRESHOLD
+        )
+        return data.iloc[order], reduction
+
+    x_values = data[x].to_numpy(dtype=np.float64)[order]
+    y_values = data[y].to_numpy(dtype=np.float64)[order]
+    keys = keys[order]
+    bounds = np.flatnonzero(np.diff(keys)) + 1
+    starts = np.concatenate(([0], bounds))
+    stops = np.concatenate((bounds, [original]))
+
+    per_series = max(max_points // len(starts), MIN_POINTS_PER_SERIES)
+    kept = [
+        start + lttb_indices(x_values[start:stop], y_values[start:stop], per_series)
+        for start, stop in zip(starts, stops)
+    ]
+    reduced = data.iloc[order[np.concatenate(kept)]]
+    reduction = ChartReduction(
+        original, len(reduced), "LTTB", len(reduced) > WEBGL_THRESHOLD
+    )
+    return reduced, reduction
+
+
+def scatter_figure(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    color: Optional[str] = None,
+    hover_data: Optional[List[str]] = None,
+    max_points: int = MAX_SCATTER_POINTS,
+    **px_kwargs,
+) -> Tuple[go.Figure, ChartReduction]:
+    """
+    Build a px.scatter figure with density binning and automatic WebGL.
+
+    Args:
+        df: Source frame
+        x, y: Axis columns
+        color: Optional colour column
+        hover_data: Extra hover columns
+        max_points: Density-binning threshold
+        **px_kwargs: Passed through to px.scatter (title, height, ...)
+
+    Returns:
+        Tuple of (figure, ChartReduction)
+    """
+    data, reduction = reduce_scatter_data(df, x, y, color, max_points)
+    hover = list(hover_data or [])
+    if CELL_COUNT_COLUMN in data.columns:
+        hover.append(CELL_COUNT_COLUMN)
+    fig = px.scatter(
+        data,
+        x=x,
+        y=y,
+        color=color,
+        hover_data=hover or None,
+        render_mode="webgl" if reduction.webgl else "svg",
+        **px_kwargs,
+    )
+    return fig, reduction
+
+
+def _with_breaks(values: np.ndarray, breaks: np.ndarray) -> np.ndarray:
+    """Insert a gap (None) before each break position so lines are not joined."""
+    return np.insert(values.astype(object), breaks, None)
+
+
+def line_figure(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    color: Optional[str] = None,
+    line_group: Optional[str] = None,
+    max_points: int = MAX_LINE_POINTS,
+    title: Optional[str] = None,
+    height: Optional[int] = None,
+) -> Tuple[go.Figure, ChartReduction]:
+    """
+    Build a line figure with per-series LTTB and automatic WebGL.
+
+    Unlike px.line, which emits one trace per line, all lines of a colour
+    share a single trace with gaps between them, so figure size and render
+    time do not grow with the number of countries.
+
+    Args:
+        df: Source frame
+        x, y: Axis columns
+        color: Optional colour column (one trace and legend entry per value)
+        line_group: Optional column drawing one line per value (e.g. Country)
+        max_points: LTTB threshold for the whole chart
+        title: Figure title
+        height: Figure height in pixels
+
+    Returns:
+        Tuple of (figure, ChartReduction)
+    """
+    data, reduction = reduce_line_data(df, x, y, [color, line_group], max_points)
+    trace_type = go.Scattergl if reduction.webgl else go.Scatter
+    colour_groups = (
+        data.groupby(color, observed=True, sort=False) if color else [(None, data)]
+    )
+
+    fig = go.Figure()
+    for name, group in colour_groups:
+        breaks = np.array([], dtype=np.intp)
+        text = None
+        if line_group:
+            lines = group[line_group].to_numpy()
+            breaks = np.flatnonzero(lines[1:] != lines[:-1]) + 1
+            text = _with_breaks(lines, breaks)
+        fig.add_trace(
+            trace_type(
+                x=_with_breaks(group[x].to_numpy(), breaks),
+                y=_with_breaks(group[y].to_numpy(), breaks),
+                text=text,
+                mode="lines",
+                name=str(name) if color else y,
+                showlegend=bool(color),
+                hovertemplate=(
+                    ("%{text}<br>" if line_group else "")
+                    + f"{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>"
+                ),
+            )
+        )
+    fig.update_layout(
+        title=title,
+        height=height,
+        xaxis_title=x,
+        yaxis_title=y,
+        legend_title_text=color,
+    )
+    return fig, reduction
+
+
+def _axis_values(series: pd.Series) -> list:
+    """Plain Python values for a go trace axis (categoricals as their labels)."""
+    return series.astype(object).tolist()
+
+
+def _colour_groups(summary: pd.DataFrame, color: Optional[str]):
+    if color:
+        return summary.groupby(color, observed=True, sort=False)
+    return [(None, summary)]
+
+
+def histogram_figure(
+    df: pd.DataFrame,
+    x: str,
+    color: Optional[str] = None,
+    nbins: int = 30,
+    title: Optional[str] = None,
+    height: Optional[int] = None,
+) -> Tuple[go.Figure, ChartReduction]:
+    """
+    Build a histogram from server-side bin counts (stacked per colour).
+
+    Non-numeric columns are drawn as a bar chart of value counts.
+    """
+    if not pd.api.types.is_numeric_dtype(df[x]):
+        return bar_figure(df, x, None, title=title, height=height)
+
+    bins = histogram_bins(df, x, nbins, by=color)
+    fig = go.Figure()
+    for name, group in _colour_groups(bins, color):
+        left = group["bin_left"].to_numpy()
+        right = group["bin_right"].to_numpy()
+        fig.add_trace(
+            go.Bar(
+                x=(left + right) / 2,
+                y=group["count"].to_numpy(),
+                width=right - left,
+                customdata=np.column_stack([left, right]),
+                name=str(name) if color else x,
+                showlegend=bool(color),
+                hovertemplate=(
+                    "%{customdata[0]:.4g} – %{customdata[1]:.4g}<br>"
+                    "count=%{y}<extra></extra>"
+                ),
+            )
+        )
+    fig.update_layout(
+        title=title,
+        height=height,
+        barmode="stack",
+        bargap=0,
+        xaxis_title=x,
+        yaxis_title="count",
+        legend_title_text=color,
+    )
+    reduction = ChartReduction(
+        int(bins["count"].sum()), len(bins), "server-side binning", False
+    )
+    return fig, reduction
+
+
+def box_figure(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    color: Optional[str] = None,
+    title: Optional[str] = None,
+    height: Optional[int] = None,
+) -> Tuple[go.Figure, ChartReduction]:
+    """
+    Build box plots from precomputed quartiles, whiskers and outliers.
+
+    Each box is sent as its summary statistics; only Tukey outliers are sent
+    as individual points. When the groups are small (median size under
+    MIN_BOX_GROUP_SIZE) or the summaries would not be smaller than the data,
+    the raw points are plotted instead.
+    """
+    stats = box_statistics(df, y, by=[x, color])
+    original = int(stats["n"].sum())
+    summary_values = len(stats) * BOX_SUMMARY_VALUES + int(
+        stats["outliers"].map(len).sum()
+    )
+    if len(stats) and (
+        stats["n"].median() < MIN_BOX_GROUP_SIZE or summary_values >= original
+    ):
+        return _raw_box_figure(df, x, y, color, title, height, original)
+
+    fig = go.Figure()
+    shown = 0
+    for name, group in _colour_groups(stats, color):
+        label = str(name) if color else y
+        offset = label if color else None
+        fig.add_trace(
+            go.Box(
+                x=_axis_values(group[x]),
+                q1=group["q1"].to_numpy(),
+                median=group["median"].to_numpy(),
+                q3=group["q3"].to_numpy(),
+                mean=group["mean"].to_numpy(),
+                lowerfence=group["lowerfence"].to_numpy(),
+                upperfence=group["upperfence"].to_numpy(),
+                name=label,
+                offsetgroup=offset,
+                legendgroup=label,
+                showlegend=bool(color),
+            )
+        )
+        counts = group["outliers"].map(len).to_numpy()
+        if counts.sum():
+            fig.add_trace(
+                go.Scatter(
+                    x=np.repeat(np.array(_axis_values(group[x]), dtype=object), counts),
+                    y=np.concatenate(group["outliers"].to_list()),
+                    mode="markers",
+                    marker={"size": 4, "opacity": 0.6},
+                    name=label,
+                    offsetgroup=offset,
+                    legendgroup=label,
+                    showlegend=False,
+                    hovertemplate=f"{x}=%{{x}}<br>{y}=%{{y}}<extra>outlier</extra>",
+                )
+            )
+        shown += len(group) * BOX_SUMMARY_VALUES + int(counts.sum())
+    _box_layout(fig, x, y, color, title, height)
+    reduction = ChartReduction(original, shown, "server-side box statistics", False)
+    return fig, reduction
+
+
+def _raw_box_figure(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    color: Optional[str],
+    title: Optional[str],
+    height: Optional[int],
+    original: int,
+) -> Tuple[go.Figure, ChartReduction]:
+    """Box plots drawn by Plotly from the raw points, all of them shown."""
+    data = df.dropna(subset=[c for c in (x, y, color) if c])
+    fig = go.Figure()
+    for name, group in _colour_groups(data, color):
+        label = str(name) if color else y
+        fig.add_trace(
+            go.Box(
+                x=_axis_values(group[x]),
+                y=group[y].to_numpy(),
+                name=label,
+                offsetgroup=label if color else None,
+                boxpoints="all",
+                jitter=0.3,
+                pointpos=0,
+                marker={"size": 4, "opacity": 0.6},
+                showlegend=bool(color),
+            )
+        )
+    _box_layout(fig, x, y, color, title, height)
+    return fig, ChartReduction(original, original, "raw points", False)
+
+
+def _box_layout(fig, x, y, color, title, height) -> None:
+    fig.update_layout(
+        title=title,
+        height=height,
+        boxmode="group" if color else "overlay",
+        scattermode="group" if color else "overlay",
+        xaxis_title=x,
+        yaxis_title=y,
+        legend_title_text=color,
+    )
+
+
+def bar_figure(
+    df: pd.DataFrame,
+    x: str,
+    y: Optional[str] = None,
+    title: Optional[str] = None,
+    height: Optional[int] = None,
+) -> Tuple[go.Figure, ChartReduction]:
+    """Build a bar chart of the mean of y per x (or row counts per x)."""
+    if y:
+        summary = group_means(df, y, x)
+        values, y_title = summary["mean"].to_numpy(), y
+        original = int(summary["count"].sum())
+    else:
+        summary = value_counts(df, x)
+        values, y_title = summary["count"].to_numpy(), "count"
+        original = int(values.sum())
+
+    fig = go.Figure(go.Bar(x=_axis_values(summary[x]), y=values, name=y_title))
+    fig.update_layout(title=title, height=height, xaxis_title=x, yaxis_title=y_title)
+    reduction = ChartReduction(original, len(summary), "server-side aggregation", False)
+    return fig, reduction
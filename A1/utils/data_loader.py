@@ -7,17 +7,159 @@ This module provides functions for:
 - Creating categorical variables for analysis
 - Formatting and validating data
 
+CSVs are parsed once and kept in a typed columnar (Parquet) cache keyed by
+the CSV content hash, so cold starts skip CSV parsing entirely. GitHub
+sources are downloaded through utils.fetch, which revalidates a local copy
+with conditional requests instead of re-downloading it.
+
 All functions use @st.cache_data for optimal performance.
 """
 
+import hashlib
+import os
 import pandas as pd
 import streamlit as st
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Optional
+from urllib.parse import urlparse
+
+from .fetch import fetch_cached
 
 
 RAW_BASE = "https://raw.githubusercontent.com/Kartavya-Jharwal/Kartavya_Business_Analytics2025/refs/heads/main/A1"
 
+# Columnar cache for parsed source CSVs. Bump CACHE_SCHEMA_VERSION whenever
+# _standardize_frame or DATASET_SCHEMAS change so stale Parquet files are rebuilt.
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "datasets"
+CACHE_SCHEMA_VERSION = 2
+
+# CSV parser: "c" (default) or "pyarrow" for the multithreaded Arrow reader
+CSV_ENGINE = os.environ.get("CARBONSEER_CSV_ENGINE", "c")
+
+GDP_COLUMN = "GDP per capita (constant 2015 US$)"
+CO2_COLUMN = "Annual CO₂ emissions (per capita)"
+NETZERO_STATUS_COLUMN = "Status of net-zero carbon emissions targets"
+
+_DATA_ROOT = Path(__file__).parent.parent
+SOURCE_FILES = {
+    "gdp": _DATA_ROOT
+    / "gdp-per-capita-worldbank-constant-usd"
+    / "gdp-per-capita-worldbank-constant-usd.csv",
+    "co2": _DATA_ROOT / "co-emissions-per-capita" / "co-emissions-per-capita.csv",
+    "netzero": _DATA_ROOT / "net-zero-targets" / "net-zero-targets.csv",
+}
+
+# Per-dataset read schemas: only the columns the pages use, with pinned dtypes.
+# The ISO "Code" column is never used downstream and is not loaded. Metrics
+# are float32 (~7 significant digits, ample for per-capita GDP and CO2).
+DATASET_SCHEMAS = {
+    "gdp": {
+        "usecols": ["Entity", "Year", GDP_COLUMN],
+        "dtype": {"Entity": "category", "Year": "int16", GDP_COLUMN: "float32"},
+    },
+    "co2": {
+        "usecols": ["Entity", "Year", CO2_COLUMN],
+        "dtype": {"Entity": "category", "Year": "int16", CO2_COLUMN: "float32"},
+    },
+    "netzero": {
+        "usecols": ["Entity", "Year", NETZERO_STATUS_COLUMN],
+        "dtype": {"Entity": "category", "Year": "int16", NETZERO_STATUS_COLUMN: str},
+    },
+}
+
+
+def _standardize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply the shared column names and compact dtypes to a raw source frame.
+
+    - Entity is renamed to Country and stored as a categorical
+    - Year is stored as int16 (all source years fit comfortably)
+    """
+    df = df.rename(columns={"Entity": "Country"})
+    if "Country" in df.columns:
+        df["Country"] = df["Country"].astype("category")
+    if "Year" in df.columns:
+        df["Year"] = df["Year"].astype("int16")
+    return df
+
+
+def _file_digest(path: Path) -> str:
+    """Return a short content hash of a file, salted with the cache schema version."""
+    digest = hashlib.sha256(f"v{CACHE_SCHEMA_VERSION}:".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def _read_columnar_cache(
+    csv_path: Path, cache_name: Optional[str] = None, **read_csv_kwargs
+) -> pd.DataFrame:
+    """
+    Read a local CSV through the Parquet cache, rebuilding it when stale.
+
+    The cache file name embeds the CSV content hash, so an edited CSV never
+    matches an old cache entry. If pyarrow is unavailable or the cache
+    directory is not writable, the parsed CSV is returned uncached.
+
+    Args:
+        csv_path: Path to the source CSV
+        cache_name: Cache entry prefix (default: the CSV file stem)
+        **read_csv_kwargs: forwarded to pandas.read_csv on a cache miss
+
+    Returns:
+        pd.DataFrame: Standardized frame (see _standardize_frame)
+    """
+    cache_name = cache_name or csv_path.stem
+    cache_path = CACHE_DIR / f"{cache_name}-{_file_digest(csv_path)}.parquet"
+
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            # Corrupt or unreadable cache entry - fall through and rebuild it
+            pass
+
+    df = _standardize_frame(pd.read_csv(csv_path, **read_csv_kwargs))
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+        # Drop entries for older versions of the same CSV
+        for stale in CACHE_DIR.glob(f"{cache_name}-*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except (ImportError, OSError):
+        pass
+
+    return df
+
+
+def _read_github_csv(github_path: str, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Download a raw GitHub CSV via the fetch cache and read it columnar-cached.
+
+    The Parquet cache entry is named after the remote file, so identical
+    local and GitHub copies share one entry (both are keyed by content hash).
+    """
+    csv_path = fetch_cached(github_path)
+    cache_name = PurePosixPath(urlparse(github_path).path).stem
+    return _read_columnar_cache(csv_path, cache_name=cache_name, **read_csv_kwargs)
+
+
+def _csv_engine() -> str:
+    """Return the configured CSV engine, falling back to "c" without pyarrow."""
+    if CSV_ENGINE == "pyarrow":
+        try:
+            import pyarrow  # noqa: F401
+
+            return "pyarrow"
+        except ImportError:
+            pass
+    return "c"
+
 
 def _read_csv_auto(
     local_path: Path,
@@ -28,27 +170,34 @@ def _read_csv_auto(
     """
     Read a CSV from local path or GitHub raw with graceful fallback.
 
+    Both sources are served from the columnar cache (GitHub files are first
+    fetched through utils.fetch); the returned frame is always standardized
+    (Country categorical, Year int16).
+
     Args:
         local_path: Path to local CSV
         github_path: Raw GitHub URL (if None, constructed from RAW_BASE and relative)
         source: "auto" (try local then GitHub), "local", or "github"
-        **read_csv_kwargs: forwarded to pandas.read_csv
+        **read_csv_kwargs: forwarded to pandas.read_csv (typically one of
+            DATASET_SCHEMAS)
     """
-    # Defaults that improve type inference for large CSVs
-    read_csv_kwargs.setdefault("low_memory", False)
+    read_csv_kwargs.setdefault("engine", _csv_engine())
+    if read_csv_kwargs["engine"] == "c" and "dtype" not in read_csv_kwargs:
+        # Defaults that improve type inference for large CSVs
+        read_csv_kwargs.setdefault("low_memory", False)
 
     if source == "local":
-        return pd.read_csv(local_path, **read_csv_kwargs)
+        return _read_columnar_cache(local_path, **read_csv_kwargs)
     if source == "github":
         if not github_path:
             raise FileNotFoundError("github_path must be provided when source='github'")
-        return pd.read_csv(github_path, **read_csv_kwargs)
+        return _read_github_csv(github_path, **read_csv_kwargs)
 
     # auto: prefer local then fallback to GitHub
     if local_path.exists():
-        return pd.read_csv(local_path, **read_csv_kwargs)
+        return _read_columnar_cache(local_path, **read_csv_kwargs)
     if github_path:
-        return pd.read_csv(github_path, **read_csv_kwargs)
+        return _read_github_csv(github_path, **read_csv_kwargs)
     raise FileNotFoundError(
         f"Data not found locally and no GitHub URL provided: {local_path}"
     )
@@ -60,9 +209,11 @@ def load_gdp_data(source: str = "github") -> pd.DataFrame:
     Load GDP per capita dataset from World Bank source.
 
     Data Structure:
-    - Entity: Country name (renamed to 'Country')
-    - Year: Calendar year
-    - GDP per capita (constant 2015 US$): Main metric
+    - Entity: Country name (renamed to 'Country', categorical)
+    - Year: Calendar year (int16)
+    - GDP per capita (constant 2015 US$): Main metric (float32)
+
+    The ISO Code column is not loaded (see DATASET_SCHEMAS).
 
     Returns:
         pd.DataFrame: GDP dataset with standardized column names
@@ -73,7 +224,7 @@ def load_gdp_data(source: str = "github") -> pd.DataFrame:
     Example:
         >>> gdp_df = load_gdp_data()
         >>> print(gdp_df.shape)
-        (5000, 3)
+        (12098, 3)
     """
     data_path = (
         Path(__file__).parent.parent
@@ -82,12 +233,7 @@ def load_gdp_data(source: str = "github") -> pd.DataFrame:
     )
     github_url = f"{RAW_BASE}/gdp-per-capita-worldbank-constant-usd/gdp-per-capita-worldbank-constant-usd.csv"
 
-    df = _read_csv_auto(data_path, github_url, source)
-
-    # Standardize column names
-    df = df.rename(columns={"Entity": "Country"})
-
-    return df
+    return _read_csv_auto(data_path, github_url, source, **DATASET_SCHEMAS["gdp"])
 
 
 @st.cache_data
@@ -96,9 +242,11 @@ def load_co2_data(source: str = "github") -> pd.DataFrame:
     Load CO2 emissions per capita dataset from Global Carbon Budget.
 
     Data Structure:
-    - Entity: Country name (renamed to 'Country')
-    - Year: Calendar year
-    - Annual CO₂ emissions (per capita): Main metric in metric tons
+    - Entity: Country name (renamed to 'Country', categorical)
+    - Year: Calendar year (int16)
+    - Annual CO₂ emissions (per capita): Main metric in metric tons (float32)
+
+    The ISO Code column is not loaded (see DATASET_SCHEMAS).
 
     Returns:
         pd.DataFrame: CO2 emissions dataset with standardized column names
@@ -117,12 +265,7 @@ def load_co2_data(source: str = "github") -> pd.DataFrame:
     )
     github_url = f"{RAW_BASE}/co-emissions-per-capita/co-emissions-per-capita.csv"
 
-    df = _read_csv_auto(data_path, github_url, source)
-
-    # Standardize column names
-    df = df.rename(columns={"Entity": "Country"})
-
-    return df
+    return _read_csv_auto(data_path, github_url, source, **DATASET_SCHEMAS["co2"])
 
 
 @st.cache_data
@@ -131,7 +274,8 @@ def load_netzero_data(source: str = "github") -> pd.DataFrame:
     Load net-zero targets dataset from Net Zero Tracker.
 
     Data Structure:
-    - Entity: Country name (renamed to 'Country')
+    - Entity: Country name (renamed to 'Country', categorical)
+    - Year: Target year (int16)
     - Status of net-zero carbon emissions targets: Commitment status
 
     Commitment Types (Ordered by strength):
@@ -141,6 +285,8 @@ def load_netzero_data(source: str = "github") -> pd.DataFrame:
     4. In law
     5. Achieved (self-declared)
 
+    The ISO Code column is not loaded (see DATASET_SCHEMAS).
+
     Returns:
         pd.DataFrame: Net-zero commitments dataset
 
@@ -156,12 +302,44 @@ def load_netzero_data(source: str = "github") -> pd.DataFrame:
     )
     github_url = f"{RAW_BASE}/net-zero-targets/net-zero-targets.csv"
 
-    df = _read_csv_auto(data_path, github_url, source)
+    return _read_csv_auto(
+        data_path, github_url, source, **DATASET_SCHEMAS["netzero"]
+    )
 
-    # Standardize column names
-    df = df.rename(columns={"Entity": "Country"})
 
-    return df
+def dataset_memory_report() -> pd.DataFrame:
+    """
+    Compare memory use of schema-typed frames against untyped CSV reads.
+
+    The "legacy" frame is what pandas infers from the full local CSV
+    (``low_memory=False``, every column); the "typed" frame is the same CSV
+    read with its DATASET_SCHEMAS entry and standardized dtypes.
+
+    Returns:
+        pd.DataFrame: One row per dataset with rows, legacy_mb, typed_mb
+        and saving_pct
+
+    Example:
+        >>> print(dataset_memory_report().to_string(index=False))
+    """
+    rows = []
+    for name, path in SOURCE_FILES.items():
+        legacy = pd.read_csv(path, low_memory=False).rename(
+            columns={"Entity": "Country"}
+        )
+        typed = _standardize_frame(pd.read_csv(path, **DATASET_SCHEMAS[name]))
+        legacy_bytes = legacy.memory_usage(deep=True).sum()
+        typed_bytes = typed.memory_usage(deep=True).sum()
+        rows.append(
+            {
+                "dataset": name,
+                "rows": len(typed),
+                "legacy_mb": legacy_bytes / 1e6,
+                "typed_mb": typed_bytes / 1e6,
+                "saving_pct": 100 * (1 - typed_bytes / legacy_bytes),
+            }
+        )
+    return pd.DataFrame(rows)
 
 
 @st.cache_data
@@ -194,6 +372,9 @@ def merge_gdp_co2(gdp_df: pd.DataFrame, co2_df: pd.DataFrame) -> pd.DataFrame:
         co2_df, gdp_df, on=["Country", "Year"], how="inner", suffixes=("_co2", "_gdp")
     )
 
+    # Joining categoricals with different categories yields object keys
+    merged["Country"] = merged["Country"].astype("category")
+
     # Remove rows with missing values in key columns
     required_columns = [
         "Annual CO₂ emissions (per capita)",
@@ -208,17 +389,24 @@ def merge_gdp_co2(gdp_df: pd.DataFrame, co2_df: pd.DataFrame) -> pd.DataFrame:
     return merged
 
 
+# GDP per capita boundaries between the Low / Medium / High categories
+GDP_LOW_THRESHOLD = 5000
+GDP_HIGH_THRESHOLD = 15000
+
+
 @st.cache_data
 def create_gdp_categories(
-    df: pd.DataFrame, low_threshold: float = 5000, high_threshold: float = 15000
+    df: pd.DataFrame,
+    low_threshold: float = GDP_LOW_THRESHOLD,
+    high_threshold: float = GDP_HIGH_THRESHOLD,
 ) -> pd.DataFrame:
     """
     Create GDP categorical variable using quantile-based thresholds.
 
     This function creates three categories:
-    - Low: GDP per capita < $5,000
-    - Medium: $5,000 ≤ GDP per capita < $15,000
-    - High: GDP per capita ≥ $15,000
+    - Low: GDP per capita ≤ $5,000
+    - Medium: $5,000 < GDP per capita ≤ $15,000
+    - High: GDP per capita > $15,000
 
     Args:
         df: Input dataframe containing GDP data
@@ -233,14 +421,13 @@ def create_gdp_categories(
 
     Note:
         The thresholds are based on World Bank income classifications
-        adapted for analytical purposes.
+        adapted for analytical purposes. utils.sensitivity shows how the
+        Hypothesis 2 and ANOVA results move with them.
 
     Example:
         >>> df_cat = create_gdp_categories(merged_df)
         >>> print(df_cat['GDP_Category'].value_counts())
     """
-    df = df.copy()
-
     # Find the GDP column dynamically
     gdp_columns = [
         col for col in df.columns if "gdp" in col.lower() and "capita" in col.lower()
@@ -251,19 +438,24 @@ def create_gdp_categories(
 
     gdp_col = gdp_columns[0]
 
-    # Convert to numeric and remove missing values
-    df[gdp_col] = pd.to_numeric(df[gdp_col], errors="coerce")
-    df = df.dropna(subset=[gdp_col])
+    # Convert to numeric and remove missing values; assign builds the result
+    # without a defensive copy (untouched columns are shared under copy-on-write)
+    gdp = pd.to_numeric(df[gdp_col], errors="coerce")
+    keep = gdp.notna()
+    gdp = gdp[keep]
 
     # Create categories using pd.cut
-    df["GDP_Category"] = pd.cut(
-        df[gdp_col],
-        bins=[-float("inf"), low_threshold, high_threshold, float("inf")],
-        labels=["Low", "Medium", "High"],
+    return df[keep].assign(
+        **{
+            gdp_col: gdp,
+            "GDP_Category": pd.cut(
+                gdp,
+                bins=[-float("inf"), low_threshold, high_threshold, float("inf")],
+                labels=["Low", "Medium", "High"],
+            ),
+        }
     )
 
-    return df
-
 
 @st.cache_data
 def create_commitment_strength(netzero_df: pd.DataFrame) -> pd.DataFrame:
@@ -341,7 +533,12 @@ def get_latest_year_data(df: pd.DataFrame) -> pd.DataFrame:
         >>> latest = get_latest_year_data(merged_df)
         >>> print(f"Latest year data: {latest['Year'].max()}")
     """
-    return df.sort_values("Year").groupby("Country").tail(1).reset_index(drop=True)
+    return (
+        df.sort_values("Year")
+        .groupby("Country", observed=True)
+        .tail(1)
+        .reset_index(drop=True)
+    )
 
 
 def format_large_number(num: float) -> str:
@@ -0,0 +1,240 @@
+"""
+On-demand data exports for the CarbonSeer Streamlit dashboard.
+
+Download buttons used to receive fully serialised CSV / Excel bytes, so every
+rerun (each slider or multiselect change) paid for serialising the filtered
+frame whether or not anyone clicked. `deferred_export` instead hands
+st.download_button a zero-argument callable: Streamlit only runs it when the
+button is clicked, on a separate thread from the script rerun.
+
+Payloads are memoised in a process-wide LRU keyed by (frame fingerprint,
+format), bounded by a byte budget, so repeated downloads of the same filter
+state are served from memory and old payloads are evicted first.
+
+Writers stream the frame in EXPORT_CHUNK_ROWS slices into a spooled temporary
+file (in memory while small, on disk beyond EXPORT_SPOOL_MAX_BYTES): CSV is
+encoded chunk by chunk, optionally through gzip, and Excel uses openpyxl's
+write-only workbook, which never builds the full cell graph in memory. The
+finished payload is read back into one bytes object: st.download_button
+reads any file object it is given into memory for its media file store, so
+passing the spooled file through would not avoid that copy.
+
+Parquet and Arrow IPC (Feather v2) exports are built from a pyarrow Table
+that shares the frame's numeric buffers, compressed with zstd, and keep the
+pandas schema (categoricals, int16 years) so downstream notebooks read back
+exactly the frame shown in the explorer.
+"""
+
+import gzip
+import importlib.util
+import os
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Callable, Dict, Optional
+
+import pandas as pd
+
+from .fingerprint import frame_token
+from .lru import BudgetLRU
+
+
+# Total bytes of serialised payloads kept in memory across all sessions
+EXPORT_CACHE_BUDGET_BYTES = (
+    int(os.environ.get("CARBONSEER_EXPORT_CACHE_MB", "64")) * 1024 * 1024
+)
+
+# Payloads above this fraction of the budget are streamed, not cached
+EXPORT_CACHE_MAX_ENTRY_FRACTION = 0.25
+
+# Rows serialised per chunk, and spooled bytes kept in memory before spilling
+EXPORT_CHUNK_ROWS = 20_000
+EXPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+EXPORT_MIME_TYPES = {
+    "csv": "text/csv",
+    "csv.gz": "application/gzip",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+# zstd gives Parquet/Arrow files a fraction of the CSV size at low CPU cost
+COLUMNAR_COMPRESSION = "zstd"
+
+EXCEL_SHEET_NAME = "CarbonSeer Data"
+
+
+_export_cache = BudgetLRU(EXPORT_CACHE_BUDGET_BYTES)
+
+
+def excel_available() -> bool:
+    """Check whether the Excel writer backend (openpyxl) is installed."""
+    return importlib.util.find_spec("openpyxl") is not None
+
+
+def columnar_available() -> bool:
+    """Check whether the Parquet / Arrow IPC backend (pyarrow) is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _iter_chunks(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS):
+    # Always yield at least one (possibly empty) chunk so headers are written
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield start, df.iloc[start : start + chunk_rows]
+
+
+def _write_csv(df: pd.DataFrame, sink: BinaryIO) -> None:
+    for start, chunk in _iter_chunks(df):
+        sink.write(chunk.to_csv(index=False, header=start == 0).encode("utf-8"))
+
+
+def _write_csv_gz(df: pd.DataFrame, sink: BinaryIO) -> None:
+    # mtime=0 keeps the output byte-identical for identical data
+    with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=6, mtime=0) as gz:
+        _write_csv(df, gz)
+
+
+def _excel_values(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Plain Python values with None for missing cells, as to_excel writes."""
+    # Widening float32 exactly gives 308.3182678222656 for a stored 308.31827;
+    # going through the shortest float32 repr keeps the value shown in the app
+    shortest = {
+        col: chunk[col].astype(str).astype("float64")
+        for col in chunk.columns[chunk.dtypes == "float32"]
+    }
+    if shortest:
+        chunk = chunk.assign(**shortest)
+    return chunk.astype(object).where(chunk.notna(), None)
+
+
+def _write_xlsx(df: pd.DataFrame, sink: BinaryIO) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(EXCEL_SHEET_NAME)
+    sheet.append([str(col) for col in df.columns])
+    for _, chunk in _iter_chunks(df):
+        values = _excel_values(chunk)
+        for row in values.itertuples(index=False, name=None):
+            sheet.append(row)
+    workbook.save(sink)
+
+
+def _arrow_table(df: pd.DataFrame):
+    import pyarrow as pa
+
+    # Numeric columns are wrapped without copying; pandas metadata preserves
+    # categorical dtypes (and their order) and integer widths on read-back
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _write_parquet(df: pd.DataFrame, sink: BinaryIO) -> None:
+    import pyarrow.parquet as pq
+
+    pq.write_table(_arrow_table(df), sink, compression=COLUMNAR_COMPRESSION)
+
+
+def _write_arrow(df: pd.DataFrame, sink: BinaryIO) -> None:
+    import pyarrow as pa
+
+    table = _arrow_table(df)
+    options = pa.ipc.IpcWriteOptions(compression=COLUMNAR_COMPRESSION)
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+
+
+_WRITERS: Dict[str, Callable[[pd.DataFrame, BinaryIO], None]] = {
+    "csv": _write_csv,
+    "csv.gz": _write_csv_gz,
+    "xlsx": _write_xlsx,
+    "parquet": _write_parquet,
+    "arrow": _write_arrow,
+}
+
+
+def write_export(df: pd.DataFrame, fmt: str, sink: BinaryIO) -> None:
+    """
+    Stream a frame to a binary file-like object in the given format.
+
+    Args:
+        df: Frame to export (treated as read-only)
+        fmt: Export format, one of EXPORT_MIME_TYPES
+        sink: Writable binary file-like object
+
+    Raises:
+        ValueError: If fmt is not a supported format
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt!r}")
+    _WRITERS[fmt](df, sink)
+
+
+def export_bytes(
+    df: pd.DataFrame, fmt: str, token: Optional[str] = None
+) -> bytes:
+    """
+    Serialise a frame, reusing a cached payload for the same data and format.
+
+    The export is written chunk by chunk into a spooled temporary file and
+    read back once into the returned bytes, which is the form Streamlit keeps
+    download payloads in. Payloads above EXPORT_CACHE_MAX_ENTRY_FRACTION of
+    the budget are returned without being cached, so one large export cannot
+    flush the cache.
+
+    Args:
+        df: Frame to export (treated as read-only)
+        fmt: Export format, one of EXPORT_MIME_TYPES
+        token: Fingerprint of df, e.g. derived from the filter state
+            (default: the frame's registered or content token)
+
+    Returns:
+        bytes: Serialised payload
+
+    Raises:
+        ValueError: If fmt is not a supported format
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt!r}")
+
+    key = (token or frame_token(df), fmt)
+    payload = _export_cache.get(key)
+    if payload is not None:
+        return payload
+
+    with SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES) as spool:
+        write_export(df, fmt, spool)
+        spool.seek(0)
+        payload = spool.read()
+
+    if len(payload) <= _export_cache.budget_bytes * EXPORT_CACHE_MAX_ENTRY_FRACTION:
+        _export_cache.put(key, payload)
+    return payload
+
+
+def deferred_export(
+    df: pd.DataFrame, fmt: str, token: Optional[str] = None
+) -> Callable[[], bytes]:
+    """
+    Build a zero-argument callable for st.download_button's ``data``.
+
+    Nothing is serialised (or hashed) until the user clicks the button.
+
+    Example:
+        >>> st.download_button(
+        ...     "⬇️ Download as CSV",
+        ...     data=deferred_export(display_df, "csv", token=filter_token),
+        ...     file_name="carbonseer.csv",
+        ...     mime=EXPORT_MIME_TYPES["csv"],
+        ... )
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt!r}")
+
+    def _build() -> bytes:
+        return export_bytes(df, fmt, token)
+
+    return _build
+
+
+def export_cache_stats() -> Dict[str, int]:
+    """Return statistics for the process-wide export cache."""
+    return _export_cache.stats()
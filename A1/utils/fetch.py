@@ -0,0 +1,169 @@
+"""
+HTTP fetch layer for GitHub-sourced CarbonSeer datasets.
+
+Downloads under RAW_BASE go through a single pooled requests session with
+bounded retries and timeouts. Responses are stored in a content-addressed
+cache directory together with their ETag / Last-Modified validators, so a
+restarted process revalidates with a conditional request and gets a 304
+instead of downloading the file again.
+
+Layout of the cache directory:
+- blobs/<sha256>: response bodies, named by content hash
+- index/<sha256 of url>.json: validators and blob hash for each URL
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+FETCH_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "http"
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 30.0)
+MAX_RETRIES = 3
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Create a session with connection pooling and bounded retries."""
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "CarbonSeer/0.1"
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def _index_path(url: str, cache_dir: Path) -> Path:
+    return cache_dir / "index" / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def _atomic_write(path: Path, data: Union[bytes, str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if isinstance(data, str):
+        tmp_path.write_text(data)
+    else:
+        tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _drop_unreferenced_blob(blob_hash: str, cache_dir: Path) -> None:
+    """Delete a blob once no index entry points at it any more."""
+    for entry_path in (cache_dir / "index").glob("*.json"):
+        try:
+            if json.loads(entry_path.read_text()).get("sha256") == blob_hash:
+                return
+        except (OSError, ValueError):
+            continue
+    (cache_dir / "blobs" / blob_hash).unlink(missing_ok=True)
+
+
+def fetch_cached(
+    url: str,
+    cache_dir: Path = FETCH_CACHE_DIR,
+    session: Optional[requests.Session] = None,
+    timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+) -> Path:
+    """
+    Fetch a URL into the local cache and return the path of its body.
+
+    If the URL was fetched before, the request carries If-None-Match /
+    If-Modified-Since and a 304 response reuses the cached body. If the
+    server cannot be reached but a cached copy exists, the cached copy is
+    returned so the dashboard keeps working offline.
+
+    Args:
+        url: URL to fetch (typically under RAW_BASE)
+        cache_dir: Root of the content-addressed cache
+        session: requests session to use (default: the shared pooled session)
+        timeout: (connect, read) timeouts in seconds
+
+    Returns:
+        Path: Local file containing the response body
+
+    Raises:
+        requests.RequestException: If the fetch fails and nothing is cached
+
+    Example:
+        >>> path = fetch_cached(f"{RAW_BASE}/net-zero-targets/net-zero-targets.csv")
+        >>> df = pd.read_csv(path)
+    """
+    session = session or get_session()
+    index_path = _index_path(url, cache_dir)
+
+    entry = None
+    try:
+        entry = json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        pass
+
+    cached_blob = None
+    if entry and (cache_dir / "blobs" / entry.get("sha256", "")).is_file():
+        cached_blob = cache_dir / "blobs" / entry["sha256"]
+
+    headers = {}
+    if cached_blob is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached_blob is not None:
+            return cached_blob
+        response.raise_for_status()
+    except requests.RequestException:
+        if cached_blob is not None:
+            return cached_blob
+        raise
+
+    body = response.content
+    blob_hash = hashlib.sha256(body).hexdigest()
+    blob_path = cache_dir / "blobs" / blob_hash
+    if not blob_path.is_file():
+        _atomic_write(blob_path, body)
+
+    _atomic_write(
+        index_path,
+        json.dumps(
+            {
+                "url": url,
+                "sha256": blob_hash,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        ),
+    )
+
+    if entry and entry.get("sha256") not in (None, blob_hash):
+        _drop_unreferenced_blob(entry["sha256"], cache_dir)
+
+    return blob_path
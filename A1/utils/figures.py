@@ -0,0 +1,68 @@
+"""
+Figure cache for the CarbonSeer Streamlit pages.
+
+Every rerun used to rebuild each Plotly figure from scratch (pandas
+aggregation, plotly.express, the theme update), even when neither its data
+nor its settings had changed. `cached_figure` stores each figure's JSON in a
+process-wide, size-bounded LRU keyed by:
+
+- the chart spec: a hashable description of the chart (name and settings)
+- a dataset token from utils.fingerprint (e.g. a Panel or filter-state token)
+- PLOTLY_THEME_VERSION, so theme changes invalidate every cached figure
+
+On a hit the figure is rebuilt from its JSON without validation, which skips
+pandas and plotly.express entirely.
+"""
+
+import json
+import os
+from typing import Callable, Hashable
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from .lru import BudgetLRU
+from .styling import PLOTLY_THEME_VERSION
+
+
+FIGURE_CACHE_BUDGET_BYTES = (
+    int(os.environ.get("CARBONSEER_FIGURE_CACHE_MB", "32")) * 1024 * 1024
+)
+
+_figure_cache = BudgetLRU(FIGURE_CACHE_BUDGET_BYTES)
+
+
+def cached_figure(
+    spec: Hashable, token: str, build: Callable[[], go.Figure]
+) -> go.Figure:
+    """
+    Return a figure from the cache, building (and caching) it on a miss.
+
+    Args:
+        spec: Hashable chart description, e.g. ("h1_scatter", year)
+        token: Fingerprint of the data the figure is built from
+        build: Zero-argument function returning the fully styled figure
+
+    Returns:
+        go.Figure: The cached or freshly built figure
+
+    Example:
+        >>> fig = cached_figure(
+        ...     ("gdp_pie",), filter_token, lambda: build_gdp_pie(df)
+        ... )
+        >>> st.plotly_chart(fig, key="gdp_pie")
+    """
+    key = (spec, token, PLOTLY_THEME_VERSION)
+    cached = _figure_cache.get(key)
+    if cached is not None:
+        # The JSON came from a validated figure, so skip revalidation
+        return go.Figure(json.loads(cached), _validate=False)
+
+    fig = build()
+    _figure_cache.put(key, pio.to_json(fig, validate=False))
+    return fig
+
+
+def figure_cache_stats():
+    """Return statistics for the process-wide figure cache."""
+    return _figure_cache.stats()
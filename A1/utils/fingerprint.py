@@ -0,0 +1,124 @@
+"""
+Cheap, stable dataset fingerprints for CarbonSeer cache keys.
+
+@st.cache_data hashes every argument before it can look up a cached result;
+for a DataFrame that means hashing all of its data on every call, which on
+the merged panel costs more than some of the statistics being cached.
+
+Frames produced by the loader are registered here with a token computed
+once (a content hash). Panel slices are registered with tokens derived from
+their parent's token and the selection (e.g. ``("year", 2020)``), so they
+never need to be hashed either. Passing FINGERPRINT_HASH_FUNCS to
+@st.cache_data makes cache lookups on registered frames O(1); unregistered
+frames fall back to a full content hash, as before.
+
+Registered frames must be treated as read-only: mutating one in place would
+leave its token describing the old contents.
+"""
+
+import hashlib
+import pickle
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+_registry: Dict[int, Tuple[weakref.ref, str]] = {}
+_registry_lock = threading.Lock()
+
+
+def content_token(df: pd.DataFrame) -> str:
+    """
+    Hash a frame's schema and contents into a token.
+
+    This is O(n) and is what unregistered frames cost on every cache lookup.
+    """
+    digest = hashlib.sha256()
+    schema = (list(map(str, df.columns)), [str(dtype) for dtype in df.dtypes], df.shape)
+    digest.update(repr(schema).encode())
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cell values (lists, dicts): fall back to the pickled frame
+        digest.update(pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+    return digest.hexdigest()[:32]
+
+
+def arrays_token(arrays) -> str:
+    """
+    Hash a sequence of arrays (dtype, shape and values) into a token.
+
+    The array counterpart of content_token, for cached functions that take
+    lists of arrays and were not given a token.
+    """
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(repr((str(array.dtype), array.shape)).encode())
+        if array.dtype == object:
+            digest.update(pickle.dumps(array, protocol=pickle.HIGHEST_PROTOCOL))
+        else:
+            digest.update(array.tobytes())
+    return digest.hexdigest()[:32]
+
+
+def derive_token(token: str, *selection) -> str:
+    """
+    Derive the token of a subset from its parent token and a selection.
+
+    Args:
+        token: Token of the parent frame
+        *selection: Hashable description of the subset, e.g. ("year", 2020)
+
+    Returns:
+        str: Token for the subset
+    """
+    return hashlib.sha256(repr((token,) + selection).encode()).hexdigest()[:32]
+
+
+def register_frame(df: pd.DataFrame, token: Optional[str] = None) -> pd.DataFrame:
+    """
+    Attach a token to a frame for the lifetime of the frame object.
+
+    Args:
+        df: Frame to register (treated as read-only from now on)
+        token: Token to use (default: content_token(df), computed once)
+
+    Returns:
+        pd.DataFrame: The same frame, for chaining
+    """
+    if token is None:
+        token = content_token(df)
+    key = id(df)
+
+    def _forget(ref, key=key):
+        with _registry_lock:
+            entry = _registry.get(key)
+            if entry is not None and entry[0] is ref:
+                del _registry[key]
+
+    ref = weakref.ref(df, _forget)
+    with _registry_lock:
+        _registry[key] = (ref, token)
+    return df
+
+
+def registered_token(df: pd.DataFrame) -> Optional[str]:
+    """Return the token a frame was registered with, or None."""
+    entry = _registry.get(id(df))
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    return None
+
+
+def frame_token(df: pd.DataFrame) -> str:
+    """Return a frame's registered token, or hash its contents if unregistered."""
+    token = registered_token(df)
+    return token if token is not None else content_token(df)
+
+
+# Use as @st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS)
+FINGERPRINT_HASH_FUNCS = {pd.DataFrame: frame_token}
@@ -0,0 +1,87 @@
+"""
+Size-bounded LRU caches shared by the CarbonSeer cache layers.
+
+st.cache_data bounds entries by count or age, not by memory. The caches for
+export payloads and serialised figures hold values whose size varies by
+orders of magnitude, so they use BudgetLRU, which evicts least recently used
+entries once the total size of cached values exceeds a byte budget.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+def _default_sizeof(value: Any) -> int:
+    try:
+        return len(value)
+    except TypeError:
+        return sys.getsizeof(value)
+
+
+class BudgetLRU:
+    """
+    Thread-safe LRU cache bounded by the total size of its values.
+
+    Args:
+        budget_bytes: Maximum total size of cached values; values larger than
+            the budget are never cached
+        sizeof: Function returning a value's size in bytes (default: len)
+    """
+
+    def __init__(
+        self, budget_bytes: int, sizeof: Callable[[Any], int] = _default_sizeof
+    ):
+        self.budget_bytes = budget_bytes
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value (marking it recently used), or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting least recently used entries to fit."""
+        size = self._sizeof(value)
+        if size > self.budget_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+                self._size -= self._sizes.pop(key)
+            while self._entries and self._size + size > self.budget_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self._size -= self._sizes.pop(evicted)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._size += size
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry count, cached bytes, hits and misses."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
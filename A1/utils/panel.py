@@ -0,0 +1,282 @@
+"""
+Indexed (Country, Year) panel store for the CarbonSeer datasets.
+
+The pages used to filter with boolean masks (``df[df["Year"] == year]``,
+``df["Country"].isin(...)``), which scans the whole frame on every widget
+interaction. A Panel is built once per dataset and keeps two sorted offset
+indexes over the frame:
+
+- country index: rows sorted by (Country, Year) with one [start, stop) block
+  per country, so a country's rows and any year range inside them are found
+  with binary search
+- year index: a row permutation sorted by Year with per-year offsets
+
+Slicing costs O(log n) to locate the rows plus O(k) to gather the k rows
+returned, independent of how many years or indicators the panel holds.
+
+The panel frame and every slice it returns are registered with
+utils.fingerprint, so cached analysis functions key on a derived token
+instead of rehashing the slice's contents.
+
+Filtered frames from Panel.select are kept in a process-wide LRU bounded by
+SELECTION_CACHE_BUDGET_BYTES (CARBONSEER_FILTER_CACHE_MB, default 128),
+keyed by the panel token and the normalised filters, so the same filter
+combination is gathered once and then shared by every session.
+"""
+
+import os
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .fingerprint import derive_token, frame_token, register_frame
+from .lru import BudgetLRU
+
+
+# Total bytes of filtered frames kept in memory across all sessions
+SELECTION_CACHE_BUDGET_BYTES = (
+    int(os.environ.get("CARBONSEER_FILTER_CACHE_MB", "128")) * 1024 * 1024
+)
+
+
+def _frame_nbytes(df: pd.DataFrame) -> int:
+    # Categories (and object values) are shared with the panel frame, so only
+    # the gathered codes, numbers and pointers count against the budget
+    return int(df.memory_usage(index=True, deep=False).sum())
+
+
+_selection_cache = BudgetLRU(SELECTION_CACHE_BUDGET_BYTES, sizeof=_frame_nbytes)
+
+
+class Panel:
+    """
+    Read-only (Country, Year) panel with O(log n) slicing.
+
+    The wrapped frame is stored sorted by (Country, Year); it is only copied
+    when the input is not already in that order. Treat the frame and any
+    slices as read-only.
+
+    Args:
+        df: Frame with a categorical (or string) Country column and a Year column
+        token: Fingerprint token of df (default: its registered or content token)
+
+    Example:
+        >>> panel = Panel(merged_df)
+        >>> latest = panel.year(panel.years[-1])
+        >>> subset = panel.select(countries=["France", "India"], years=(2000, 2020))
+    """
+
+    def __init__(self, df: pd.DataFrame, token: Optional[str] = None):
+        if token is None:
+            token = frame_token(df)
+        country = df["Country"]
+        if not isinstance(country.dtype, pd.CategoricalDtype):
+            country = country.astype("category")
+            df = df.assign(Country=country)
+
+        codes = country.cat.codes.to_numpy()
+        years = df["Year"].to_numpy()
+
+        order = np.lexsort((years, codes))
+        if not np.array_equal(order, np.arange(len(order))):
+            df = df.iloc[order].reset_index(drop=True)
+            codes = codes[order]
+            years = years[order]
+
+        # Sorting does not change the contents, so the token still applies
+        self.token = token
+        self.frame = register_frame(df, token)
+        self._categories = df["Country"].cat.categories
+        self._years = years
+
+        # Country blocks: rows [starts[c], starts[c + 1]) belong to code c
+        self._country_starts = np.searchsorted(
+            codes, np.arange(len(self._categories) + 1), side="left"
+        )
+        self._present = np.diff(self._country_starts) > 0
+
+        # Year index: stable permutation keeps (Country) order within a year
+        self._year_order = np.argsort(years, kind="stable")
+        self._sorted_years = years[self._year_order]
+        self.years = np.unique(years)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def countries(self) -> pd.Index:
+        """Countries with at least one row, in sorted order."""
+        return self._categories[self._present]
+
+    def _year_positions(self, start: int, stop: int) -> np.ndarray:
+        lo = np.searchsorted(self._sorted_years, start, side="left")
+        hi = np.searchsorted(self._sorted_years, stop, side="right")
+        return self._year_order[lo:hi]
+
+    def _slice(self, positions, *selection) -> pd.DataFrame:
+        return register_frame(
+            self.frame.iloc[positions], derive_token(self.token, *selection)
+        )
+
+    def year(self, year: int) -> pd.DataFrame:
+        """Return all rows for a single year (empty frame if absent)."""
+        return self._slice(self._year_positions(year, year), "year", int(year))
+
+    def year_range(self, start: int, stop: int) -> pd.DataFrame:
+        """Return rows with start <= Year <= stop, in (Country, Year) order."""
+        positions = np.sort(self._year_positions(start, stop))
+        return self._slice(positions, "years", int(start), int(stop))
+
+    def _block_positions(
+        self, countries: Tuple[str, ...], years: Optional[Tuple[int, int]]
+    ) -> np.ndarray:
+        wanted = np.sort(self._categories.get_indexer(pd.Index(countries)))
+
+        starts = self._country_starts[wanted]
+        stops = self._country_starts[wanted + 1]
+        if years is not None:
+            # Rows inside a country block are sorted by Year
+            lo_year, hi_year = years
+            new_starts = np.empty_like(starts)
+            new_stops = np.empty_like(stops)
+            for i, (block_start, block_stop) in enumerate(zip(starts, stops)):
+                block = self._years[block_start:block_stop]
+                new_starts[i] = block_start + np.searchsorted(block, lo_year, "left")
+                new_stops[i] = block_start + np.searchsorted(block, hi_year, "right")
+            starts, stops = new_starts, new_stops
+
+        if len(starts) == 0:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(
+            [np.arange(s, e) for s, e in zip(starts, stops)]
+        ).astype(np.intp, copy=False)
+
+    def _isin_mask(self, column: str, values: Iterable) -> Optional[np.ndarray]:
+        """Row mask for column in values, or None if every row matches."""
+        series = self.frame[column]
+        values = pd.Index(list(values)).unique()
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories
+            if categories.isin(values).all():
+                return None
+            wanted = categories.get_indexer(values)
+            return np.isin(series.cat.codes.to_numpy(), wanted[wanted >= 0])
+        mask = series.isin(values).to_numpy()
+        return None if mask.all() else mask
+
+    def _normalise_selection(
+        self,
+        countries: Optional[Iterable[str]],
+        years: Optional[Tuple[int, int]],
+        isin: Optional[Mapping[str, Iterable]],
+    ) -> tuple:
+        """
+        Canonical (countries, years, isin) spec for a selection.
+
+        Filters that keep every row become None (or are dropped), country
+        names are sorted and restricted to countries with rows, the year
+        range is clipped to the panel's span and isin values are sorted (by
+        their text, keeping their type), so equivalent widget states share
+        one cache entry and token.
+        """
+        country_key = None
+        if countries is not None:
+            wanted = self._categories.get_indexer(pd.Index(list(countries)).unique())
+            wanted = np.unique(wanted[wanted >= 0])
+            wanted = wanted[self._present[wanted]]
+            if len(wanted) < self._present.sum():
+                country_key = tuple(self._categories[wanted])
+
+        year_key = None
+        if years is not None and len(self.years):
+            lo_year = max(int(years[0]), int(self.years[0]))
+            hi_year = min(int(years[1]), int(self.years[-1]))
+            if (lo_year, hi_year) != (int(self.years[0]), int(self.years[-1])):
+                year_key = (lo_year, hi_year)
+
+        isin_key = []
+        for column, values in sorted((isin or {}).items()):
+            values = pd.Index(list(values)).unique()
+            series = self.frame[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                categories = series.cat.categories
+                if categories.isin(values).all():
+                    continue
+                values = categories[categories.isin(values)]
+            # Keep the values themselves (they are matched against the column);
+            # sorting by their text gives a stable key for mixed types
+            isin_key.append((column, tuple(sorted(values, key=str))))
+
+        return country_key, year_key, tuple(isin_key)
+
+    def _selection_positions(
+        self,
+        countries: Optional[Tuple[str, ...]],
+        years: Optional[Tuple[int, int]],
+        isin: Tuple[Tuple[str, tuple], ...],
+    ) -> Optional[np.ndarray]:
+        positions = None
+        if countries is not None:
+            positions = self._block_positions(countries, years)
+        elif years is not None:
+            positions = np.sort(self._year_positions(*years))
+
+        for column, values in isin:
+            mask = self._isin_mask(column, values)
+            if mask is None:
+                continue
+            positions = (
+                np.flatnonzero(mask) if positions is None else positions[mask[positions]]
+            )
+        return positions
+
+    def select(
+        self,
+        countries: Optional[Iterable[str]] = None,
+        years: Optional[Tuple[int, int]] = None,
+        isin: Optional[Mapping[str, Iterable]] = None,
+    ) -> pd.DataFrame:
+        """
+        Return rows for a set of countries, a year range and value filters.
+
+        The filters are normalised first and results are shared through a
+        process-wide LRU keyed by (panel token, normalised filters), so a
+        filter combination any session has already requested is returned
+        without touching the rows. On a miss all filters are resolved to row
+        positions and the frame is gathered once. With no effective filter
+        the shared panel frame itself is returned.
+
+        Args:
+            countries: Country names to keep (None keeps all; unknown names are ignored)
+            years: Inclusive (start, stop) year range (None keeps all years)
+            isin: Mapping of column -> allowed values, e.g.
+                {"GDP_Category": ["Low", "High"]}; filters that allow every
+                value are skipped
+
+        Returns:
+            pd.DataFrame: Matching rows in (Country, Year) order, shared
+            between callers and registered with a token derived from the
+            normalised filters (treat as read-only)
+        """
+        spec = self._normalise_selection(countries, years, isin)
+        if spec == (None, None, ()):
+            return self.frame
+
+        key = (self.token, spec)
+        cached = _selection_cache.get(key)
+        if cached is not None:
+            return cached
+
+        positions = self._selection_positions(*spec)
+        if positions is None:
+            # Only non-categorical filters that happen to keep every row
+            return self.frame
+        result = self._slice(positions, "select", *spec)
+        _selection_cache.put(key, result)
+        return result
+
+
+def selection_cache_stats() -> Dict[str, int]:
+    """Return statistics for the process-wide filtered-frame cache."""
+    return _selection_cache.stats()
@@ -0,0 +1,477 @@
+"""
+Bootstrap and permutation resampling for CarbonSeer effect sizes and tests.
+
+Point estimates (r, ρ, R², η², Cramér's V) are reported with percentile
+bootstrap confidence intervals, and chi-square associations can be tested
+with a Monte Carlo permutation test (permutation_chi_square). Resamples are
+drawn as batched index matrices (one row of row indices per resample), and
+each statistic is evaluated vectorised across a whole batch at once:
+correlations as row-wise centred cross-products, Spearman ranks, η² and
+Cramér's V from np.bincount over (resample, code) pairs. There is no Python
+loop over resamples.
+
+Batches are seeded from np.random.SeedSequence(seed).spawn(...), so results
+depend only on the data, the statistic, B and the seed. The worker count
+and whether batches run in-process or in the process pool make no
+difference. By default everything runs in-process. Setting
+CARBONSEER_RESAMPLING_WORKERS to 2 or more opts in to a shared
+ProcessPoolExecutor for large jobs (over PARALLEL_MIN_CELLS drawn indices);
+smaller ones, such as a yearly slice, still run in-process, where pool
+overhead would dominate.
+
+Results are cached with @st.cache_data per (dataset token, statistic,
+columns, B, confidence, seed); DataFrame arguments are keyed by their
+utils.fingerprint token.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from .fingerprint import FINGERPRINT_HASH_FUNCS
+
+
+# Default number of bootstrap resamples and the seed they are derived from
+BOOTSTRAP_RESAMPLES = 10_000
+BOOTSTRAP_SEED = 2025
+
+# Drawn indices per batch (resamples x rows); bounds memory per batch
+BOOTSTRAP_BATCH_CELLS = 1_000_000
+
+# Jobs with fewer drawn indices than this run in-process
+PARALLEL_MIN_CELLS = 8_000_000
+
+# Worker processes for large jobs. The default (1) runs everything in-process:
+# a pool costs each server process several workers with their own numpy and
+# scipy, while the default tests finish in-process in under a second
+RESAMPLING_WORKERS = int(os.environ.get("CARBONSEER_RESAMPLING_WORKERS", "1"))
+
+# Default number of label shuffles for the permutation chi-square test
+PERMUTATION_RESAMPLES = 100_000
+
+BOOTSTRAP_STATISTICS = (
+    "pearson_r",
+    "spearman_rho",
+    "r_squared",
+    "eta_squared",
+    "cramers_v",
+)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared process pool, or None if parallelism is disabled."""
+    global _pool
+    if RESAMPLING_WORKERS < 2:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Forking a threaded server process is unsafe; use a clean start
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            _pool = ProcessPoolExecutor(
+                max_workers=RESAMPLING_WORKERS, mp_context=context
+            )
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+# ----- Vectorised statistics: arrays are the data, idx is (batch, n) -----
+
+
+def _row_correlations(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    xs = xs - xs.mean(axis=1, keepdims=True)
+    ys = ys - ys.mean(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = np.einsum("ij,ij->i", xs, ys) / np.sqrt(
+            np.einsum("ij,ij->i", xs, xs) * np.einsum("ij,ij->i", ys, ys)
+        )
+    return np.clip(r, -1.0, 1.0)
+
+
+def _pearson_r(arrays, idx, **_) -> np.ndarray:
+    x, y = arrays
+    return _row_correlations(x[idx], y[idx])
+
+
+def _row_average_ranks(codes: np.ndarray, levels: int) -> np.ndarray:
+    """
+    Average ranks within each row of a (batch, n) matrix of dense value codes.
+
+    A value's rank is the number of smaller values in its row plus the mean
+    position among its ties, so per-row code counts (one bincount) and their
+    cumulative sums give every rank without sorting any row.
+    """
+    batch = len(codes)
+    flat = (np.arange(batch)[:, None] * levels + codes).ravel()
+    counts = np.bincount(flat, minlength=batch * levels).reshape(batch, levels)
+    average = np.cumsum(counts, axis=1) - (counts - 1) / 2.0
+    return np.take_along_axis(average, codes, axis=1)
+
+
+def _spearman_rho(arrays, idx, levels: Tuple[int, int]) -> np.ndarray:
+    x_codes, y_codes = arrays
+    return _row_correlations(
+        _row_average_ranks(x_codes[idx], levels[0]),
+        _row_average_ranks(y_codes[idx], levels[1]),
+    )
+
+
+def _r_squared(arrays, idx, **_) -> np.ndarray:
+    return _pearson_r(arrays, idx) ** 2
+
+
+def _eta_squared(arrays, idx, levels: Tuple[int, ...]) -> np.ndarray:
+    values, codes = arrays
+    batch = len(idx)
+    (k,) = levels
+    vs = values[idx]
+    flat = (np.arange(batch)[:, None] * k + codes[idx]).ravel()
+
+    counts = np.bincount(flat, minlength=batch * k).reshape(batch, k)
+    sums = np.bincount(flat, weights=vs.ravel(), minlength=batch * k).reshape(batch, k)
+    grand = vs.mean(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        group_means = np.where(counts > 0, sums / counts, 0.0)
+        ss_between = (counts * (group_means - grand) ** 2).sum(axis=1)
+        ss_total = ((vs - grand) ** 2).sum(axis=1)
+        return ss_between / ss_total
+
+
+def _contingency_tables(
+    rows: np.ndarray, cols: np.ndarray, levels: Tuple[int, int]
+) -> np.ndarray:
+    """
+    Stack of contingency tables, shape (batch, rows, cols), via one bincount.
+
+    rows and cols are (batch, n) code matrices; either may be (1, n) and is
+    broadcast across the batch.
+    """
+    batch = np.broadcast_shapes(rows.shape, cols.shape)[0]
+    n_rows, n_cols = levels
+    flat = (np.arange(batch)[:, None] * (n_rows * n_cols) + rows * n_cols + cols).ravel()
+    counts = np.bincount(flat, minlength=batch * n_rows * n_cols)
+    return counts.reshape(batch, n_rows, n_cols)
+
+
+def _chi2_statistics(tables: np.ndarray) -> np.ndarray:
+    """Pearson chi-square (no continuity correction) for a stack of tables."""
+    tables = tables.astype(np.float64)
+    total = tables.sum(axis=(1, 2))
+    expected = (
+        tables.sum(axis=2)[:, :, None] * tables.sum(axis=1)[:, None, :]
+    ) / total[:, None, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Empty rows/columns have zero expected counts and contribute nothing
+        cells = np.where(expected > 0, (tables - expected) ** 2 / expected, 0.0)
+    return cells.sum(axis=(1, 2))
+
+
+def _cramers_v(arrays, idx, levels: Tuple[int, int]) -> np.ndarray:
+    rows, cols = arrays
+    tables = _contingency_tables(rows[idx], cols[idx], levels)
+    min_dim = min(levels) - 1
+    if min_dim < 1:
+        return np.zeros(len(idx))
+    return np.sqrt(_chi2_statistics(tables) / (idx.shape[1] * min_dim))
+
+
+_STATISTICS = {
+    "pearson_r": _pearson_r,
+    "spearman_rho": _spearman_rho,
+    "r_squared": _r_squared,
+    "eta_squared": _eta_squared,
+    "cramers_v": _cramers_v,
+}
+
+
+def _batch_plan(
+    draws: int, n: int, seed: int
+) -> List[Tuple[int, np.random.SeedSequence]]:
+    """Split draws into batches of about BOOTSTRAP_BATCH_CELLS cells, each with its own seed."""
+    per_batch = max(1, min(draws, BOOTSTRAP_BATCH_CELLS // max(n, 1)))
+    sizes = [per_batch] * (draws // per_batch)
+    if draws % per_batch:
+        sizes.append(draws % per_batch)
+    return list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+
+
+def run_batches(batch: Callable, jobs: List[tuple], cells: int) -> np.ndarray:
+    """
+    Run batch jobs in the process pool if the job is large, else in-process.
+
+    The pool is used only when RESAMPLING_WORKERS > 1, there is more than one
+    job and cells >= PARALLEL_MIN_CELLS; a broken pool falls back to running
+    in-process. Shared with utils.sensitivity for threshold grids.
+
+    Args:
+        batch: Module-level (picklable) function returning an array
+        jobs: Argument tuples, one call of batch per tuple
+        cells: Total work size, e.g. resamples x rows
+
+    Returns:
+        np.ndarray: The batch results concatenated along axis 0, in job order
+    """
+    pool = _get_pool() if len(jobs) > 1 and cells >= PARALLEL_MIN_CELLS else None
+    if pool is not None:
+        try:
+            return np.concatenate(list(pool.map(batch, *zip(*jobs))))
+        except (BrokenProcessPool, OSError):
+            _reset_pool()
+    return np.concatenate([batch(*job) for job in jobs])
+
+
+def _bootstrap_batch(
+    statistic: str,
+    arrays: Tuple[np.ndarray, ...],
+    params: Dict,
+    resamples: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Evaluate one batch of resamples (runs in a worker process)."""
+    rng = np.random.default_rng(seed)
+    n = len(arrays[0])
+    idx = rng.integers(0, n, size=(resamples, n))
+    return _STATISTICS[statistic](arrays, idx, **params)
+
+
+def _permutation_batch(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    levels: Tuple[int, int],
+    permutations: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Chi-square statistics for one batch of column-label shuffles."""
+    rng = np.random.default_rng(seed)
+    # Each row of the matrix is an independent shuffle of the column labels
+    shuffled = rng.permuted(np.tile(cols, (permutations, 1)), axis=1)
+    return _chi2_statistics(_contingency_tables(rows[None, :], shuffled, levels))
+
+
+def _prepare(
+    df: pd.DataFrame, statistic: str, columns: Sequence[str]
+) -> Tuple[Tuple[np.ndarray, ...], Dict]:
+    """Complete cases of the statistic's columns as NumPy arrays."""
+    clean = df[list(columns)].dropna()
+    if statistic == "spearman_rho":
+        # Dense codes in value order: ranks are computed from code counts
+        x_codes, x_levels = pd.factorize(clean[columns[0]], sort=True)
+        y_codes, y_levels = pd.factorize(clean[columns[1]], sort=True)
+        return (x_codes, y_codes), {"levels": (len(x_levels), len(y_levels))}
+    if statistic in ("pearson_r", "r_squared"):
+        x_col, y_col = columns
+        arrays = (
+            clean[x_col].to_numpy(dtype=np.float64),
+            clean[y_col].to_numpy(dtype=np.float64),
+        )
+        return arrays, {}
+    if statistic == "eta_squared":
+        value_col, group_col = columns
+        codes, groups = pd.factorize(clean[group_col], sort=True)
+        arrays = (clean[value_col].to_numpy(dtype=np.float64), codes)
+        return arrays, {"levels": (len(groups),)}
+    row_col, col_col = columns
+    row_codes, row_levels = pd.factorize(clean[row_col], sort=True)
+    col_codes, col_levels = pd.factorize(clean[col_col], sort=True)
+    return (row_codes, col_codes), {"levels": (len(row_levels), len(col_levels))}
+
+
+def bootstrap_distribution(
+    statistic: str,
+    arrays: Tuple[np.ndarray, ...],
+    params: Dict,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = BOOTSTRAP_SEED,
+) -> np.ndarray:
+    """
+    Draw the bootstrap distribution of a statistic.
+
+    Resamples are split into batches of about BOOTSTRAP_BATCH_CELLS drawn
+    indices, each with its own child of SeedSequence(seed). Batches run in
+    the process pool when the job is large, in-process otherwise (also as a
+    fallback if the pool cannot start); the output is identical either way.
+
+    Args:
+        statistic: One of BOOTSTRAP_STATISTICS
+        arrays: Prepared data arrays (complete cases)
+        params: Statistic parameters, e.g. {"levels": (3,)} for eta_squared
+        resamples: Number of bootstrap resamples (B)
+        seed: Root seed
+
+    Returns:
+        np.ndarray: B bootstrap replicates (NaN where a resample is degenerate)
+    """
+    n = len(arrays[0])
+    jobs = [
+        (statistic, arrays, params, size, batch_seed)
+        for size, batch_seed in _batch_plan(resamples, n, seed)
+    ]
+    return run_batches(_bootstrap_batch, jobs, resamples * n)
+
+
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS, show_spinner=False)
+def bootstrap_ci(
+    df: pd.DataFrame,
+    statistic: str,
+    columns: Tuple[str, str],
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    confidence: float = 0.95,
+    seed: int = BOOTSTRAP_SEED,
+) -> Optional[Dict]:
+    """
+    Percentile bootstrap confidence interval for an effect size.
+
+    Args:
+        df: Input dataframe (rows with a missing value in `columns` are dropped)
+        statistic: One of BOOTSTRAP_STATISTICS
+        columns: Columns the statistic is computed from:
+            - pearson_r, spearman_rho, r_squared: (x_col, y_col), numeric
+            - eta_squared: (value_col, group_col)
+            - cramers_v: (row_col, col_col), categorical
+        resamples: Number of bootstrap resamples (B)
+        confidence: Confidence level of the interval (default: 0.95)
+        seed: Root seed; equal inputs always give equal intervals
+
+    Returns:
+        Dict with keys:
+        - estimate: Statistic on the full sample
+        - ci_lower, ci_upper: Percentile interval bounds
+        - std_error: Standard deviation of the bootstrap replicates
+        - n, resamples, confidence: Sample size and settings used
+        Returns None if fewer than 3 complete rows exist
+
+    Raises:
+        ValueError: If statistic is not one of BOOTSTRAP_STATISTICS
+        KeyError: If a column is not found in dataframe
+
+    Note:
+        Cramér's V uses the uncorrected chi-square statistic, so for 2x2
+        tables it differs from perform_chi_square_test (Yates-corrected).
+
+    Example:
+        >>> ci = bootstrap_ci(panel.year(2020), "pearson_r", (gdp_col, co2_col))
+        >>> print(f"r = {ci['estimate']:.3f} [{ci['ci_lower']:.3f}, {ci['ci_upper']:.3f}]")
+    """
+    if statistic not in _STATISTICS:
+        raise ValueError(f"Unknown bootstrap statistic: {statistic!r}")
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise KeyError(f"Column(s) not found in dataframe: {missing}")
+
+    arrays, params = _prepare(df, statistic, columns)
+    n = len(arrays[0])
+    if n < 3:
+        return None
+
+    identity = np.arange(n)[None, :]
+    estimate = float(_STATISTICS[statistic](arrays, identity, **params)[0])
+    replicates = bootstrap_distribution(statistic, arrays, params, resamples, seed)
+
+    tail = (1.0 - confidence) / 2 * 100
+    lower, upper = np.nanpercentile(replicates, [tail, 100 - tail])
+    return {
+        "estimate": estimate,
+        "ci_lower": float(lower),
+        "ci_upper": float(upper),
+        "std_error": float(np.nanstd(replicates, ddof=1)),
+        "n": int(n),
+        "resamples": int(resamples),
+        "confidence": float(confidence),
+    }
+
+
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS, show_spinner=False)
+def permutation_chi_square(
+    df: pd.DataFrame,
+    row_col: str,
+    col_col: str,
+    permutations: int = PERMUTATION_RESAMPLES,
+    seed: int = BOOTSTRAP_SEED,
+) -> Optional[Dict]:
+    """
+    Monte Carlo permutation test of independence for two categorical columns.
+
+    The column labels are shuffled against the row labels, which keeps both
+    margins fixed, and the Pearson chi-square statistic is recomputed for
+    every shuffle. Unlike the asymptotic chi-square p-value, this stays valid
+    for sparse tables with small expected counts (e.g. GDP category by
+    individual commitment strength). Shuffles are drawn in batches as one
+    matrix of permuted integer codes per batch, and all contingency tables of
+    a batch come from a single np.bincount.
+
+    Args:
+        df: Input dataframe (rows with a missing value in either column are dropped)
+        row_col: First categorical column (e.g. "GDP_Category")
+        col_col: Second categorical column (e.g. "Commitment_Strength")
+        permutations: Number of label shuffles
+        seed: Root seed; equal inputs always give equal p-values
+
+    Returns:
+        Dict with keys:
+        - chi2_statistic: Observed (uncorrected) chi-square statistic
+        - p_value: Monte Carlo p-value, (1 + #{null >= observed}) / (1 + permutations)
+        - p_value_se: Monte Carlo standard error of p_value
+        - cramers_v: Effect size of the observed table
+        - min_expected: Smallest expected cell count of the observed table
+        - n, permutations: Sample size and number of shuffles
+        Returns None if either column has fewer than 2 observed levels
+
+    Raises:
+        KeyError: If a column is not found in dataframe
+
+    Example:
+        >>> perm = permutation_chi_square(x, "GDP_Category", "Commitment_Strength")
+        >>> print(f"χ² = {perm['chi2_statistic']:.2f}, p = {perm['p_value']:.4f}")
+    """
+    missing = [c for c in (row_col, col_col) if c not in df.columns]
+    if missing:
+        raise KeyError(f"Column(s) not found in dataframe: {missing}")
+
+    (rows, cols), params = _prepare(df, "cramers_v", (row_col, col_col))
+    levels = params["levels"]
+    if min(levels) < 2:
+        return None
+
+    n = len(rows)
+    observed_table = _contingency_tables(rows[None, :], cols[None, :], levels)
+    observed = float(_chi2_statistics(observed_table)[0])
+    expected = np.outer(observed_table[0].sum(axis=1), observed_table[0].sum(axis=0)) / n
+
+    jobs = [
+        (rows, cols, levels, size, batch_seed)
+        for size, batch_seed in _batch_plan(permutations, n, seed)
+    ]
+    null = run_batches(_permutation_batch, jobs, permutations * n)
+
+    # Tolerance so shuffles reproducing the observed table count as ties
+    exceed = int(np.count_nonzero(null >= observed - 1e-9 * max(observed, 1.0)))
+    p_value = (exceed + 1) / (permutations + 1)
+    return {
+        "chi2_statistic": observed,
+        "p_value": p_value,
+        "p_value_se": float(np.sqrt(p_value * (1 - p_value) / (permutations + 1))),
+        "cramers_v": float(np.sqrt(observed / (n * (min(levels) - 1)))),
+        "min_expected": float(expected.min()),
+        "n": int(n),
+        "permutations": int(permutations),
+    }
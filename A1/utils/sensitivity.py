@@ -0,0 +1,264 @@
+"""
+GDP threshold sensitivity sweeps for the CarbonSeer hypothesis tests.
+
+create_gdp_categories buckets GDP per capita at fixed thresholds (Low ≤
+$5,000 < Medium ≤ $15,000 < High). The sweeps here recompute the Hypothesis 2
+chi-square and the GDP-category ANOVA for every (low, high) pair on a
+threshold grid without re-bucketing or copying the frame:
+
+- GDP is sorted once, and np.searchsorted turns each threshold into the
+  number of rows at or below it, so a (low, high) pair is two offsets
+- outcome counts (chi-square) and group counts and sums (ANOVA) are
+  accumulated along the sorted order, so every group total for any pair is
+  the difference of two cumulative rows
+- contingency tables and sums of squares for a whole block of pairs are then
+  array operations on those differences, with no Python loop over the grid
+
+Blocks of low thresholds are evaluated with utils.resampling.run_batches, so
+they use the opt-in worker pool when the grid is large enough to amortise it;
+a 100 × 100 grid runs in-process in a few milliseconds. Results are cached
+with @st.cache_data on the frame's utils.fingerprint token, the columns and
+the grid.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from scipy.stats import chi2, f
+
+from .fingerprint import FINGERPRINT_HASH_FUNCS
+from .resampling import run_batches
+
+
+# Thresholds per axis and the GDP quantiles the grid spans
+SENSITIVITY_GRID_SIZE = 100
+SENSITIVITY_QUANTILES = (0.05, 0.95)
+
+# Grid cells (pairs x groups x levels) evaluated per batch; bounds memory
+SWEEP_BATCH_CELLS = 1_000_000
+
+
+def threshold_grid(
+    values,
+    size: int = SENSITIVITY_GRID_SIZE,
+    quantiles: Sequence[float] = SENSITIVITY_QUANTILES,
+) -> np.ndarray:
+    """
+    Log-spaced candidate thresholds between two quantiles of GDP per capita.
+
+    Args:
+        values: GDP per capita values (missing and non-positive values are ignored)
+        size: Number of thresholds
+        quantiles: (lower, upper) quantiles of values the grid spans
+
+    Returns:
+        np.ndarray: Increasing, unique thresholds (empty if no valid values)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values) & (values > 0)]
+    if len(values) == 0:
+        return np.empty(0)
+    lower, upper = np.quantile(values, quantiles)
+    return np.unique(np.geomspace(lower, upper, size))
+
+
+def _cumulative(gdp: np.ndarray, columns: np.ndarray, thresholds) -> tuple:
+    """
+    Prefix sums of columns in GDP order and the offset of every threshold.
+
+    Row k of the prefix sums totals the k poorest observations. Offsets use
+    side="right" to match pd.cut's right-closed bins.
+    """
+    order = np.argsort(gdp, kind="stable")
+    cumulative = np.zeros((len(gdp) + 1, columns.shape[1]))
+    np.cumsum(columns[order], axis=0, out=cumulative[1:])
+    offsets = np.searchsorted(gdp[order], np.asarray(thresholds, dtype=float), "right")
+    return cumulative, offsets
+
+
+def _group_totals(
+    cumulative: np.ndarray, low: np.ndarray, high: np.ndarray
+) -> np.ndarray:
+    """Low / Medium / High totals for every (low, high) offset pair: (l, h, 3, m)."""
+    below_low = cumulative[low][:, None, :]
+    below_high = cumulative[high][None, :, :]
+    return np.stack(
+        np.broadcast_arrays(
+            below_low, below_high - below_low, cumulative[-1] - below_high
+        ),
+        axis=2,
+    )
+
+
+def _chi_square_block(
+    cumulative: np.ndarray, low: np.ndarray, high: np.ndarray
+) -> np.ndarray:
+    """Chi-square statistic, non-empty groups and smallest expected count."""
+    tables = _group_totals(cumulative, low, high)
+    totals = cumulative[-1]
+    rows = tables.sum(axis=3, keepdims=True)
+    expected = rows * totals / totals.sum()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cells = np.where(expected > 0, (tables - expected) ** 2 / expected, 0.0)
+    occupied = rows > 0
+    return np.stack(
+        [
+            cells.sum(axis=(2, 3)),
+            occupied.sum(axis=(2, 3)),
+            np.where(occupied, expected, np.inf).min(axis=(2, 3)),
+        ],
+        axis=-1,
+    )
+
+
+def _anova_block(
+    cumulative: np.ndarray, low: np.ndarray, high: np.ndarray
+) -> np.ndarray:
+    """Between-group sum of squares, non-empty groups and smallest group size."""
+    groups = _group_totals(cumulative, low, high)
+    count, total = groups[..., 0], groups[..., 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = np.where(count > 0, total**2 / count, 0.0).sum(axis=2)
+    between -= cumulative[-1, 1] ** 2 / cumulative[-1, 0]
+    occupied = count > 0
+    return np.stack(
+        [
+            between,
+            occupied.sum(axis=2),
+            np.where(occupied, count, np.inf).min(axis=2),
+        ],
+        axis=-1,
+    )
+
+
+def _sweep(block, cumulative: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Evaluate a block function over all (low, high) offset pairs in batches."""
+    pair_cells = len(offsets) * 3 * cumulative.shape[1]
+    rows_per_batch = max(1, SWEEP_BATCH_CELLS // pair_cells)
+    jobs = [
+        (cumulative, offsets[start : start + rows_per_batch], offsets)
+        for start in range(0, len(offsets), rows_per_batch)
+    ]
+    return run_batches(block, jobs, len(offsets) * pair_cells)
+
+
+def _valid_pairs(thresholds: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Pairs with low < high and at least two non-empty GDP categories."""
+    return (thresholds[:, None] < thresholds[None, :]) & (groups >= 2)
+
+
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS, show_spinner=False)
+def chi_square_threshold_sweep(
+    df: pd.DataFrame, gdp_col: str, outcome_col: str, thresholds: Sequence[float]
+) -> Optional[Dict]:
+    """
+    Chi-square test of GDP category vs an outcome for every threshold pair.
+
+    Cell [i, j] of each grid uses Low ≤ thresholds[i] < Medium ≤
+    thresholds[j] < High, exactly as create_gdp_categories would bucket the
+    rows, with the uncorrected Pearson statistic. Empty categories are
+    dropped from the table (lowering the degrees of freedom); pairs with
+    low ≥ high or fewer than two non-empty categories are NaN.
+
+    Args:
+        df: Frame with GDP per capita and the categorical outcome
+        gdp_col: GDP per capita column
+        outcome_col: Outcome column (e.g. Legal or Commitment_Strength)
+        thresholds: Increasing candidate thresholds (see threshold_grid)
+
+    Returns:
+        Dict with keys thresholds, chi2_statistic, p_value, cramers_v,
+        min_expected (each grid len(thresholds) x len(thresholds)) and n,
+        or None if the outcome has fewer than two levels
+
+    Example:
+        >>> grid = threshold_grid(x[gdp_col])
+        >>> sweep = chi_square_threshold_sweep(x, gdp_col, "Legal", tuple(grid))
+        >>> significant = np.nanmean(sweep["p_value"] < 0.05)
+    """
+    data = df[[gdp_col, outcome_col]].dropna()
+    codes, levels = pd.factorize(data[outcome_col])
+    if len(levels) < 2:
+        return None
+
+    thresholds = np.asarray(thresholds, dtype=float)
+    indicators = np.eye(len(levels))[codes]
+    cumulative, offsets = _cumulative(
+        data[gdp_col].to_numpy(dtype=float), indicators, thresholds
+    )
+    stats = _sweep(_chi_square_block, cumulative, offsets)
+    statistic, groups, min_expected = stats[..., 0], stats[..., 1], stats[..., 2]
+
+    valid = _valid_pairs(thresholds, groups)
+    n = len(data)
+    dof = np.where(valid, groups - 1, 1) * (len(levels) - 1)
+    min_dim = np.minimum(groups - 1, len(levels) - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cramers_v = np.sqrt(statistic / (n * min_dim))
+
+    return {
+        "thresholds": thresholds,
+        "chi2_statistic": np.where(valid, statistic, np.nan),
+        "p_value": np.where(valid, chi2.sf(statistic, dof), np.nan),
+        "cramers_v": np.where(valid, cramers_v, np.nan),
+        "min_expected": np.where(valid, min_expected, np.nan),
+        "n": n,
+    }
+
+
+@st.cache_data(hash_funcs=FINGERPRINT_HASH_FUNCS, show_spinner=False)
+def anova_threshold_sweep(
+    df: pd.DataFrame, gdp_col: str, value_col: str, thresholds: Sequence[float]
+) -> Optional[Dict]:
+    """
+    One-way ANOVA of a value across GDP categories for every threshold pair.
+
+    Values are centred on their mean before accumulating, so the prefix
+    sums and the between-group sum of squares stay well conditioned. Grids
+    follow the same layout and NaN rules as chi_square_threshold_sweep.
+
+    Args:
+        df: Frame with GDP per capita and the numeric value
+        gdp_col: GDP per capita column
+        value_col: Value compared across categories (e.g. CO₂ per capita)
+        thresholds: Increasing candidate thresholds (see threshold_grid)
+
+    Returns:
+        Dict with keys thresholds, f_statistic, p_value, eta_squared,
+        min_group_size (each grid len(thresholds) x len(thresholds)) and n,
+        or None if there are fewer than three observations or no variance
+    """
+    data = df[[gdp_col, value_col]].dropna()
+    values = data[value_col].to_numpy(dtype=float)
+    values = values - values.mean() if len(values) else values
+    total_ss = float(np.dot(values, values))
+    n = len(values)
+    if n < 3 or total_ss <= 0:
+        return None
+
+    thresholds = np.asarray(thresholds, dtype=float)
+    moments = np.column_stack([np.ones(n), values])
+    cumulative, offsets = _cumulative(
+        data[gdp_col].to_numpy(dtype=float), moments, thresholds
+    )
+    stats = _sweep(_anova_block, cumulative, offsets)
+    between, groups, min_group = stats[..., 0], stats[..., 1], stats[..., 2]
+
+    valid = _valid_pairs(thresholds, groups) & (groups < n)
+    df_between = np.where(valid, groups - 1, 1)
+    df_within = np.where(valid, n - groups, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_statistic = (between / df_between) / ((total_ss - between) / df_within)
+
+    return {
+        "thresholds": thresholds,
+        "f_statistic": np.where(valid, f_statistic, np.nan),
+        "p_value": np.where(valid, f.sf(f_statistic, df_between, df_within), np.nan),
+        "eta_squared": np.where(valid, between / total_ss, np.nan),
+        "min_group_size": np.where(valid, min_group, np.nan),
+        "n": n,
+    }
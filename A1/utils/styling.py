@@ -1191,6 +1191,10 @@ def get_custom_css(mode: str = "light"):
     return base_css
 
 
+# Bump whenever get_plotly_theme() changes so cached figures are rebuilt
+PLOTLY_THEME_VERSION = 1
+
+
 def get_plotly_theme():
     """
     Return award-winning Plotly theme configuration matching the design system.
@@ -1341,80 +1345,115 @@ def render_page_lockup(
         return
 
 
-def sanitize_df_for_display(df):
-    """Return a copy of df with column types coerced to Arrow-friendly types.
+# infer_dtype kinds and the conversion they get without probing
+_SANITIZE_KIND_ACTIONS = {
+    "integer": "numeric",
+    "floating": "numeric",
+    "mixed-integer-float": "numeric",
+    "decimal": "numeric",
+    "datetime": "datetime",
+    "datetime64": "datetime",
+    "date": "datetime",
+    "boolean": "keep",
+    "empty": "keep",
+}
 
-    Strategy:
-    - For object dtype columns: try to convert to numeric (int/float)
-    - If numeric conversion fails, try to parse datetimes
-    - If that fails, convert values to plain strings; if values are lists/dicts, JSON-serialize
-    - Preserve NaNs and None
+# Kinds whose values may still parse as numbers or dates
+_SANITIZE_PROBED_KINDS = ("string", "mixed", "mixed-integer")
 
-    This function intentionally does not modify the original DataFrame.
-    """
+
+def _sanitize_probe(series):
+    """Decide how to convert an object column of strings / mixed values."""
+    import pandas as pd
+    import numpy as np
+
+    present = series.notna().sum()
+
+    coerced_num = pd.to_numeric(series, errors="coerce")
+    coerced_num = coerced_num.replace([np.inf, -np.inf], np.nan)
+    if coerced_num.notna().sum() > 0 and coerced_num.isna().sum() < present:
+        return "numeric"
+
+    coerced_dt = pd.to_datetime(series, errors="coerce", format="mixed")
+    if coerced_dt.notna().sum() > 0 and coerced_dt.isna().sum() < present:
+        return "datetime"
+
+    return "keep" if pd.api.types.infer_dtype(series) == "string" else "serialize"
+
+
+def _sanitize_column(series, action):
+    """Apply a conversion plan action to one column."""
     import pandas as pd
     import numpy as np
     import json
 
-    df_copy = df.copy()
-
-    for col in df_copy.columns:
-        if pd.api.types.is_object_dtype(df_copy[col].dtype):
-            series = df_copy[col]
-
-            # 1) Try numeric - convert inf to NaN explicitly
-            coerced_num = pd.to_numeric(series, errors="coerce")
-            # Replace inf values with NaN as recommended by pandas
-            coerced_num = coerced_num.replace([np.inf, -np.inf], np.nan)
-            if (
-                coerced_num.notna().sum() > 0
-                and coerced_num.isna().sum() < series.notna().sum()
-            ):
-                # Use numeric where possible, keep original NAs
-                df_copy[col] = coerced_num
-                continue
-
-            # 2) Try datetime
-            coerced_dt = pd.to_datetime(series, errors="coerce", format="mixed")
-            if (
-                coerced_dt.notna().sum() > 0
-                and coerced_dt.isna().sum() < series.notna().sum()
-            ):
-                df_copy[col] = coerced_dt
-                continue
-
-            # 3) Fallback: stringify, but ensure JSON for lists/dicts
-            def _safe_serialize(x):
-                if pd.isna(x):
-                    return None
-                if isinstance(x, (list, dict)):
-                    try:
-                        return json.dumps(x, ensure_ascii=False)
-                    except Exception:
-                        return str(x)
-                try:
-                    return str(x)
-                except Exception:
-                    return json.dumps(x, default=str, ensure_ascii=False)
-
-            df_copy[col] = series.apply(_safe_serialize).astype(object)
-
-    # For completeness, replace Python objects like numpy types with native Python types
-    for col in df_copy.columns:
-        if pd.api.types.is_integer_dtype(
-            df_copy[col].dtype
-        ) or pd.api.types.is_float_dtype(df_copy[col].dtype):
-            # ensure numpy types cast to native
-            df_copy[col] = df_copy[col].apply(
-                lambda x: None
-                if pd.isna(x)
-                else (
-                    int(x)
-                    if pd.api.types.is_integer_dtype(df_copy[col].dtype)
-                    else float(x)
-                )
-            )
+    if action == "numeric":
+        coerced = pd.to_numeric(series, errors="coerce")
+        return coerced.replace([np.inf, -np.inf], np.nan)
+    if action == "datetime":
+        return pd.to_datetime(series, errors="coerce", format="mixed")
+
+    # "serialize": only genuinely mixed columns reach this per-element path
+    def _safe_serialize(x):
+        if isinstance(x, (list, dict)):
+            try:
+                return json.dumps(x, ensure_ascii=False)
+            except Exception:
+                return str(x)
+        try:
+            return str(x)
+        except Exception:
+            return json.dumps(x, default=str, ensure_ascii=False)
+
+    missing = series.isna()
+    out = series.astype(object).copy()
+    out[~missing] = [_safe_serialize(x) for x in series[~missing]]
+    out[missing] = None
+    return out
+
+
+def sanitize_df_for_display(df):
+    """Return df with column types coerced to Arrow-friendly types.
+
+    Strategy:
+    - Numeric, boolean, datetime, categorical and string-dtype columns are
+      already Arrow-safe and are passed through untouched
+    - Object columns are classified with pd.api.types.infer_dtype; numeric and
+      datetime values are converted in one vectorised call
+    - Object columns of strings or mixed values are probed (numeric, then
+      datetime, else kept / stringified) on every call, since the right
+      conversion depends on the values, not the column name
+    - Lists/dicts are JSON-serialised; NaNs and None are preserved
+
+    The original DataFrame is never modified; if no column needs converting
+    it is returned as-is instead of being copied.
+    """
+    import pandas as pd
 
+    converted = {}
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        if not pd.api.types.is_object_dtype(series.dtype):
+            continue
+
+        kind = pd.api.types.infer_dtype(series, skipna=True)
+        action = _SANITIZE_KIND_ACTIONS.get(kind)
+        if action is None:
+            if kind not in _SANITIZE_PROBED_KINDS:
+                action = "serialize"
+            else:
+                action = _sanitize_probe(series)
+
+        if action != "keep":
+            converted[position] = _sanitize_column(series, action)
+
+    if not converted:
+        return df
+
+    # Shallow copy: unconverted columns share memory with the input
+    df_copy = df.copy(deep=False)
+    for position, values in converted.items():
+        df_copy.isetitem(position, values)
     return df_copy
 
 